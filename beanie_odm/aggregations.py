@@ -0,0 +1,70 @@
+from benchmarks import pipelines
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.beanie_models import (
+    BasketSizeProjection,
+    DashboardFacetProjection,
+    MonthlyOrdersProjection,
+    OrderDoc,
+    SkuQuantityProjection,
+    StatusRevenueProjection,
+)
+
+
+@benchmark(
+    name='agg_revenue_by_status',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Revenue and order count by status over one year ($match + $group)',
+    family=Family.AGGREGATION,
+)
+async def agg_revenue_by_status(ctx):
+    await OrderDoc.aggregate(pipelines.revenue_by_status(), projection_model=StatusRevenueProjection).to_list()
+
+
+@benchmark(
+    name='agg_top_skus',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Top 10 SKUs by quantity over one year ($unwind line_items + $group)',
+    family=Family.AGGREGATION,
+)
+async def agg_top_skus(ctx):
+    await OrderDoc.aggregate(pipelines.top_skus(), projection_model=SkuQuantityProjection).to_list()
+
+
+@benchmark(
+    name='agg_monthly_orders',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Monthly order counts over one year ($group by $year/$month)',
+    family=Family.AGGREGATION,
+)
+async def agg_monthly_orders(ctx):
+    await OrderDoc.aggregate(pipelines.monthly_orders(), projection_model=MonthlyOrdersProjection).to_list()
+
+
+@benchmark(
+    name='agg_basket_by_payment',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Average basket size by payment method over one year ($group + $avg)',
+    family=Family.AGGREGATION,
+)
+async def agg_basket_by_payment(ctx):
+    await OrderDoc.aggregate(pipelines.basket_by_payment(), projection_model=BasketSizeProjection).to_list()
+
+
+@benchmark(
+    name='agg_dashboard_facet',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Order counts by status and by payment method in one pass ($facet)',
+    family=Family.AGGREGATION,
+)
+async def agg_dashboard_facet(ctx):
+    await OrderDoc.aggregate(pipelines.dashboard_facet(), projection_model=DashboardFacetProjection).to_list()
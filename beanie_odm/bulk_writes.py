@@ -0,0 +1,143 @@
+from datetime import datetime
+
+from beanie import BulkWriter
+from beanie.operators import In, Set
+
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.beanie_models import OrderDoc
+
+
+async def _load(keys: list[str]) -> list[OrderDoc]:
+    return await OrderDoc.find(In(OrderDoc.order_number, keys)).to_list()
+
+
+async def _save_loop(keys: list[str]):
+    now = datetime.now()
+    for doc in await _load(keys):
+        doc.updated_at = now
+        await doc.save()
+
+
+async def _save_bulk(keys: list[str], ordered: bool):
+    now = datetime.now()
+    docs = await _load(keys)
+    async with BulkWriter(ordered=ordered) as bulk_writer:
+        for doc in docs:
+            doc.updated_at = now
+            await doc.save(bulk_writer=bulk_writer)
+
+
+async def _update_many(keys: list[str]):
+    await OrderDoc.find(In(OrderDoc.order_number, keys)).update(Set({OrderDoc.updated_at: datetime.now()}))
+
+
+@benchmark(
+    name='update_1000_loop',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 1,000 Orders by order_number, then save() each',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+async def update_1000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    await _save_loop(keys)
+
+
+@benchmark(
+    name='update_1000_bulk_ordered',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 1,000 Orders by order_number, then save() each through an ordered BulkWriter',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+async def update_1000_bulk_ordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    await _save_bulk(keys, ordered=True)
+
+
+@benchmark(
+    name='update_1000_bulk_unordered',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 1,000 Orders by order_number, then save() each through an unordered BulkWriter',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+async def update_1000_bulk_unordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    await _save_bulk(keys, ordered=False)
+
+
+@benchmark(
+    name='update_1000_many',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 1,000 Orders, find(In(...)).update(Set(...))',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+async def update_1000_many(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    await _update_many(keys)
+
+
+@benchmark(
+    name='update_10000_loop',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 10,000 Orders by order_number, then save() each',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+async def update_10000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    await _save_loop(keys)
+
+
+@benchmark(
+    name='update_10000_bulk_ordered',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 10,000 Orders by order_number, then save() each through an ordered BulkWriter',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+async def update_10000_bulk_ordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    await _save_bulk(keys, ordered=True)
+
+
+@benchmark(
+    name='update_10000_bulk_unordered',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 10,000 Orders by order_number, then save() each through an unordered BulkWriter',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+async def update_10000_bulk_unordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    await _save_bulk(keys, ordered=False)
+
+
+@benchmark(
+    name='update_10000_many',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 10,000 Orders, find(In(...)).update(Set(...))',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+async def update_10000_many(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    await _update_many(keys)
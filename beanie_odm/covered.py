@@ -0,0 +1,41 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.beanie_models import (
+    CategoryDoc,
+    CategoryNameCoveredProjection,
+    OrderDoc,
+    OrderEmailCoveredProjection,
+)
+
+
+@benchmark(
+    name='covered_category_name',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description="Select only 'name' from one Category by slug, answered from the (slug, name) index",
+    family=Family.COVERED,
+)
+async def covered_category_name(ctx):
+    slug = ctx['targets']['category_slug']
+    await CategoryDoc.find_one(
+        CategoryDoc.slug == slug,
+        projection_model=CategoryNameCoveredProjection,
+        hint='slug_1_name_1',
+    )
+
+
+@benchmark(
+    name='covered_order_email',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description="Select only 'customer_email' from one Order, answered from the (order_number, customer_email) index",
+    family=Family.COVERED,
+)
+async def covered_order_email(ctx):
+    order_number = ctx['targets']['order_number']
+    await OrderDoc.find_one(
+        OrderDoc.order_number == order_number,
+        projection_model=OrderEmailCoveredProjection,
+        hint='order_number_1_customer_email_1',
+    )
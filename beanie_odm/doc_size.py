@@ -0,0 +1,58 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.beanie_models import LargeOrderDoc
+
+
+@benchmark(
+    name='read_order_1kb',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~1 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 1_000},
+)
+async def read_order_1kb(ctx):
+    order_number = ctx['targets']['large_order_1kb']
+    await LargeOrderDoc.find_one(LargeOrderDoc.order_number == order_number)
+
+
+@benchmark(
+    name='read_order_10kb',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~10 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 10_000},
+)
+async def read_order_10kb(ctx):
+    order_number = ctx['targets']['large_order_10kb']
+    await LargeOrderDoc.find_one(LargeOrderDoc.order_number == order_number)
+
+
+@benchmark(
+    name='read_order_100kb',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~100 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 100_000},
+)
+async def read_order_100kb(ctx):
+    order_number = ctx['targets']['large_order_100kb']
+    await LargeOrderDoc.find_one(LargeOrderDoc.order_number == order_number)
+
+
+@benchmark(
+    name='read_order_1mb',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~1 MB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 1_000_000},
+)
+async def read_order_1mb(ctx):
+    order_number = ctx['targets']['large_order_1mb']
+    await LargeOrderDoc.find_one(LargeOrderDoc.order_number == order_number)
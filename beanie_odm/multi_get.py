@@ -0,0 +1,96 @@
+from beanie.operators import In
+
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.beanie_models import OrderDoc
+
+
+async def _loop(keys: list[str]) -> list[OrderDoc | None]:
+    return [await OrderDoc.find_one(OrderDoc.order_number == key) for key in keys]
+
+
+async def _batched(keys: list[str]) -> list[OrderDoc]:
+    return await OrderDoc.find(In(OrderDoc.order_number, keys)).to_list()
+
+
+@benchmark(
+    name='multi_get_10_loop',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders by order_number, one find_one per key',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'loop'},
+)
+async def multi_get_10_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    await _loop(keys)
+
+
+@benchmark(
+    name='multi_get_10_batched',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders by order_number with the In operator',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'batched'},
+)
+async def multi_get_10_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    await _batched(keys)
+
+
+@benchmark(
+    name='multi_get_100_loop',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders by order_number, one find_one per key',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'loop'},
+)
+async def multi_get_100_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    await _loop(keys)
+
+
+@benchmark(
+    name='multi_get_100_batched',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders by order_number with the In operator',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'batched'},
+)
+async def multi_get_100_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    await _batched(keys)
+
+
+@benchmark(
+    name='multi_get_1000_loop',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders by order_number, one find_one per key',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'loop'},
+)
+async def multi_get_1000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    await _loop(keys)
+
+
+@benchmark(
+    name='multi_get_1000_batched',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders by order_number with the In operator',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'batched'},
+)
+async def multi_get_1000_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    await _batched(keys)
@@ -0,0 +1,134 @@
+from beanie import SortDirection
+from beanie.operators import And, Or
+
+from benchmarks.registry import Family, Library, OpType, benchmark
+from config import PAGE_SIZE
+from models.beanie_models import CategoryDoc
+
+
+def _sort() -> tuple:
+    # Expression fields only exist once init_beanie has run, so this can't be a module constant
+    return (
+        (CategoryDoc.view_count, SortDirection.DESCENDING),
+        (CategoryDoc.id, SortDirection.DESCENDING),
+    )
+
+
+async def _skip_page(page: int) -> list[CategoryDoc]:
+    return await CategoryDoc.find().sort(*_sort()).skip((page - 1) * PAGE_SIZE).limit(PAGE_SIZE).to_list()
+
+
+async def _keyset_page(after: dict | None) -> list[CategoryDoc]:
+    query = CategoryDoc.find()
+    if after:
+        query = CategoryDoc.find(
+            Or(
+                CategoryDoc.view_count < after['view_count'],
+                And(CategoryDoc.view_count == after['view_count'], CategoryDoc.id < after['_id']),
+            )
+        )
+    return await query.sort(*_sort()).limit(PAGE_SIZE).to_list()
+
+
+@benchmark(
+    name='page_skip_1',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 1, 'strategy': 'skip'},
+)
+async def page_skip_1(ctx):
+    await _skip_page(1)
+
+
+@benchmark(
+    name='page_skip_10',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 10 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 10, 'strategy': 'skip'},
+)
+async def page_skip_10(ctx):
+    await _skip_page(10)
+
+
+@benchmark(
+    name='page_skip_100',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 100 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 100, 'strategy': 'skip'},
+)
+async def page_skip_100(ctx):
+    await _skip_page(100)
+
+
+@benchmark(
+    name='page_skip_1000',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1,000 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 1000, 'strategy': 'skip'},
+)
+async def page_skip_1000(ctx):
+    await _skip_page(1000)
+
+
+@benchmark(
+    name='page_keyset_1',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 1, 'strategy': 'keyset'},
+)
+async def page_keyset_1(ctx):
+    await _keyset_page(ctx['targets']['page_cursors'][1])
+
+
+@benchmark(
+    name='page_keyset_10',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 10 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 10, 'strategy': 'keyset'},
+)
+async def page_keyset_10(ctx):
+    await _keyset_page(ctx['targets']['page_cursors'][10])
+
+
+@benchmark(
+    name='page_keyset_100',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 100 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 100, 'strategy': 'keyset'},
+)
+async def page_keyset_100(ctx):
+    await _keyset_page(ctx['targets']['page_cursors'][100])
+
+
+@benchmark(
+    name='page_keyset_1000',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1,000 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 1000, 'strategy': 'keyset'},
+)
+async def page_keyset_1000(ctx):
+    await _keyset_page(ctx['targets']['page_cursors'][1000])
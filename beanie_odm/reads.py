@@ -1,6 +1,6 @@
 from beanie import SortDirection
 
-from benchmarks.registry import Library, OpType, benchmark
+from benchmarks.registry import Family, Library, OpType, benchmark
 from models.beanie_models import (
     CategoryDoc,
     CategoryNameProjection,
@@ -130,3 +130,16 @@ async def read_1000_categories(ctx):
 )
 async def read_10000_categories(ctx):
     await CategoryDoc.find().sort((CategoryDoc.view_count, SortDirection.DESCENDING)).limit(10000).to_list()
+
+
+@benchmark(
+    name='read_latest_order',
+    library=Library.BEANIE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one of the most recently created Orders, by rank in created_at order',
+    family=Family.SCENARIO,
+)
+async def read_latest_order(ctx):
+    rank = ctx['targets']['recent_rank']
+    await OrderDoc.find().sort((OrderDoc.created_at, SortDirection.DESCENDING)).skip(rank).first_or_none()
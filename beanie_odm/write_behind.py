@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from beanie import Document, PydanticObjectId
+from pymongo.errors import BulkWriteError
+
+from config import WRITE_BEHIND_MAX_BATCH, WRITE_BEHIND_MAX_DELAY_S
+from raw.write_behind import map_write_errors
+
+
+class AsyncWriteBehindBuffer:
+    """The asyncio counterpart of `raw.write_behind.WriteBehindBuffer`, flushing through `Document.insert_many`.
+
+    Must be created and used on the event loop that runs the inserts; the flusher task starts with the first insert.
+    """
+
+    def __init__(
+        self,
+        document_model: type[Document],
+        max_batch: int = WRITE_BEHIND_MAX_BATCH,
+        max_delay: float = WRITE_BEHIND_MAX_DELAY_S,
+    ):
+        self.document_model = document_model
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self._pending: list[tuple[Document, asyncio.Future]] = []
+        self._oldest = 0.0
+        self._closed = False
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def insert_one(self, doc: Document) -> asyncio.Future:
+        if self._closed:
+            raise RuntimeError('AsyncWriteBehindBuffer is closed')
+        # insert_many doesn't write ids back onto the documents, so assign them here
+        if doc.id is None:
+            doc.id = PydanticObjectId()
+        future = asyncio.get_running_loop().create_future()
+        if not self._pending:
+            self._oldest = time.monotonic()
+        self._pending.append((doc, future))
+        if len(self._pending) in (1, self.max_batch):
+            self._wakeup.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def flush(self):
+        """Write everything buffered so far and wait for it."""
+        while self._pending:
+            await self._write(self._take())
+
+    async def close(self):
+        self._closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _run(self):
+        while self._pending or not self._closed:
+            if not self._pending:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            remaining = self._oldest + self.max_delay - time.monotonic()
+            if len(self._pending) < self.max_batch and remaining > 0 and not self._closed:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+            await self._write(self._take())
+
+    def _take(self) -> list[tuple[Document, asyncio.Future]]:
+        batch, self._pending = self._pending[: self.max_batch], self._pending[self.max_batch :]
+        self._oldest = time.monotonic()
+        return batch
+
+    async def _write(self, batch: list[tuple[Document, asyncio.Future]]):
+        self.batches += 1
+        try:
+            await self.document_model.insert_many([doc for doc, _ in batch], ordered=False)
+        except BulkWriteError as e:
+            errors = map_write_errors(e)
+            for i, (doc, future) in enumerate(batch):
+                if i in errors:
+                    future.set_exception(errors[i])
+                else:
+                    future.set_result(doc.id)
+            return
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for doc, future in batch:
+            future.set_result(doc.id)
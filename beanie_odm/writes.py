@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from benchmarks.registry import Library, OpType, benchmark
+from benchmarks.registry import Family, Library, OpType, benchmark
 from models.beanie_models import (
     Address,
     CategoryDoc,
@@ -56,6 +56,20 @@ async def insert_single(ctx):
     await doc.insert()
 
 
+@benchmark(
+    name='insert_single_order',
+    library=Library.BEANIE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Insert one new Order document, created now',
+    family=Family.SCENARIO,
+)
+async def insert_single_order(ctx):
+    doc = _make_order_doc()
+    doc.created_at = doc.updated_at = datetime.now()
+    await doc.insert()
+
+
 @benchmark(
     name='insert_batch_100',
     library=Library.BEANIE,
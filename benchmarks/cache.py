@@ -0,0 +1,79 @@
+import math
+import os
+from enum import Enum
+
+from pymongo.errors import OperationFailure
+from rich.console import Console
+
+from config import COLD_BALLAST_DOC_BYTES, COLD_BALLAST_FACTOR, COLD_CACHE_SIZE_MB
+
+console = Console()
+
+BALLAST_COLLECTION = 'cache_ballast'
+_MB = 1024 * 1024
+
+
+class CacheMode(str, Enum):
+    WARM = 'warm'  # The working set stays in the WiredTiger cache between iterations, as right after seeding
+    COLD = 'cold'  # A ballast scan before every iteration pushes the working set out of the cache
+
+
+class CacheEvictor:
+    """Shrinks the WiredTiger cache for the run and evicts the working set on demand by scanning a ballast collection.
+
+    The cache is restored to its original size on exit. Evicted pages are usually still in the OS page cache, so a
+    cold read costs a WiredTiger miss and decompression rather than a disk seek.
+    """
+
+    def __init__(self, db, cache_mb: int = COLD_CACHE_SIZE_MB):
+        self.db = db
+        self.cache_bytes = cache_mb * _MB
+        self._original_bytes = None
+
+    def __enter__(self):
+        cache = self.db.client.admin.command('serverStatus').get('wiredTiger', {}).get('cache')
+        if not cache:
+            raise RuntimeError('Cold-cache mode needs a mongod running the WiredTiger storage engine')
+        configured = cache['maximum bytes configured']
+        if configured > self.cache_bytes:
+            self._resize(self.cache_bytes)
+            self._original_bytes = configured
+        else:
+            # Already started with a small --wiredTigerCacheSizeGB; the ballast only has to cover that
+            self.cache_bytes = configured
+        self._ensure_ballast()
+        return self
+
+    def __exit__(self, *exc):
+        if self._original_bytes:
+            self._resize(self._original_bytes)
+
+    def evict(self):
+        # A collection scan pulls every ballast page through the cache; projecting _id keeps the reply small
+        for _ in self.db[BALLAST_COLLECTION].find({}, {'_id': 1}, batch_size=10_000):
+            pass
+
+    def _resize(self, size_bytes: int):
+        try:
+            self.db.client.admin.command(
+                {'setParameter': 1, 'wiredTigerEngineRuntimeConfig': f'cache_size={size_bytes}'}
+            )
+        except OperationFailure as e:
+            raise RuntimeError(
+                f'Could not resize the WiredTiger cache ({e}); start mongod with '
+                f'--wiredTigerCacheSizeGB {COLD_CACHE_SIZE_MB / 1024:g} instead'
+            ) from e
+
+    def _ensure_ballast(self):
+        count = math.ceil(self.cache_bytes * COLD_BALLAST_FACTOR / COLD_BALLAST_DOC_BYTES)
+        collection = self.db[BALLAST_COLLECTION]
+        if collection.estimated_document_count() >= count:
+            return
+        console.print(f'[bold]Seeding {count:,} ballast documents ({count * COLD_BALLAST_DOC_BYTES / _MB:,.0f} MB)...')
+        collection.drop()
+        # Random bytes so the ballast doesn't compress away on disk
+        batch = max(1, 16 * _MB // COLD_BALLAST_DOC_BYTES)
+        for start in range(0, count, batch):
+            collection.insert_many(
+                [{'pad': os.urandom(COLD_BALLAST_DOC_BYTES)} for _ in range(min(batch, count - start))]
+            )
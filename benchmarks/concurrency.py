@@ -0,0 +1,128 @@
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass, field
+
+from rich.console import Console
+
+from benchmarks.monitoring import PoolRecorder
+from benchmarks.registry import BenchmarkInfo, Family, Library, OpType, get_benchmarks
+from benchmarks.runner import build_context, init_beanie_models, iteration_ctx, load_benchmarks
+from benchmarks.stats import percentile
+from config import CONCURRENCY_LEVELS, CONCURRENCY_STEP_DURATION, DB_NAME, KEY_POOL_SEED, LOOP_LAG_INTERVAL_S
+from seeding.distributions import Distribution
+
+console = Console()
+
+
+@dataclass
+class ConcurrencyLevel:
+    """One level of concurrent tasks. Loop lag is how late the probe's timer fired, a proxy for starved callbacks."""
+
+    concurrency: int
+    ops: int
+    errors: int
+    ops_per_sec: float
+    median_ms: float
+    p99_ms: float
+    lag_median_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+    peak_open: int
+    peak_checked_out: int
+
+
+@dataclass
+class ConcurrencyResult:
+    benchmark: BenchmarkInfo
+    max_pool_size: int
+    levels: list[ConcurrencyLevel] = field(default_factory=list)
+
+
+def run_concurrency_sweep(
+    levels: tuple[int, ...] = CONCURRENCY_LEVELS,
+    families: list[Family] | None = None,
+    names: list[str] | None = None,
+    duration: float = CONCURRENCY_STEP_DURATION,
+    key_distribution: Distribution = Distribution.UNIFORM,
+    db_name: str = DB_NAME,
+) -> list[ConcurrencyResult]:
+    """Run each Beanie read benchmark from 1 to many concurrent tasks on one event loop."""
+    load_benchmarks()
+    bms = get_benchmarks(library=Library.BEANIE, op_type=OpType.READ, families=families or [Family.CORE])
+    if names:
+        bms = [b for b in bms if b.name in names]
+    if not bms:
+        raise ValueError('No Beanie read benchmarks match the selection')
+
+    ctx = build_context(db_name, key_distribution=key_distribution, families={b.family for b in bms})
+    return asyncio.run(_sweep(bms, ctx, sorted(levels), duration))
+
+
+async def _sweep(bms: list[BenchmarkInfo], ctx: dict, levels: list[int], duration: float) -> list[ConcurrencyResult]:
+    pool = PoolRecorder()
+    client = await init_beanie_models(ctx['db_name'], event_listeners=[pool])
+    max_pool_size = client.delegate.options.pool_options.max_pool_size
+
+    results = []
+    for bm in bms:
+        result = ConcurrencyResult(benchmark=bm, max_pool_size=max_pool_size)
+        for concurrency in levels:
+            console.print(f'[bold cyan]beanie: {bm.name} with {concurrency} tasks ({duration:g}s)...')
+            result.levels.append(await _run_level(bm, ctx, concurrency, duration, pool))
+        results.append(result)
+
+    client.close()
+    return results
+
+
+async def _run_level(bm: BenchmarkInfo, ctx: dict, concurrency: int, duration: float, pool: PoolRecorder):
+    ctx['key_pool'].reset()
+    pool.reset()
+    latencies, lags = [], []
+    errors = 0
+    loop = asyncio.get_running_loop()
+
+    async def probe():
+        while True:
+            expected = loop.time() + LOOP_LAG_INTERVAL_S
+            await asyncio.sleep(LOOP_LAG_INTERVAL_S)
+            lags.append(max(0.0, loop.time() - expected))
+
+    async def worker(worker_id: int, deadline: float):
+        nonlocal errors
+        worker_ctx = {**ctx, 'key_pool': ctx['key_pool'].fork(KEY_POOL_SEED + worker_id)}
+        while time.perf_counter() < deadline:
+            iter_ctx = iteration_ctx(worker_ctx)
+            start = time.perf_counter()
+            try:
+                await bm.func(iter_ctx)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    prober = asyncio.create_task(probe())
+    start = time.perf_counter()
+    deadline = start + duration
+    async with asyncio.TaskGroup() as tg:
+        for i in range(concurrency):
+            tg.create_task(worker(i, deadline))
+    elapsed = time.perf_counter() - start
+    prober.cancel()
+
+    sorted_ms = sorted(t * 1000 for t in latencies)
+    lag_ms = sorted(t * 1000 for t in lags)
+    return ConcurrencyLevel(
+        concurrency=concurrency,
+        ops=len(sorted_ms),
+        errors=errors,
+        ops_per_sec=len(sorted_ms) / elapsed if elapsed > 0 else 0.0,
+        median_ms=statistics.median(sorted_ms) if sorted_ms else 0.0,
+        p99_ms=percentile(sorted_ms, 99) if sorted_ms else 0.0,
+        lag_median_ms=statistics.median(lag_ms) if lag_ms else 0.0,
+        lag_p99_ms=percentile(lag_ms, 99) if lag_ms else 0.0,
+        lag_max_ms=lag_ms[-1] if lag_ms else 0.0,
+        peak_open=pool.peak_open,
+        peak_checked_out=pool.peak_checked_out,
+    )
@@ -0,0 +1,221 @@
+import asyncio
+import multiprocessing
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+from rich.console import Console
+
+from benchmarks.key_pool import KeyPool
+from benchmarks.registry import Library, get_benchmarks
+from benchmarks.runner import (
+    BenchmarkResult,
+    _compute_stats,
+    build_context,
+    cleanup_benchmark_docs,
+    init_beanie_models,
+    iteration_ctx,
+    load_benchmarks,
+)
+from config import (
+    DB_NAME,
+    DISTRIBUTED_DURATION,
+    DISTRIBUTED_START_TIMEOUT,
+    DISTRIBUTED_WORKERS,
+    KEY_POOL_SEED,
+    SCENARIO_SEED,
+)
+from db import connect_mongoengine, disconnect_mongoengine, get_pymongo_db
+from seeding.distributions import Distribution
+
+console = Console()
+
+
+@dataclass
+class WorkerSpec:
+    """Everything a worker process needs; it's pickled, so it carries the targets and keys, not a client."""
+
+    worker_id: int
+    library: Library
+    mix: dict[str, float]
+    duration: float
+    db_name: str
+    targets: dict
+    keys: dict[str, list]
+    key_distribution: Distribution
+
+
+@dataclass
+class WorkerReport:
+    worker_id: int
+    timings: dict[str, list[float]]
+    errors: int
+    elapsed: float
+
+
+def run_distributed(
+    mix: dict[str, float],
+    workers: int = DISTRIBUTED_WORKERS,
+    library: Library | None = None,
+    duration: float = DISTRIBUTED_DURATION,
+    key_distribution: Distribution = Distribution.UNIFORM,
+    db_name: str = DB_NAME,
+) -> list[BenchmarkResult]:
+    """Run a benchmark (a one-entry mix) or a scenario mix on `workers` processes, merged per library and benchmark.
+
+    Each worker opens its own client and runs one closed loop; all of them start together at a barrier.
+    """
+    load_benchmarks()
+    registered = defaultdict(dict)
+    for bm in get_benchmarks(library=library):
+        registered[bm.library][bm.name] = bm
+    unknown = [name for name in mix if not any(name in by_name for by_name in registered.values())]
+    if unknown:
+        raise ValueError(f'Unknown benchmark(s): {", ".join(unknown)}')
+
+    # Targets are chosen once, so every worker and library queries the same keys
+    families = {by_name[name].family for by_name in registered.values() for name in mix if name in by_name}
+    ctx = build_context(db_name, key_distribution=key_distribution, families=families)
+    spawn = multiprocessing.get_context('spawn')
+
+    results = []
+    for lib in [library] if library else list(Library):
+        missing = [name for name in mix if name not in registered[lib]]
+        if missing:
+            console.print(f'[yellow]{lib.value} has no {", ".join(missing)}; skipping it.')
+            continue
+        console.print(f'[bold cyan]{lib.value}: {workers} worker processes ({duration:g}s)...')
+        reports = _run_workers(spawn, workers, lib, mix, duration, ctx)
+        cleanup_benchmark_docs(ctx['db'])
+        results.extend(_merge(reports, [registered[lib][name] for name in mix]))
+
+    return results
+
+
+def _run_workers(spawn, workers: int, library: Library, mix: dict, duration: float, ctx: dict) -> list[WorkerReport]:
+    # The coordinator waits at the barrier too, so it knows when every worker has finished setting up
+    barrier = spawn.Barrier(workers + 1)
+    queue = spawn.Queue()
+    processes = []
+    for i in range(workers):
+        spec = WorkerSpec(
+            worker_id=i,
+            library=library,
+            mix=mix,
+            duration=duration,
+            db_name=ctx['db_name'],
+            targets=ctx['targets'],
+            keys=ctx['key_pool'].keys,
+            key_distribution=ctx['key_pool'].distribution,
+        )
+        process = spawn.Process(target=_worker_main, args=(spec, barrier, queue), daemon=True)
+        process.start()
+        processes.append(process)
+
+    try:
+        barrier.wait(timeout=DISTRIBUTED_START_TIMEOUT)
+    except threading.BrokenBarrierError:
+        # A worker failed during setup and broke the barrier; every worker reports why it stopped
+        reports = [queue.get(timeout=DISTRIBUTED_START_TIMEOUT) for _ in processes]
+        raise RuntimeError('Workers failed to start:\n' + '\n'.join(r for r in reports if isinstance(r, str)))
+    reports = [queue.get(timeout=duration + DISTRIBUTED_START_TIMEOUT) for _ in processes]
+    for process in processes:
+        process.join()
+
+    failed = [r for r in reports if isinstance(r, str)]
+    if failed:
+        raise RuntimeError(f'{len(failed)} worker(s) failed:\n' + '\n'.join(failed))
+    errors = sum(r.errors for r in reports)
+    if errors:
+        console.print(f'[yellow]{library.value}: {errors:,} operations failed across workers.')
+    return reports
+
+
+def _merge(reports: list[WorkerReport], bms: list) -> list[BenchmarkResult]:
+    # Throughput is over the slowest worker's wall time, since they all started at once
+    elapsed = max(r.elapsed for r in reports)
+    results = []
+    for bm in bms:
+        timings = [t for r in reports for t in r.timings.get(bm.name, [])]
+        if not timings:
+            continue
+        result = _compute_stats(bm, timings)
+        result.ops_per_sec = len(timings) / elapsed if elapsed > 0 else 0.0
+        results.append(result)
+    return results
+
+
+def _worker_main(spec: WorkerSpec, barrier, queue):
+    try:
+        load_benchmarks()
+        registered = {b.name: b for b in get_benchmarks(library=spec.library)}
+        ops = [registered[name] for name in spec.mix]
+        ctx = {
+            'db': get_pymongo_db(spec.db_name),
+            'db_name': spec.db_name,
+            'targets': spec.targets,
+            'key_pool': KeyPool(spec.keys, spec.key_distribution, seed=KEY_POOL_SEED + spec.worker_id),
+            'client_options': {},
+        }
+        if spec.library == Library.BEANIE:
+            report = asyncio.run(_run_async(spec, ops, ctx, barrier))
+        else:
+            if spec.library == Library.MONGOENGINE:
+                connect_mongoengine(spec.db_name)
+            report = _run_sync(spec, ops, ctx, barrier)
+            if spec.library == Library.MONGOENGINE:
+                disconnect_mongoengine()
+    except Exception as e:
+        barrier.abort()
+        queue.put(f'worker {spec.worker_id}: {type(e).__name__}: {e}')
+        return
+    queue.put(report)
+
+
+def _run_sync(spec: WorkerSpec, ops: list, ctx: dict, barrier) -> WorkerReport:
+    rng = random.Random(SCENARIO_SEED + spec.worker_id)
+    weights = list(spec.mix.values())
+    timings = defaultdict(list)
+    errors = 0
+    barrier.wait()
+    start = time.perf_counter()
+    deadline = start + spec.duration
+    while time.perf_counter() < deadline:
+        bm = rng.choices(ops, weights)[0]
+        iter_ctx = iteration_ctx(ctx)
+        op_start = time.perf_counter()
+        try:
+            bm.func(iter_ctx)
+        except Exception:
+            errors += 1
+            continue
+        timings[bm.name].append(time.perf_counter() - op_start)
+    return WorkerReport(spec.worker_id, dict(timings), errors, time.perf_counter() - start)
+
+
+async def _run_async(spec: WorkerSpec, ops: list, ctx: dict, barrier) -> WorkerReport:
+    client = await init_beanie_models(spec.db_name)
+    rng = random.Random(SCENARIO_SEED + spec.worker_id)
+    weights = list(spec.mix.values())
+    timings = defaultdict(list)
+    errors = 0
+    # Blocking here is fine: nothing else runs on this loop until the start
+    barrier.wait()
+    start = time.perf_counter()
+    deadline = start + spec.duration
+    while time.perf_counter() < deadline:
+        bm = rng.choices(ops, weights)[0]
+        iter_ctx = iteration_ctx(ctx)
+        op_start = time.perf_counter()
+        try:
+            await bm.func(iter_ctx)
+        except Exception:
+            errors += 1
+            continue
+        timings[bm.name].append(time.perf_counter() - op_start)
+    elapsed = time.perf_counter() - start
+
+    client.close()
+    return WorkerReport(spec.worker_id, dict(timings), errors, elapsed)
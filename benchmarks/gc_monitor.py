@@ -0,0 +1,82 @@
+import gc
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+
+
+class GCMode(str, Enum):
+    DEFAULT = 'default'
+    DISABLED = 'disabled'  # gc.disable() for the timed iterations: no collections at all
+    FROZEN = 'frozen'  # gc.freeze() first: everything already alive is out of the collector's reach
+
+
+@dataclass
+class GCStats:
+    """Collections and pause time over a benchmark's timed iterations, via `gc.callbacks`."""
+
+    mode: GCMode
+    collections: tuple[int, int, int]  # per generation
+    pause_seconds: float
+
+    @property
+    def total_collections(self) -> int:
+        return sum(self.collections)
+
+
+class GCRecorder:
+    def __init__(self):
+        self._counts = [0, 0, 0]
+        self._pause = 0.0
+        self._started: float | None = None
+        self._paused = False
+
+    def __enter__(self):
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self._callback)
+
+    @contextmanager
+    def paused(self):
+        """Leave out collections that start in here, e.g. ones the cold-cache eviction triggers."""
+        self._paused = True
+        try:
+            yield
+        finally:
+            self._paused = False
+
+    def _callback(self, phase: str, info: dict):
+        if phase == 'start':
+            self._started = None if self._paused else time.perf_counter()
+        elif self._started is not None:
+            self._pause += time.perf_counter() - self._started
+            self._counts[info['generation']] += 1
+            self._started = None
+
+    def stats(self, mode: GCMode) -> GCStats:
+        gen0, gen1, gen2 = self._counts
+        return GCStats(mode=mode, collections=(gen0, gen1, gen2), pause_seconds=self._pause)
+
+
+@contextmanager
+def apply_gc_mode(mode: GCMode):
+    if mode == GCMode.DISABLED:
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            yield
+        finally:
+            if was_enabled:
+                gc.enable()
+    elif mode == GCMode.FROZEN:
+        # Collect first so garbage isn't frozen along with the live heap
+        gc.collect()
+        gc.freeze()
+        try:
+            yield
+        finally:
+            gc.unfreeze()
+    else:
+        yield
@@ -0,0 +1,182 @@
+import asyncio
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from rich.console import Console
+
+from beanie_odm.write_behind import AsyncWriteBehindBuffer
+from benchmarks.registry import Library
+from benchmarks.runner import init_beanie_models
+from benchmarks.stats import percentile
+from config import DB_NAME, INGEST_CONCURRENCY, INGEST_DURATION
+from db import get_pymongo_db
+from models.beanie_models import Address, LineItem, OrderDoc, Payment, StatusEntry
+from raw.write_behind import WriteBehindBuffer
+from seeding.generator import DataGenerator
+
+console = Console()
+
+MODES = ('direct', 'write_behind')
+INGEST_LIBRARIES = (Library.RAW, Library.DATACLASSES_RAW, Library.BEANIE)
+EVENT_PREFIX = 'INGEST-'
+
+_gen = DataGenerator(seed=99)
+
+
+@dataclass
+class IngestResult:
+    """Sustained single-event inserts. Latency runs from submit to acknowledgement, so it includes buffering."""
+
+    library: Library
+    mode: str
+    elapsed_s: float
+    events: int
+    errors: int
+    events_per_sec: float
+    median_ms: float
+    p99_ms: float
+    mean_batch: float | None  # events per insert_many; None for direct inserts
+
+
+def run_ingest(
+    library: Library | None = None,
+    duration: float = INGEST_DURATION,
+    concurrency: int = INGEST_CONCURRENCY,
+    db_name: str = DB_NAME,
+) -> list[IngestResult]:
+    """Insert single order events for a fixed time, one insert_one each and then through a write-behind buffer."""
+    if library and library not in INGEST_LIBRARIES:
+        raise ValueError(f'No write-behind path for {library.value}')
+    libraries = [library] if library else list(INGEST_LIBRARIES)
+    db = get_pymongo_db(db_name)
+
+    results = []
+    for lib in libraries:
+        for mode in MODES:
+            console.print(f'[bold cyan]ingest: {lib.value} {mode} ({concurrency} producers, {duration:g}s)...')
+            if lib == Library.BEANIE:
+                run = asyncio.run(_run_async(mode, duration, concurrency, db_name))
+            else:
+                run = _run_threads(db, mode, duration, concurrency)
+            db.orders.delete_many({'order_number': {'$regex': f'^{EVENT_PREFIX}'}})
+            results.append(_ingest_result(lib, mode, *run))
+
+    return results
+
+
+def _make_event() -> dict:
+    doc = _gen.make_one_order(index=0)
+    doc['order_number'] = f'{EVENT_PREFIX}{uuid.uuid4().hex}'
+    doc['_benchmark'] = True
+    return doc
+
+
+def _make_event_doc() -> OrderDoc:
+    raw = _make_event()
+    return OrderDoc(
+        order_number=raw['order_number'],
+        customer_email=raw['customer_email'],
+        status=raw['status'],
+        total_cents=raw['total_cents'],
+        item_count=raw['item_count'],
+        created_at=raw['created_at'],
+        updated_at=raw['updated_at'],
+        shipping_address=Address(**raw['shipping_address']),
+        payment=Payment(**raw['payment']),
+        line_items=[LineItem(**li) for li in raw['line_items']],
+        status_history=[StatusEntry(**sh) for sh in raw['status_history']],
+    )
+
+
+def _run_threads(db, mode: str, duration: float, concurrency: int):
+    # Raw and Raw+DC write the same dicts here, as their insert benchmarks do
+    buffer = WriteBehindBuffer(db.orders) if mode == 'write_behind' else None
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def producer(deadline: float):
+        nonlocal errors
+        local, local_errors = [], 0
+        while time.perf_counter() < deadline:
+            event = _make_event()
+            start = time.perf_counter()
+            try:
+                if buffer:
+                    buffer.insert_one(event).result()
+                else:
+                    db.orders.insert_one(event)
+            except Exception:
+                local_errors += 1
+                continue
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    start = time.perf_counter()
+    deadline = start + duration
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(producer, deadline) for _ in range(concurrency)]
+        for f in futures:
+            f.result()
+    elapsed = time.perf_counter() - start
+    if buffer:
+        buffer.close()
+    return latencies, errors, elapsed, buffer.batches if buffer else None
+
+
+async def _run_async(mode: str, duration: float, concurrency: int, db_name: str):
+    client = await init_beanie_models(db_name)
+    buffer = AsyncWriteBehindBuffer(OrderDoc) if mode == 'write_behind' else None
+    latencies, errors = [], 0
+
+    async def producer(deadline: float):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            event = _make_event_doc()
+            start = time.perf_counter()
+            try:
+                if buffer:
+                    await buffer.insert_one(event)
+                else:
+                    await event.insert()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(producer(deadline) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    if buffer:
+        await buffer.close()
+
+    client.close()
+    return latencies, errors, elapsed, buffer.batches if buffer else None
+
+
+def _ingest_result(
+    library: Library,
+    mode: str,
+    latencies: list[float],
+    errors: int,
+    elapsed: float,
+    batches: int | None,
+) -> IngestResult:
+    sorted_ms = sorted(t * 1000 for t in latencies)
+    return IngestResult(
+        library=library,
+        mode=mode,
+        elapsed_s=elapsed,
+        events=len(sorted_ms),
+        errors=errors,
+        events_per_sec=len(sorted_ms) / elapsed if elapsed > 0 else 0.0,
+        median_ms=statistics.median(sorted_ms) if sorted_ms else 0.0,
+        p99_ms=percentile(sorted_ms, 99) if sorted_ms else 0.0,
+        mean_batch=(len(sorted_ms) + errors) / batches if batches else None,
+    )
@@ -0,0 +1,35 @@
+import random
+
+from config import KEY_POOL_SEED
+from seeding.distributions import Distribution, make_sampler
+
+
+class KeyPool:
+    """Preselected lookup keys, drawn one per iteration with a chosen popularity skew.
+
+    Every benchmark calls `reset()` first, so each library sees the same key sequence.
+    """
+
+    def __init__(
+        self,
+        keys: dict[str, list],
+        distribution: Distribution = Distribution.UNIFORM,
+        seed: int = KEY_POOL_SEED,
+    ):
+        self.keys = keys
+        self.distribution = distribution
+        self.seed = seed
+        self.reset()
+
+    def fork(self, seed: int) -> 'KeyPool':
+        # Same keys and skew with an independent sequence, for concurrent workers
+        return KeyPool(self.keys, self.distribution, seed=seed)
+
+    def reset(self):
+        self._rng = random.Random(self.seed)
+        self._samplers = {
+            name: make_sampler(self.distribution, len(values), rng=self._rng) for name, values in self.keys.items()
+        }
+
+    def draw(self) -> dict:
+        return {name: self.keys[name][sampler.sample()] for name, sampler in self._samplers.items()}
@@ -0,0 +1,66 @@
+import importlib.util
+
+from rich.console import Console
+
+from benchmarks.registry import Family, Library, OpType
+from benchmarks.runner import BenchmarkResult, run_benchmarks
+from config import DB_NAME, ZLIB_LEVELS
+
+console = Console()
+
+# Benchmarks whose payloads are big enough for compression to matter
+COMPRESSION_SUITE = [
+    'read_100_orders',
+    'read_1000_orders',
+    'read_10000_orders',
+    'read_100_categories',
+    'read_1000_categories',
+    'read_10000_categories',
+    'insert_batch_100',
+    'insert_batch_1000',
+]
+
+
+def run_matrix(
+    cells: dict[str, dict],
+    library: Library | None = None,
+    op_type: OpType | None = None,
+    families: list[Family] | None = None,
+    db_name: str = DB_NAME,
+    **run_options,
+) -> dict[str, list[BenchmarkResult]]:
+    """Run the same benchmark selection once per cell, each cell with its own client options.
+
+    The options reach every library through its client: pymongo and Raw+DC via `MongoClient`, Beanie via the
+    motor client its collections are bound to, and MongoEngine via `connect()`.
+    """
+    results = {}
+    for cell, client_options in cells.items():
+        options = ', '.join(f'{k}={v!r}' for k, v in client_options.items()) or 'defaults'
+        console.print(f'\n[bold underline]{cell} ({options})\n')
+        results[cell] = run_benchmarks(
+            library=library,
+            op_type=op_type,
+            families=families,
+            db_name=db_name,
+            client_options=client_options,
+            skip_failures=True,
+            **run_options,
+        )
+    return results
+
+
+def compression_cells(zlib_levels: tuple[int, ...] = ZLIB_LEVELS) -> dict[str, dict]:
+    """Uncompressed baseline, zlib at each level, plus snappy and zstd when their packages are installed."""
+    cells = {'none': {}}
+    for level in zlib_levels:
+        cells[f'zlib-{level}'] = {'compressors': 'zlib', 'zlibCompressionLevel': level}
+    if importlib.util.find_spec('snappy'):
+        cells['snappy'] = {'compressors': 'snappy'}
+    else:
+        console.print('[yellow]python-snappy not installed; skipping snappy.')
+    if importlib.util.find_spec('zstandard'):
+        cells['zstd'] = {'compressors': 'zstd'}
+    else:
+        console.print('[yellow]zstandard not installed; skipping zstd.')
+    return cells
@@ -0,0 +1,351 @@
+import threading
+import zlib
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import bson
+from pymongo import monitoring
+
+from benchmarks.registry import Family
+
+EXPLAINED_COMMANDS = ('find', 'aggregate')
+
+# Collections whose $collStats latency counters are snapshotted around each benchmark
+SERVER_STATS_COLLECTIONS = ('categories', 'orders', 'orders_large')
+_OPCOUNTERS = ('query', 'getmore', 'command', 'insert', 'update', 'delete')
+
+# Session and routing fields the driver adds; explain rejects or ignores them
+_DRIVER_FIELDS = ('lsid', '$db', '$clusterTime', '$readPreference', 'txnNumber', 'readConcern', 'writeConcern')
+
+
+@dataclass
+class Capture:
+    commands: list[tuple[str, dict]] = field(default_factory=list)  # (database, command) as sent
+    replies: list[dict] = field(default_factory=list)
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """Collects the commands a client sends, and the replies, while `capture()` is active."""
+
+    def __init__(self):
+        self._capture = Capture()
+        self._recording = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def capture(self):
+        with self._lock:
+            self._capture = Capture()
+        self._recording = True
+        try:
+            yield self._capture
+        finally:
+            self._recording = False
+
+    def started(self, event):
+        if self._recording:
+            with self._lock:
+                self._capture.commands.append((event.database_name, event.command))
+
+    def succeeded(self, event):
+        if self._recording:
+            with self._lock:
+                self._capture.replies.append(event.reply)
+
+    def failed(self, event):
+        pass
+
+
+class PoolRecorder(monitoring.ConnectionPoolListener):
+    """Tracks open and checked-out connections, with the peaks since the last `reset()`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.checked_out = 0
+        self.peak_open = 0
+        self.peak_checked_out = 0
+
+    def reset(self):
+        with self._lock:
+            self.peak_open = self.open
+            self.peak_checked_out = self.checked_out
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+            self.peak_open = max(self.peak_open, self.open)
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open -= 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+    def connection_check_out_failed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+
+@dataclass
+class WireStats:
+    """Per-call traffic: BSON payload sizes, and their size after the client's compressor."""
+
+    round_trips: int
+    bytes_sent: int
+    bytes_received: int
+    wire_bytes_sent: int
+    wire_bytes_received: int
+    documents: int = 0  # Returned in cursor batches, or written (the reply's `n`)
+    commands: dict[str, int] = field(default_factory=dict)  # Round trips by command name
+
+    @property
+    def getmores(self) -> int:
+        return self.commands.get('getMore', 0)
+
+
+@dataclass
+class PlanInfo:
+    command: str
+    collection: str
+    plan: str
+    keys_examined: int
+    docs_examined: int
+    n_returned: int
+
+    @property
+    def collscan(self) -> bool:
+        return 'COLLSCAN' in self.plan
+
+    @property
+    def covered(self) -> bool:
+        # Answered from the index alone: an index scan and no documents fetched
+        return 'IXSCAN' in self.plan and self.docs_examined == 0
+
+
+@dataclass
+class ServerStats:
+    """Server-side work between two snapshots, net of the snapshots' own cost, over `calls` benchmark calls."""
+
+    calls: int
+    opcounters: dict[str, int]
+    requests: int
+    bytes_in: int
+    bytes_out: int
+    cache_bytes_read: int
+    read_ops: int
+    read_latency_us: int
+    write_ops: int
+    write_latency_us: int
+
+    def per_call(self, value: int) -> float:
+        return value / self.calls if self.calls else 0.0
+
+    @property
+    def server_ops(self) -> int:
+        return sum(self.opcounters.values())
+
+
+def server_snapshot(db) -> dict:
+    """The cumulative serverStatus and per-collection $collStats counters the deltas are taken from."""
+    status = db.client.admin.command('serverStatus')
+    cache = status.get('wiredTiger', {}).get('cache', {})
+    snapshot = {
+        **{f'op_{name}': status['opcounters'][name] for name in _OPCOUNTERS},
+        'requests': status['network']['numRequests'],
+        'bytes_in': status['network']['bytesIn'],
+        'bytes_out': status['network']['bytesOut'],
+        # In-memory and other storage engines have no WiredTiger section
+        'cache_bytes_read': cache.get('bytes read into cache', 0),
+        'read_ops': 0,
+        'read_latency_us': 0,
+        'write_ops': 0,
+        'write_latency_us': 0,
+    }
+    for name in SERVER_STATS_COLLECTIONS:
+        stats = next(db[name].aggregate([{'$collStats': {'latencyStats': {}}}]), None)
+        if not stats:
+            continue
+        latency = stats['latencyStats']
+        snapshot['read_ops'] += latency['reads']['ops']
+        snapshot['read_latency_us'] += latency['reads']['latency']
+        snapshot['write_ops'] += latency['writes']['ops']
+        snapshot['write_latency_us'] += latency['writes']['latency']
+    return snapshot
+
+
+def snapshot_overhead(db) -> dict:
+    """What two back-to-back snapshots cost the counters, so it can be taken off every benchmark's delta."""
+    before = server_snapshot(db)
+    after = server_snapshot(db)
+    return {k: after[k] - before[k] for k in before}
+
+
+def server_delta(before: dict, after: dict, overhead: dict, calls: int, excluded: dict | None = None) -> ServerStats:
+    """Counters moved between two snapshots, less snapshot overhead and any `excluded` work inside the window."""
+    excluded = excluded or {}
+    delta = {k: max(0, after[k] - before[k] - overhead.get(k, 0) - excluded.get(k, 0)) for k in before}
+    return ServerStats(
+        calls=calls,
+        opcounters={name: delta[f'op_{name}'] for name in _OPCOUNTERS},
+        requests=delta['requests'],
+        bytes_in=delta['bytes_in'],
+        bytes_out=delta['bytes_out'],
+        cache_bytes_read=delta['cache_bytes_read'],
+        read_ops=delta['read_ops'],
+        read_latency_us=delta['read_latency_us'],
+        write_ops=delta['write_ops'],
+        write_latency_us=delta['write_latency_us'],
+    )
+
+
+def explain_commands(client, commands: list[tuple[str, dict]]) -> list[PlanInfo]:
+    plans = []
+    for db_name, sent in commands:
+        name = next(iter(sent))
+        if name not in EXPLAINED_COMMANDS:
+            continue
+        if name == 'aggregate' and any('$out' in s or '$merge' in s for s in sent.get('pipeline', [])):
+            continue
+        command = {k: v for k, v in sent.items() if k not in _DRIVER_FIELDS}
+        explain = client[db_name].command({'explain': command, 'verbosity': 'executionStats'})
+        planner, stats = _planner_and_stats(explain)
+        plans.append(
+            PlanInfo(
+                command=name,
+                collection=command[name],
+                plan=_plan_summary(planner.get('winningPlan', {})) if planner else 'n/a',
+                keys_examined=stats.get('totalKeysExamined', 0),
+                docs_examined=stats.get('totalDocsExamined', 0),
+                n_returned=stats.get('nReturned', 0),
+            )
+        )
+    return plans
+
+
+def wire_stats(capture: Capture, client_options: dict) -> WireStats:
+    # Monitoring sees decoded documents, so wire size is the BSON re-encoded and run through the same compressor
+    compress = _compressor(client_options)
+    sent = [bson.encode(command) for _, command in capture.commands]
+    received = [bson.encode(reply) for reply in capture.replies]
+    return WireStats(
+        round_trips=len(capture.commands),
+        bytes_sent=sum(len(b) for b in sent),
+        bytes_received=sum(len(b) for b in received),
+        wire_bytes_sent=sum(len(compress(b)) for b in sent) if compress else sum(len(b) for b in sent),
+        wire_bytes_received=sum(len(compress(b)) for b in received) if compress else sum(len(b) for b in received),
+        documents=sum(_reply_documents(reply) for reply in capture.replies),
+        commands=dict(Counter(next(iter(command)) for _, command in capture.commands)),
+    )
+
+
+def cursor_documents(reply: dict) -> list[dict]:
+    cursor = reply.get('cursor') or {}
+    return cursor.get('firstBatch', cursor.get('nextBatch', []))
+
+
+def _reply_documents(reply: dict) -> int:
+    if 'cursor' in reply:
+        return len(cursor_documents(reply))
+    # insert, update and delete report how many documents they touched
+    return reply.get('n', 0)
+
+
+def _compressor(client_options: dict):
+    name = client_options.get('compressors')
+    if isinstance(name, (list, tuple)):
+        name = name[0] if name else None
+    if not name:
+        return None
+    if name == 'zlib':
+        level = client_options.get('zlibCompressionLevel', -1)
+        return lambda data: zlib.compress(data, level)
+    if name == 'snappy':
+        import snappy
+
+        return snappy.compress
+    if name == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress
+    raise ValueError(f'Unknown compressor: {name}')
+
+
+def plan_warnings(results) -> list[str]:
+    """COLLSCANs, covered-family queries that still fetch, and benchmarks whose libraries got different plans."""
+    warnings = []
+    by_name = defaultdict(dict)
+    for r in results:
+        if not r.plans:
+            continue
+        by_name[r.benchmark.name][r.benchmark.library.value] = r.plans
+        for p in r.plans:
+            if p.collscan:
+                warnings.append(f'{r.benchmark.library.value}: {r.benchmark.name} runs a COLLSCAN on {p.collection}')
+            elif r.benchmark.family == Family.COVERED and not p.covered:
+                warnings.append(
+                    f'{r.benchmark.library.value}: {r.benchmark.name} is not covered '
+                    f'({p.plan}, {p.docs_examined:,} docs examined)'
+                )
+
+    for name, by_lib in sorted(by_name.items()):
+        shapes = {lib: tuple(p.plan for p in plans) for lib, plans in by_lib.items()}
+        if len(set(shapes.values())) > 1:
+            detail = '; '.join(f'{lib}: {" | ".join(shape) or "no query"}' for lib, shape in shapes.items())
+            warnings.append(f'{name} plans differ between libraries ({detail})')
+    return warnings
+
+
+def _planner_and_stats(explain: dict) -> tuple[dict, dict]:
+    if 'queryPlanner' in explain:
+        return explain['queryPlanner'], explain.get('executionStats', {})
+    # Aggregations that aren't pushed down entirely report the query under the first stage's $cursor
+    for stage in explain.get('stages', []):
+        if '$cursor' in stage:
+            cursor = stage['$cursor']
+            return cursor.get('queryPlanner', {}), cursor.get('executionStats', {})
+    return {}, {}
+
+
+def _plan_summary(plan: dict) -> str:
+    # Slot-based engine plans nest the classic-style tree under 'queryPlan'
+    plan = plan.get('queryPlan', plan)
+    stages = []
+    while plan:
+        stage = plan.get('stage', '?')
+        if 'indexName' in plan:
+            stage = f'{stage}({plan["indexName"]})'
+        stages.append(stage)
+        if 'inputStage' in plan:
+            plan = plan['inputStage']
+        elif plan.get('inputStages'):
+            stages.append('[' + ', '.join(_plan_summary(p) for p in plan['inputStages']) + ']')
+            break
+        else:
+            break
+    return ' > '.join(stages)
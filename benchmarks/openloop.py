@@ -0,0 +1,200 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from rich.console import Console
+
+from benchmarks.registry import BenchmarkInfo, Library, get_benchmarks
+from benchmarks.runner import build_context, cleanup_benchmark_docs, init_beanie_models, iteration_ctx, load_benchmarks
+from benchmarks.stats import percentile
+from config import (
+    DB_NAME,
+    OPENLOOP_DRAIN_S,
+    OPENLOOP_KNEE_LATENCY_FACTOR,
+    OPENLOOP_MAX_INFLIGHT,
+    OPENLOOP_MAX_STEPS,
+    OPENLOOP_RATE_FACTOR,
+    OPENLOOP_START_RATE,
+    OPENLOOP_STEP_DURATION,
+)
+from db import connect_mongoengine, disconnect_mongoengine
+from seeding.distributions import Distribution
+
+console = Console()
+
+
+@dataclass
+class RateStep:
+    """One fixed arrival rate. Latency runs from the *intended* start, so queueing behind slow ops counts."""
+
+    target_rate: float
+    achieved_rate: float
+    completed: int
+    dropped: int
+    errors: int
+    median_ms: float
+    p99_ms: float
+    service_p99_ms: float
+
+
+@dataclass
+class OpenLoopResult:
+    benchmark: BenchmarkInfo
+    steps: list[RateStep] = field(default_factory=list)
+    knee_rate: float | None = None
+
+
+def run_openloop(
+    benchmark_name: str = 'read_full_record_order',
+    library: Library | None = None,
+    start_rate: float = OPENLOOP_START_RATE,
+    rate_factor: float = OPENLOOP_RATE_FACTOR,
+    step_duration: float = OPENLOOP_STEP_DURATION,
+    max_steps: int = OPENLOOP_MAX_STEPS,
+    max_inflight: int = OPENLOOP_MAX_INFLIGHT,
+    key_distribution: Distribution = Distribution.UNIFORM,
+    db_name: str = DB_NAME,
+) -> list[OpenLoopResult]:
+    """Ramp a constant arrival rate for one benchmark per library until it stops keeping up."""
+    load_benchmarks()
+    bms = [b for b in get_benchmarks(library=library) if b.name == benchmark_name]
+    if not bms:
+        raise ValueError(f"No benchmark named '{benchmark_name}'")
+
+    ctx = build_context(db_name, key_distribution=key_distribution, families={b.family for b in bms})
+    results = []
+    for bm in bms:
+        result = OpenLoopResult(benchmark=bm)
+        if bm.library == Library.MONGOENGINE:
+            connect_mongoengine(db_name)
+
+        rate = start_rate
+        for _ in range(max_steps):
+            console.print(f'[bold cyan]{bm.library.value}: {bm.name} at {rate:,.0f} ops/s...')
+            ctx['key_pool'].reset()
+            if bm.is_async:
+                step = asyncio.run(_run_async_step(bm, ctx, rate, step_duration, max_inflight))
+            else:
+                step = _run_sync_step(bm, ctx, rate, step_duration, max_inflight)
+            result.steps.append(step)
+            if _is_saturated(step, result.steps[0]):
+                result.knee_rate = step.target_rate
+                break
+            rate *= rate_factor
+
+        if bm.library == Library.MONGOENGINE:
+            disconnect_mongoengine()
+        cleanup_benchmark_docs(ctx['db'])
+        results.append(result)
+
+    return results
+
+
+def _is_saturated(step: RateStep, baseline: RateStep) -> bool:
+    # Saturated once the library falls behind the schedule or its tail blows up relative to the lightest load
+    if step.dropped or step.achieved_rate < step.target_rate * 0.9:
+        return True
+    return baseline.p99_ms > 0 and step.p99_ms > baseline.p99_ms * OPENLOOP_KNEE_LATENCY_FACTOR
+
+
+def _run_sync_step(bm: BenchmarkInfo, ctx: dict, rate: float, duration: float, max_inflight: int) -> RateStep:
+    latencies, service, errors = [], [], 0
+    lock = threading.Lock()
+
+    def op(iter_ctx: dict, intended: float):
+        nonlocal errors
+        started = time.perf_counter()
+        try:
+            bm.func(iter_ctx)
+        except Exception:
+            with lock:
+                errors += 1
+            return
+        done = time.perf_counter()
+        with lock:
+            latencies.append(done - intended)
+            service.append(done - started)
+
+    total = int(rate * duration)
+    futures = []
+    with ThreadPoolExecutor(max_workers=max_inflight) as pool:
+        start = time.perf_counter()
+        for i in range(total):
+            intended = start + i / rate
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            # Overdue sends go out immediately rather than shifting the schedule
+            futures.append(pool.submit(op, iteration_ctx(ctx), intended))
+        # Anything still queued after the drain window is a request the library never got to
+        wait(futures, timeout=OPENLOOP_DRAIN_S)
+        dropped = sum(f.cancel() for f in futures)
+    elapsed = time.perf_counter() - start
+
+    return _step(rate, elapsed, latencies, service, dropped, errors)
+
+
+async def _run_async_step(bm: BenchmarkInfo, ctx: dict, rate: float, duration: float, max_inflight: int) -> RateStep:
+    client = await init_beanie_models(ctx['db_name'])
+    latencies, service, errors = [], [], 0
+    semaphore = asyncio.Semaphore(max_inflight)
+    closed = False
+    dropped = 0
+
+    async def op(iter_ctx: dict, intended: float):
+        nonlocal errors, dropped
+        async with semaphore:
+            if closed:
+                dropped += 1
+                return
+            started = time.perf_counter()
+            try:
+                await bm.func(iter_ctx)
+            except Exception:
+                errors += 1
+                return
+            done = time.perf_counter()
+            latencies.append(done - intended)
+            service.append(done - started)
+
+    total = int(rate * duration)
+    tasks = []
+    start = time.perf_counter()
+    for i in range(total):
+        intended = start + i / rate
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(op(iteration_ctx(ctx), intended)))
+    await asyncio.wait(tasks, timeout=OPENLOOP_DRAIN_S)
+    closed = True
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    client.close()
+    return _step(rate, elapsed, latencies, service, dropped, errors)
+
+
+def _step(
+    rate: float,
+    elapsed: float,
+    latencies: list[float],
+    service: list[float],
+    dropped: int,
+    errors: int,
+) -> RateStep:
+    sorted_ms = sorted(t * 1000 for t in latencies)
+    service_ms = sorted(t * 1000 for t in service)
+    return RateStep(
+        target_rate=rate,
+        achieved_rate=len(sorted_ms) / elapsed if elapsed > 0 else 0.0,
+        completed=len(sorted_ms),
+        dropped=dropped,
+        errors=errors,
+        median_ms=statistics.median(sorted_ms) if sorted_ms else 0.0,
+        p99_ms=percentile(sorted_ms, 99) if sorted_ms else 0.0,
+        service_p99_ms=percentile(service_ms, 99) if service_ms else 0.0,
+    )
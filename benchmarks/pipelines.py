@@ -0,0 +1,81 @@
+from datetime import datetime
+
+# Every library runs the exact same pipelines; only the way results come back differs.
+REPORT_START = datetime(2024, 1, 1)
+REPORT_END = datetime(2025, 1, 1)
+
+
+def _in_report_window() -> dict:
+    return {'$match': {'created_at': {'$gte': REPORT_START, '$lt': REPORT_END}}}
+
+
+def revenue_by_status() -> list[dict]:
+    return [
+        _in_report_window(),
+        {'$group': {'_id': '$status', 'revenue_cents': {'$sum': '$total_cents'}, 'order_count': {'$sum': 1}}},
+        {'$sort': {'revenue_cents': -1}},
+        {'$project': {'_id': 0, 'status': '$_id', 'revenue_cents': 1, 'order_count': 1}},
+    ]
+
+
+def top_skus(limit: int = 10) -> list[dict]:
+    return [
+        _in_report_window(),
+        {'$unwind': '$line_items'},
+        {'$group': {'_id': '$line_items.sku', 'quantity': {'$sum': '$line_items.quantity'}}},
+        {'$sort': {'quantity': -1}},
+        {'$limit': limit},
+        {'$project': {'_id': 0, 'sku': '$_id', 'quantity': 1}},
+    ]
+
+
+def monthly_orders() -> list[dict]:
+    return [
+        _in_report_window(),
+        {
+            '$group': {
+                '_id': {'year': {'$year': '$created_at'}, 'month': {'$month': '$created_at'}},
+                'order_count': {'$sum': 1},
+            }
+        },
+        {'$sort': {'_id.year': 1, '_id.month': 1}},
+        {'$project': {'_id': 0, 'year': '$_id.year', 'month': '$_id.month', 'order_count': 1}},
+    ]
+
+
+def basket_by_payment() -> list[dict]:
+    return [
+        _in_report_window(),
+        {
+            '$group': {
+                '_id': '$payment.method',
+                'avg_total_cents': {'$avg': '$total_cents'},
+                'avg_item_count': {'$avg': '$item_count'},
+                'order_count': {'$sum': 1},
+            }
+        },
+        {'$sort': {'_id': 1}},
+        {
+            '$project': {
+                '_id': 0,
+                'payment_method': '$_id',
+                'avg_total_cents': 1,
+                'avg_item_count': 1,
+                'order_count': 1,
+            }
+        },
+    ]
+
+
+def dashboard_facet() -> list[dict]:
+    def buckets(field: str) -> list[dict]:
+        return [
+            {'$group': {'_id': field, 'order_count': {'$sum': 1}}},
+            {'$sort': {'order_count': -1}},
+            {'$project': {'_id': 0, 'key': '$_id', 'order_count': 1}},
+        ]
+
+    return [
+        _in_report_window(),
+        {'$facet': {'by_status': buckets('$status'), 'by_payment': buckets('$payment.method')}},
+    ]
@@ -0,0 +1,208 @@
+import cProfile
+import os
+import pstats
+import re
+import signal
+import sys
+import sysconfig
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+from config import ITERATIONS, PROFILE_DIR, PROFILE_SAMPLE_INTERVAL_S
+
+_STDLIB = sysconfig.get_paths()['stdlib']
+_PROJECT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The harness, the benchmark functions and the event loop enclose everything, so their cumulative time says nothing
+_WRAPPERS = ('benchmarks', 'raw', 'dataclasses_raw', 'beanie_odm', 'mongoengine_odm', 'asyncio')
+
+# Innermost frames of threads parked between jobs: an idle executor worker, pymongo's monitors between heartbeats,
+# and anything blocked on a threading condition, such as rich's progress refresh thread
+_IDLE_FRAMES = ('_worker', 'PeriodicExecutor._run', 'Condition.wait')
+_WORKER_INDEX = re.compile(r'_\d+$')
+
+
+@dataclass
+class HotFunction:
+    name: str
+    package: str
+    calls: int
+    self_ms: float
+    cumulative_ms: float
+
+
+@dataclass
+class ProfileInfo:
+    """Where a benchmark's profiled iterations went. Timings are per iteration, with profiler overhead included."""
+
+    pstats_path: str
+    folded_path: str
+    iterations: int
+    samples: int
+    hot: list[HotFunction] = field(default_factory=list)
+
+
+class StackSampler:
+    """Samples every thread's Python stack on a SIGALRM timer and counts each distinct stack, flamegraph-style.
+
+    The handler runs on the benchmark thread, which must be the main thread, so there is no sampler thread for
+    cProfile to record. Stacks from other threads are rooted at a `thread:<name>` frame, so work that Motor hands to
+    its executor shows up as its own tower beside the event loop's.
+    """
+
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL_S):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        # (thread id, code objects innermost first) -> count; turned into names on exit, outside the profile
+        self._samples: dict[tuple, int] = {}
+        self._thread_id = threading.get_ident()
+        self._previous_handler = None
+
+    def __enter__(self):
+        self._previous_handler = signal.signal(signal.SIGALRM, self._sample)
+        signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self._previous_handler)
+        names = {t.ident: _WORKER_INDEX.sub('', t.name) for t in threading.enumerate()}
+        for (thread_id, codes), count in self._samples.items():
+            stack = [f'{_package(code.co_filename)}:{code.co_qualname}' for code in reversed(codes)]
+            if thread_id != self._thread_id:
+                # Pool workers differ only in their trailing index, so they share one root
+                stack.insert(0, f'thread:{names.get(thread_id, thread_id)}')
+            self.stacks[';'.join(stack)] += count
+
+    def _sample(self, signum, frame):
+        # cProfile records this handler; it only calls builtins, so _drop_sampler can take all of it back out
+        if frame is not None and frame.f_code is _SAMPLE_CODE:
+            return  # The timer fired again while the last sample was still being taken
+        for thread_id, top in sys._current_frames().items():
+            if thread_id == self._thread_id:
+                top = frame  # The interrupted frame rather than this handler's
+            elif top.f_code.co_qualname in _IDLE_FRAMES:
+                continue
+            codes = []
+            while top is not None:
+                codes.append(top.f_code)
+                top = top.f_back
+            if codes:
+                key = (thread_id, tuple(codes))
+                self._samples[key] = self._samples.get(key, 0) + 1
+
+    def write(self, path: str):
+        # One `frame;frame;frame count` line per stack: the input flamegraph.pl and speedscope expect
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f'{stack} {count}\n')
+
+
+_SAMPLE_CODE = StackSampler._sample.__code__
+
+
+class BenchmarkProfiler:
+    """cProfile for exact call counts plus a stack sampler for flamegraphs, over the same iterations.
+
+    Since Python 3.12 cProfile runs on `sys.monitoring`, which sees every thread but keeps one call stack, so calls
+    made on Motor's executor threads are counted under whatever the benchmark thread was running. The sampled stacks
+    keep each thread apart.
+    """
+
+    def __init__(self, library: str, name: str, output_dir: str = PROFILE_DIR):
+        directory = os.path.join(output_dir, library)
+        os.makedirs(directory, exist_ok=True)
+        self.pstats_path = os.path.join(directory, f'{name}.pstats')
+        self.folded_path = os.path.join(directory, f'{name}.folded')
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler()
+
+    def __enter__(self):
+        self._sampler.__enter__()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self._profile.disable()
+        self._sampler.__exit__(*exc)
+
+    def save(self, iterations: int = ITERATIONS) -> ProfileInfo:
+        stats = pstats.Stats(self._profile)
+        _drop_sampler(stats)
+        stats.dump_stats(self.pstats_path)
+        self._sampler.write(self.folded_path)
+        return ProfileInfo(
+            pstats_path=self.pstats_path,
+            folded_path=self.folded_path,
+            iterations=iterations,
+            samples=sum(self._sampler.stacks.values()),
+            hot=hot_functions(pstats.Stats(self.pstats_path), iterations=iterations),
+        )
+
+
+def hot_functions(stats: pstats.Stats, iterations: int = 1, limit: int = 10) -> list[HotFunction]:
+    """Top functions by cumulative time, leaving out the wrappers that sit above everything."""
+    rows = []
+    for (filename, line, func), (_, calls, self_s, cumulative_s, _) in _entries(stats).items():
+        package = _package(filename)
+        if package in _WRAPPERS or filename.startswith('<'):
+            continue
+        rows.append(
+            HotFunction(
+                name=f'{func} ({os.path.basename(filename)}:{line})' if line else func,
+                package=package,
+                calls=calls,
+                self_ms=self_s * 1000 / iterations,
+                cumulative_ms=cumulative_s * 1000 / iterations,
+            )
+        )
+    rows.sort(key=lambda r: r.cumulative_ms, reverse=True)
+    return rows[:limit]
+
+
+def self_time_by_package(stats: pstats.Stats, iterations: int = 1) -> dict[str, float]:
+    """Self time per top-level package in ms per iteration, e.g. how much is pydantic vs motor vs bson."""
+    totals = defaultdict(float)
+    for (filename, _, _), (_, _, self_s, _, _) in _entries(stats).items():
+        totals[_package(filename)] += self_s * 1000 / iterations
+    return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def _drop_sampler(stats: pstats.Stats):
+    """Take StackSampler's signal handler, and the builtins it called, back out of a profile's stats."""
+    entries = _entries(stats)
+    handlers = [key for key in entries if key[0] == __file__ and key[2].endswith('_sample')]
+    for handler in handlers:
+        del entries[handler]
+    for key, (cc, nc, tt, ct, callers) in list(entries.items()):
+        edges = [callers.pop(handler) for handler in handlers if handler in callers]
+        if not edges:
+            continue
+        if not callers:
+            # Only the handler called it, e.g. sys._current_frames
+            del entries[key]
+            continue
+        for e_cc, e_nc, e_tt, e_ct in edges:
+            cc, nc, tt, ct = cc - e_cc, nc - e_nc, tt - e_tt, ct - e_ct
+        entries[key] = (cc, nc, tt, ct, callers)
+
+
+def _entries(stats: pstats.Stats) -> dict:
+    # (filename, line, function) -> (primitive calls, calls, self s, cumulative s, callers); typeshed leaves it out
+    return getattr(stats, 'stats')
+
+
+def _package(filename: str) -> str:
+    if filename == '~' or filename.startswith('<'):
+        return 'builtins'
+    path = os.path.abspath(filename)
+    if 'site-packages' in path:
+        rest = path.split('site-packages' + os.sep, 1)[1]
+        return rest.split(os.sep, 1)[0].removesuffix('.py').split('.')[0]
+    if path.startswith(_PROJECT + os.sep):
+        return os.path.relpath(path, _PROJECT).split(os.sep, 1)[0].removesuffix('.py')
+    if path.startswith(_STDLIB):
+        top = os.path.relpath(path, _STDLIB).split(os.sep, 1)[0].removesuffix('.py')
+        return 'asyncio' if top == 'asyncio' else 'stdlib'
+    return 'other'
@@ -1,5 +1,5 @@
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable
 
@@ -16,6 +16,17 @@ class OpType(str, Enum):
     WRITE = 'write'
 
 
+class Family(str, Enum):
+    CORE = 'core'
+    DOC_SIZE = 'doc_size'
+    AGGREGATION = 'aggregation'
+    PAGINATION = 'pagination'
+    BULK_WRITE = 'bulk_write'
+    COVERED = 'covered'
+    MULTI_GET = 'multi_get'
+    SCENARIO = 'scenario'  # Ops that only exist to feed scenario mixes (ycsb-d/e); off the default run
+
+
 @dataclass
 class BenchmarkInfo:
     name: str
@@ -25,6 +36,8 @@ class BenchmarkInfo:
     description: str
     func: Callable
     is_async: bool
+    family: Family = Family.CORE
+    params: dict = field(default_factory=dict)
 
 
 _registry: list[BenchmarkInfo] = []
@@ -36,6 +49,8 @@ def benchmark(
     op_type: OpType,
     collection: str,
     description: str = '',
+    family: Family = Family.CORE,
+    params: dict | None = None,
 ):
     def decorator(func):
         info = BenchmarkInfo(
@@ -46,6 +61,8 @@ def benchmark(
             description=description,
             func=func,
             is_async=asyncio.iscoroutinefunction(func),
+            family=family,
+            params=params or {},
         )
         _registry.append(info)
         return func
@@ -56,10 +73,13 @@ def benchmark(
 def get_benchmarks(
     library: Library | None = None,
     op_type: OpType | None = None,
+    families: list[Family] | None = None,
 ) -> list[BenchmarkInfo]:
     results = _registry
     if library:
         results = [b for b in results if b.library == library]
     if op_type:
         results = [b for b in results if b.op_type == op_type]
+    if families:
+        results = [b for b in results if b.family in families]
     return results
@@ -0,0 +1,152 @@
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+
+import bson
+from rich.console import Console
+
+from benchmarks.monitoring import CommandRecorder, cursor_documents
+from benchmarks.registry import BenchmarkInfo, Library, get_benchmarks
+from benchmarks.runner import build_context, init_beanie_models, iteration_ctx, load_benchmarks
+from benchmarks.stats import percentile
+from config import DB_NAME, REPLAY_ITERATIONS
+from models import beanie_models, mongoengine_models
+from models.dataclass_models import category_from_doc, order_from_doc
+
+console = Console()
+
+# Read benchmarks that return whole documents, so every library has a model to hydrate them into
+REPLAY_SUITE = [
+    'read_full_record_category',
+    'read_full_record_order',
+    'read_100_orders',
+    'read_1000_orders',
+    'read_100_categories',
+    'read_1000_categories',
+    'read_order_1kb',
+    'read_order_10kb',
+    'read_order_100kb',
+]
+
+# How each library turns one decoded document into its own object; raw PyMongo stops at the dict
+HYDRATORS = {
+    Library.RAW: {},
+    Library.DATACLASSES_RAW: {'category': category_from_doc, 'order': order_from_doc},
+    Library.BEANIE: {
+        'category': beanie_models.CategoryDoc.model_validate,
+        'order': beanie_models.OrderDoc.model_validate,
+    },
+    Library.MONGOENGINE: {
+        'category': mongoengine_models.CategoryDoc._from_son,
+        'order': mongoengine_models.OrderDoc._from_son,
+    },
+}
+
+
+@dataclass
+class Payload:
+    """The documents one call of a raw benchmark got back, re-encoded as concatenated BSON."""
+
+    benchmark: BenchmarkInfo
+    data: bytes
+    documents: int
+
+
+@dataclass
+class ReplayResult:
+    """Decode and hydration of a captured payload, entirely in memory: no network, no server."""
+
+    benchmark: str
+    library: Library
+    documents: int
+    payload_bytes: int
+    median_us: float
+    p95_us: float
+    stdev_us: float
+
+    @property
+    def per_doc_us(self) -> float:
+        return self.median_us / self.documents if self.documents else 0.0
+
+
+def capture_payloads(names: list[str] | None = None, db_name: str = DB_NAME) -> list[Payload]:
+    """Run each raw read benchmark once with command monitoring on and keep the documents its cursors returned."""
+    load_benchmarks()
+    registered = {b.name: b for b in get_benchmarks(library=Library.RAW)}
+    names = names or REPLAY_SUITE
+    unknown = [name for name in names if name not in registered]
+    if unknown:
+        raise ValueError(f'Unknown benchmark(s): {", ".join(unknown)}')
+
+    recorder = CommandRecorder()
+    families = {registered[name].family for name in names}
+    ctx = build_context(db_name, client_options={'event_listeners': [recorder]}, families=families)
+    payloads = []
+    for name in names:
+        bm = registered[name]
+        with recorder.capture() as capture:
+            bm.func(iteration_ctx(ctx))
+        docs = [doc for reply in capture.replies for doc in cursor_documents(reply)]
+        if not docs:
+            console.print(f'[yellow]{name} returned no documents; skipping it.')
+            continue
+        payloads.append(Payload(benchmark=bm, data=b''.join(bson.encode(doc) for doc in docs), documents=len(docs)))
+    ctx['db'].client.close()
+    return payloads
+
+
+def run_replay(
+    names: list[str] | None = None,
+    library: Library | None = None,
+    iterations: int = REPLAY_ITERATIONS,
+    db_name: str = DB_NAME,
+) -> list[ReplayResult]:
+    """Capture each payload once, then time `bson.decode_all` plus each library's hydration over it."""
+    payloads = capture_payloads(names, db_name)
+
+    libraries = [library] if library else list(Library)
+    if Library.BEANIE in libraries:
+        # Beanie documents refuse to be constructed until their collection is initialized
+        asyncio.run(_init_beanie(db_name))
+
+    results = []
+    for payload in payloads:
+        for lib in libraries:
+            console.print(f'[bold cyan]{lib.value}: replaying {payload.benchmark.name} ({payload.documents:,} docs)...')
+            results.append(_replay(payload, lib, iterations))
+    return results
+
+
+async def _init_beanie(db_name: str):
+    client = await init_beanie_models(db_name)
+    client.close()
+
+
+def _replay(payload: Payload, library: Library, iterations: int) -> ReplayResult:
+    hydrate = HYDRATORS[library].get(payload.benchmark.collection)
+    data = payload.data
+
+    def call():
+        docs = bson.decode_all(data)
+        if hydrate:
+            for doc in docs:
+                hydrate(doc)
+
+    call()  # warm-up: first-call costs such as validator and field caches
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+
+    us = sorted(t * 1_000_000 for t in timings)
+    return ReplayResult(
+        benchmark=payload.benchmark.name,
+        library=library,
+        documents=payload.documents,
+        payload_bytes=len(data),
+        median_us=statistics.median(us),
+        p95_us=percentile(us, 95),
+        stdev_us=statistics.stdev(us) if len(us) > 1 else 0.0,
+    )
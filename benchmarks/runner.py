@@ -1,16 +1,46 @@
 import asyncio
 import statistics
-from dataclasses import dataclass
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 
 from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from benchmarks.registry import BenchmarkInfo, Library, OpType, get_benchmarks
+from benchmarks.cache import CacheEvictor, CacheMode
+from benchmarks.gc_monitor import GCMode, GCRecorder, GCStats, apply_gc_mode
+from benchmarks.key_pool import KeyPool
+from benchmarks.monitoring import (
+    Capture,
+    CommandRecorder,
+    PlanInfo,
+    ServerStats,
+    WireStats,
+    explain_commands,
+    server_delta,
+    server_snapshot,
+    snapshot_overhead,
+    wire_stats,
+)
+from benchmarks.profiling import BenchmarkProfiler, ProfileInfo
+from benchmarks.registry import BenchmarkInfo, Family, Library, OpType, get_benchmarks
+from benchmarks.stats import percentile
 from benchmarks.timer import AsyncTimer, sync_timer
-from config import DB_NAME, ITERATIONS, MONGO_URI
-from db import connect_mongoengine, disconnect_mongoengine, get_pymongo_db
-from models.beanie_models import CategoryDoc, OrderDoc
+from config import (
+    BULK_UPDATE_KEYS,
+    DB_NAME,
+    ITERATIONS,
+    KEY_POOL_SIZE,
+    LARGE_ORDER_SIZES,
+    LARGE_ORDERS_PER_SIZE,
+    PAGE_DEPTHS,
+    PAGE_SIZE,
+    RECENT_ORDER_WINDOW,
+)
+from db import connect_mongoengine, disconnect_mongoengine, get_motor_client, get_pymongo_db, is_memory_backend
+from models.beanie_models import CategoryDoc, LargeOrderDoc, OrderDoc
+from seeding.distributions import Distribution
+from seeding.seeder import large_order_prefix
 
 
 @dataclass
@@ -22,27 +52,60 @@ class BenchmarkResult:
     max_ms: float
     p95_ms: float
     mean_ms: float
+    cpu_median_ms: float = 0.0
+    plans: list[PlanInfo] = field(default_factory=list)
+    wire: WireStats | None = None
+    ops_per_sec: float | None = None  # Aggregate throughput, for results merged from a multi-process run
+    profile: ProfileInfo | None = None
+    gc: GCStats | None = None
+    server: ServerStats | None = None
 
 
-def _compute_stats(bm: BenchmarkInfo, timings: list[float]) -> BenchmarkResult:
+def _compute_stats(bm: BenchmarkInfo, timings: list[float], cpu_timings: list[float] | None = None) -> BenchmarkResult:
     ms = [t * 1000 for t in timings]
     sorted_ms = sorted(ms)
-    p95_idx = min(int(len(sorted_ms) * 0.95), len(sorted_ms) - 1)
     return BenchmarkResult(
         benchmark=bm,
         timings=timings,
         median_ms=statistics.median(ms),
         min_ms=min(ms),
         max_ms=max(ms),
-        p95_ms=sorted_ms[p95_idx],
+        p95_ms=percentile(sorted_ms, 95),
         mean_ms=statistics.mean(ms),
+        cpu_median_ms=statistics.median(cpu_timings) * 1000 if cpu_timings else 0.0,
     )
 
 
-def preselect_targets(db) -> dict:
-    """Pick random query targets that all libraries will use."""
-    sample_cat = db.categories.aggregate([{'$sample': {'size': 1}}]).next()
-    sample_order = db.orders.aggregate([{'$sample': {'size': 1}}]).next()
+def preselect_targets(
+    db,
+    pool_size: int = KEY_POOL_SIZE,
+    distribution: Distribution = Distribution.UNIFORM,
+    families: set[Family] | None = None,
+) -> tuple[dict, KeyPool]:
+    """Pick the fixed query targets and the per-iteration key pool that all libraries will use.
+
+    The pagination cursors and bulk-write keys are only chosen when `families` includes a family that reads them;
+    None means every family.
+    """
+    categories = list(db.categories.aggregate([{'$sample': {'size': pool_size}}, {'$project': {'slug': 1}}]))
+    orders = list(
+        db.orders.aggregate([{'$sample': {'size': pool_size}}, {'$project': {'order_number': 1, 'created_at': 1}}])
+    )
+    if distribution == Distribution.LATEST:
+        # Newest first, so the Zipfian head lands on the most recently created documents
+        categories.sort(key=lambda d: d['_id'], reverse=True)
+        orders.sort(key=lambda d: d['created_at'], reverse=True)
+
+    keys = {
+        'category_slug': [d['slug'] for d in categories],
+        'order_number': [d['order_number'] for d in orders],
+        # Ranks by created_at, already newest first; read at run time, so orders inserted mid-run are the ones read
+        'recent_rank': list(range(RECENT_ORDER_WINDOW)),
+    }
+    # orders_large is seeded with known order numbers, so its keys need no query
+    for label in LARGE_ORDER_SIZES:
+        keys[f'large_order_{label}'] = [f'{large_order_prefix(label)}-{i:08d}' for i in range(LARGE_ORDERS_PER_SIZE)]
+    key_pool = KeyPool(keys, distribution=distribution)
 
     # Find status with most documents for bulk reads
     pipeline = [
@@ -51,40 +114,81 @@ def preselect_targets(db) -> dict:
     ]
     best_status = next(db.orders.aggregate(pipeline))['_id']
 
-    return {
-        'category_slug': sample_cat['slug'],
-        'order_number': sample_order['order_number'],
-        'bulk_status': best_status,
-    }
+    targets = {'bulk_status': best_status}
+    if families is None or Family.PAGINATION in families:
+        # Keyset pagination resumes after the last document of the previous page
+        page_cursors = {}
+        for page in PAGE_DEPTHS:
+            if page == 1:
+                page_cursors[page] = None
+                continue
+            cursor = (
+                db.categories.find({}, {'view_count': 1})
+                .sort([('view_count', -1), ('_id', -1)])
+                .skip((page - 1) * PAGE_SIZE - 1)
+                .limit(1)
+            )
+            page_cursors[page] = next(cursor, None)
+        targets['page_cursors'] = page_cursors
+    if families is None or families & {Family.BULK_WRITE, Family.MULTI_GET}:
+        bulk_orders = db.orders.aggregate([{'$sample': {'size': BULK_UPDATE_KEYS}}, {'$project': {'order_number': 1}}])
+        targets['bulk_order_numbers'] = [d['order_number'] for d in bulk_orders]
+
+    return targets, key_pool
 
 
 def run_benchmarks(
     library: Library | None = None,
     op_type: OpType | None = None,
+    families: list[Family] | None = None,
+    key_distribution: Distribution = Distribution.UNIFORM,
+    key_pool_size: int = KEY_POOL_SIZE,
+    db_name: str = DB_NAME,
+    explain: bool = False,
+    measure_wire: bool = False,
+    client_options: dict | None = None,
+    skip_failures: bool = False,
+    names: list[str] | None = None,
+    profile: bool = False,
+    gc_mode: GCMode = GCMode.DEFAULT,
+    server_stats: bool = False,
+    cache_mode: CacheMode = CacheMode.WARM,
 ) -> list[BenchmarkResult]:
-    # Import benchmark modules to trigger registration
-    import beanie_odm.reads
-    import beanie_odm.writes  # noqa: F401
-    import dataclasses_raw.reads
-    import dataclasses_raw.writes  # noqa: F401
-    import mongoengine_odm.reads
-    import mongoengine_odm.writes  # noqa: F401
-    import raw.reads
-    import raw.writes  # noqa: F401
+    load_benchmarks()
+    all_bms = get_benchmarks(library=library, op_type=op_type, families=families)
+    if names:
+        all_bms = [b for b in all_bms if b.name in names]
+    probes = {'explain': explain, 'measure_wire': measure_wire}
 
-    all_bms = get_benchmarks(library=library, op_type=op_type)
+    # Command monitoring costs a little on every operation, so the listener is only attached when probing
+    client_options = dict(client_options or {})
+    if explain or measure_wire:
+        client_options['event_listeners'] = [CommandRecorder()]
 
     # Pre-select query targets
-    db = get_pymongo_db()
-    targets = preselect_targets(db)
-    ctx = {'db': db, 'targets': targets}
+    ctx = build_context(
+        db_name,
+        key_distribution=key_distribution,
+        key_pool_size=key_pool_size,
+        client_options=client_options,
+        families={b.family for b in all_bms},
+    )
+    db = ctx['db']
+    overhead = snapshot_overhead(db) if server_stats else None
 
     results = []
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn('[bold cyan]{task.description}'),
-    ) as progress:
+    # Cold mode evicts the working set before every timed iteration, and restores the server's cache size at the end
+    evictor = CacheEvictor(db) if cache_mode == CacheMode.COLD else None
+    evict = evictor.evict if evictor else None
+
+    with (
+        evictor or nullcontext(),
+        Progress(
+            SpinnerColumn(),
+            TextColumn('[bold cyan]{task.description}'),
+        ) as progress,
+    ):
         # Run reads first, then writes
         reads = [b for b in all_bms if b.op_type == OpType.READ]
         writes = [b for b in all_bms if b.op_type == OpType.WRITE]
@@ -94,12 +198,33 @@ def run_benchmarks(
         sync_writes = [b for b in writes if not b.is_async]
 
         if any(b.library == Library.MONGOENGINE for b in sync_reads + sync_writes):
-            connect_mongoengine()
+            connect_mongoengine(db_name, **client_options)
 
         for bm in sync_reads + sync_writes:
             task = progress.add_task(f'{bm.library.value}: {bm.name}', total=None)
-            timings = _run_sync_benchmark(bm, ctx)
-            results.append(_compute_stats(bm, timings))
+            try:
+                before = server_snapshot(db) if server_stats else None
+                with apply_gc_mode(gc_mode), GCRecorder() as gc_recorder:
+                    eviction = _Eviction(evict, db, gc_recorder, overhead) if evict else None
+                    timings, cpu_timings = _run_sync_benchmark(bm, ctx, eviction)
+                after = server_snapshot(db) if server_stats else None
+            except Exception as e:
+                if not skip_failures:
+                    raise
+                _mark_failed(progress, task, bm, e)
+                continue
+            result = _compute_stats(bm, timings, cpu_timings)
+            result.gc = gc_recorder.stats(gc_mode)
+            # Set exactly when server_stats is on; spelled out so the snapshots narrow to dicts
+            if before is not None and after is not None and overhead is not None:
+                result.server = server_delta(
+                    before, after, overhead, len(timings), excluded=eviction.server if eviction else None
+                )
+            if explain or measure_wire:
+                _annotate(result, _probe_sync(bm, ctx), ctx, **probes)
+            if profile:
+                result.profile = _profile_sync(bm, ctx)
+            results.append(result)
             progress.update(
                 task,
                 completed=True,
@@ -111,52 +236,263 @@ def run_benchmarks(
             disconnect_mongoengine()
 
         # Cleanup write benchmark docs (sync)
-        db.categories.delete_many({'_benchmark': True})
-        db.orders.delete_many({'_benchmark': True})
+        cleanup_benchmark_docs(db)
 
         # --- Async benchmarks (beanie) ---
         async_reads = [b for b in reads if b.is_async]
         async_writes = [b for b in writes if b.is_async]
 
         if async_reads or async_writes:
-            async_results = asyncio.run(_run_all_async_benchmarks(async_reads + async_writes, ctx, progress))
+            async_results = asyncio.run(
+                _run_all_async_benchmarks(
+                    async_reads + async_writes,
+                    ctx,
+                    progress,
+                    skip_failures=skip_failures,
+                    profile=profile,
+                    gc_mode=gc_mode,
+                    server_stats=server_stats,
+                    evict=evict,
+                    **probes,
+                )
+            )
             results.extend(async_results)
 
             # Cleanup write benchmark docs (async inserts went to same collections)
-            db.categories.delete_many({'_benchmark': True})
-            db.orders.delete_many({'_benchmark': True})
+            cleanup_benchmark_docs(db)
 
     return results
 
 
-def _run_sync_benchmark(bm: BenchmarkInfo, ctx: dict) -> list[float]:
-    timings = []
+def load_benchmarks():
+    # Import benchmark modules to trigger registration
+    import beanie_odm.aggregations
+    import beanie_odm.bulk_writes
+    import beanie_odm.covered
+    import beanie_odm.doc_size
+    import beanie_odm.multi_get
+    import beanie_odm.pagination
+    import beanie_odm.reads
+    import beanie_odm.writes  # noqa: F401
+    import dataclasses_raw.aggregations
+    import dataclasses_raw.bulk_writes
+    import dataclasses_raw.covered
+    import dataclasses_raw.doc_size
+    import dataclasses_raw.multi_get
+    import dataclasses_raw.pagination
+    import dataclasses_raw.reads
+    import dataclasses_raw.writes  # noqa: F401
+    import mongoengine_odm.aggregations
+    import mongoengine_odm.bulk_writes
+    import mongoengine_odm.covered
+    import mongoengine_odm.doc_size
+    import mongoengine_odm.multi_get
+    import mongoengine_odm.pagination
+    import mongoengine_odm.reads
+    import mongoengine_odm.writes  # noqa: F401
+    import raw.aggregations
+    import raw.bulk_writes
+    import raw.covered
+    import raw.doc_size
+    import raw.multi_get
+    import raw.pagination
+    import raw.reads
+    import raw.writes  # noqa: F401
+
+
+def build_context(
+    db_name: str = DB_NAME,
+    key_distribution: Distribution = Distribution.UNIFORM,
+    key_pool_size: int = KEY_POOL_SIZE,
+    client_options: dict | None = None,
+    families: set[Family] | None = None,
+) -> dict:
+    client_options = client_options or {}
+    db = get_pymongo_db(db_name, **client_options)
+    targets, key_pool = preselect_targets(db, pool_size=key_pool_size, distribution=key_distribution, families=families)
+    return {
+        'db': db,
+        'db_name': db_name,
+        'targets': targets,
+        'key_pool': key_pool,
+        'client_options': client_options,
+    }
+
+
+def iteration_ctx(ctx: dict) -> dict:
+    # Fresh lookup keys every iteration; drawn outside the timed region
+    return {**ctx, 'targets': {**ctx['targets'], **ctx['key_pool'].draw()}}
+
+
+def cleanup_benchmark_docs(db):
+    db.categories.delete_many({'_benchmark': True})
+    db.orders.delete_many({'_benchmark': True})
+
+
+async def init_beanie_models(db_name: str = DB_NAME, **client_options):
+    client = get_motor_client(**client_options)
+    # No indexes on the memory backend (see seed_database)
+    await init_beanie(
+        database=client[db_name],
+        document_models=[CategoryDoc, OrderDoc, LargeOrderDoc],
+        skip_indexes=is_memory_backend(),
+    )
+    return client
+
+
+class _Eviction:
+    """The cold-cache eviction, kept out of the GC counts and server stats measured around a benchmark's iterations.
+
+    GC collections that start during an eviction aren't recorded. With server stats on, each eviction is bracketed
+    by snapshots and everything it moved is collected in `server`, for server_delta to take off the window.
+    """
+
+    def __init__(self, evict: Callable[[], None], db, gc_recorder: GCRecorder, overhead: dict | None):
+        self.evict = evict
+        self.db = db
+        self.gc_recorder = gc_recorder
+        self.overhead = overhead
+        self.server: dict[str, int] = {}
+
+    def __call__(self):
+        with self.gc_recorder.paused():
+            if self.overhead is None:
+                self.evict()
+                return
+            before = server_snapshot(self.db)
+            self.evict()
+            after = server_snapshot(self.db)
+            for k in before:
+                # The bracket's own two snapshots also fall in the window: one in after - before, one more overhead
+                self.server[k] = self.server.get(k, 0) + after[k] - before[k] + self.overhead[k]
+
+
+def _run_sync_benchmark(
+    bm: BenchmarkInfo, ctx: dict, evict: Callable[[], None] | None = None
+) -> tuple[list[float], list[float]]:
+    ctx['key_pool'].reset()
+    timings, cpu_timings = [], []
     for _ in range(ITERATIONS):
+        iter_ctx = iteration_ctx(ctx)
+        if evict:
+            evict()
         with sync_timer() as t:
-            bm.func(ctx)
+            bm.func(iter_ctx)
         timings.append(t.elapsed_seconds)
-    return timings
+        cpu_timings.append(t.cpu_seconds)
+    return timings, cpu_timings
+
+
+async def _run_async_benchmark(
+    bm: BenchmarkInfo, ctx: dict, evict: Callable[[], None] | None = None
+) -> tuple[list[float], list[float]]:
+    ctx['key_pool'].reset()
+    timings, cpu_timings = [], []
+    for _ in range(ITERATIONS):
+        iter_ctx = iteration_ctx(ctx)
+        if evict:
+            # Through the sync client, blocking the loop: nothing else is running on it
+            evict()
+        timer = AsyncTimer()
+        async with timer:
+            await bm.func(iter_ctx)
+        timings.append(timer.result.elapsed_seconds)
+        cpu_timings.append(timer.result.cpu_seconds)
+    return timings, cpu_timings
+
+
+def _mark_failed(progress: Progress, task, bm: BenchmarkInfo, error: Exception):
+    # Some client settings (e.g. unacknowledged writes) break a library outright; report it and move on
+    progress.update(
+        task, completed=True, description=f'[red]{bm.library.value}: {bm.name} failed ({type(error).__name__})'
+    )
+    progress.stop_task(task)
+
+
+def _recorder(ctx: dict) -> CommandRecorder:
+    listeners = ctx['client_options']['event_listeners']
+    return next(listener for listener in listeners if isinstance(listener, CommandRecorder))
+
+
+def _probe_sync(bm: BenchmarkInfo, ctx: dict) -> Capture:
+    # One extra, untimed call records what the library actually sent and got back
+    with _recorder(ctx).capture() as capture:
+        bm.func(iteration_ctx(ctx))
+    return capture
+
+
+async def _probe_async(bm: BenchmarkInfo, ctx: dict) -> Capture:
+    with _recorder(ctx).capture() as capture:
+        await bm.func(iteration_ctx(ctx))
+    return capture
+
+
+def _profile_sync(bm: BenchmarkInfo, ctx: dict) -> ProfileInfo:
+    # A separate pass over the same keys: profiler overhead would distort the timed iterations
+    ctx['key_pool'].reset()
+    with BenchmarkProfiler(bm.library.value, bm.name) as profiler:
+        for _ in range(ITERATIONS):
+            bm.func(iteration_ctx(ctx))
+    return profiler.save(ITERATIONS)
+
+
+async def _profile_async(bm: BenchmarkInfo, ctx: dict) -> ProfileInfo:
+    ctx['key_pool'].reset()
+    with BenchmarkProfiler(bm.library.value, bm.name) as profiler:
+        for _ in range(ITERATIONS):
+            await bm.func(iteration_ctx(ctx))
+    return profiler.save(ITERATIONS)
+
+
+def _annotate(result: BenchmarkResult, capture: Capture, ctx: dict, explain: bool, measure_wire: bool):
+    if explain:
+        result.plans = explain_commands(ctx['db'].client, capture.commands)
+    if measure_wire:
+        result.wire = wire_stats(capture, ctx['client_options'])
 
 
 async def _run_all_async_benchmarks(
     benchmarks: list[BenchmarkInfo],
     ctx: dict,
     progress: Progress,
+    explain: bool = False,
+    measure_wire: bool = False,
+    skip_failures: bool = False,
+    profile: bool = False,
+    gc_mode: GCMode = GCMode.DEFAULT,
+    server_stats: bool = False,
+    evict: Callable[[], None] | None = None,
 ) -> list[BenchmarkResult]:
-    client = AsyncIOMotorClient(MONGO_URI)
-    db = client[DB_NAME]
-    await init_beanie(database=db, document_models=[CategoryDoc, OrderDoc])
+    client = await init_beanie_models(ctx['db_name'], **ctx['client_options'])
+    overhead = snapshot_overhead(ctx['db']) if server_stats else None
 
     results = []
     for bm in benchmarks:
         task = progress.add_task(f'{bm.library.value}: {bm.name}', total=None)
-        timings = []
-        for _ in range(ITERATIONS):
-            timer = AsyncTimer()
-            async with timer:
-                await bm.func(ctx)
-            timings.append(timer.result.elapsed_seconds)
-        results.append(_compute_stats(bm, timings))
+        try:
+            # Snapshots go through the sync client; nothing else is running on the loop meanwhile
+            before = server_snapshot(ctx['db']) if server_stats else None
+            with apply_gc_mode(gc_mode), GCRecorder() as gc_recorder:
+                eviction = _Eviction(evict, ctx['db'], gc_recorder, overhead) if evict else None
+                timings, cpu_timings = await _run_async_benchmark(bm, ctx, eviction)
+            after = server_snapshot(ctx['db']) if server_stats else None
+        except Exception as e:
+            if not skip_failures:
+                raise
+            _mark_failed(progress, task, bm, e)
+            continue
+        result = _compute_stats(bm, timings, cpu_timings)
+        result.gc = gc_recorder.stats(gc_mode)
+        # Set exactly when server_stats is on; spelled out so the snapshots narrow to dicts
+        if before is not None and after is not None and overhead is not None:
+            result.server = server_delta(
+                before, after, overhead, len(timings), excluded=eviction.server if eviction else None
+            )
+        if explain or measure_wire:
+            _annotate(result, await _probe_async(bm, ctx), ctx, explain=explain, measure_wire=measure_wire)
+        if profile:
+            result.profile = await _profile_async(bm, ctx)
+        results.append(result)
         progress.update(task, completed=True, description=f'[green]{bm.library.value}: {bm.name}')
         progress.stop_task(task)
 
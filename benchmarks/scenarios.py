@@ -0,0 +1,238 @@
+import asyncio
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from rich.console import Console
+
+from benchmarks.registry import BenchmarkInfo, Library, get_benchmarks
+from benchmarks.runner import build_context, cleanup_benchmark_docs, init_beanie_models, iteration_ctx, load_benchmarks
+from benchmarks.stats import percentile
+from config import DB_NAME, SCENARIO_CONCURRENCY, SCENARIO_DURATION, SCENARIO_SEED
+from db import connect_mongoengine, disconnect_mongoengine
+from seeding.distributions import Distribution
+
+console = Console()
+
+
+@dataclass
+class Scenario:
+    """An operation mix (registered benchmark name -> weight) run for a fixed time at a fixed concurrency."""
+
+    name: str
+    description: str
+    mix: dict[str, float]
+    duration_s: float = SCENARIO_DURATION
+    concurrency: int = SCENARIO_CONCURRENCY
+    key_distribution: Distribution = Distribution.ZIPF
+
+
+PRESETS = {
+    'ycsb-a': Scenario(
+        name='ycsb-a',
+        description='Update heavy: 50% order reads, 50% order updates',
+        mix={'read_full_record_order': 50, 'update_single': 50},
+    ),
+    'ycsb-b': Scenario(
+        name='ycsb-b',
+        description='Read mostly: 95% order reads, 5% order updates',
+        mix={'read_full_record_order': 95, 'update_single': 5},
+    ),
+    'ycsb-c': Scenario(
+        name='ycsb-c',
+        description='Read only: 100% order reads',
+        mix={'read_full_record_order': 100},
+    ),
+    'ycsb-d': Scenario(
+        name='ycsb-d',
+        description='Read latest: 95% reads skewed to the newest orders, 5% order inserts',
+        mix={'read_latest_order': 95, 'insert_single_order': 5},
+        key_distribution=Distribution.LATEST,
+    ),
+    'ycsb-e': Scenario(
+        name='ycsb-e',
+        description='Short ranges: 95% 100-order scans, 5% order inserts',
+        mix={'read_100_orders': 95, 'insert_single_order': 5},
+    ),
+}
+
+
+@dataclass
+class OpStats:
+    count: int
+    median_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+
+
+@dataclass
+class ScenarioResult:
+    scenario: Scenario
+    library: Library
+    elapsed_s: float
+    total_ops: int
+    ops_per_sec: float
+    errors: int
+    ops: dict[str, OpStats] = field(default_factory=dict)
+
+
+def parse_mix(items: list[str]) -> dict[str, float]:
+    """Parse `name=weight` pairs from the command line."""
+    mix = {}
+    for item in items:
+        name, sep, weight = item.partition('=')
+        if not sep:
+            raise ValueError(f"Mix entries look like 'read_full_record_order=95', got '{item}'")
+        mix[name] = float(weight)
+    return mix
+
+
+def run_scenario(
+    scenario: Scenario,
+    library: Library | None = None,
+    db_name: str = DB_NAME,
+) -> list[ScenarioResult]:
+    load_benchmarks()
+    ops_by_lib = _resolve_mix(scenario, library)
+    families = {bm.family for ops in ops_by_lib.values() for bm in ops}
+    ctx = build_context(db_name, key_distribution=scenario.key_distribution, families=families)
+
+    results = []
+    for lib, ops in ops_by_lib.items():
+        console.print(
+            f'[bold cyan]{scenario.name}: {lib.value} ({scenario.concurrency} workers, {scenario.duration_s:g}s)...'
+        )
+        if lib == Library.BEANIE:
+            timings, errors, elapsed = asyncio.run(_run_async(scenario, ops, ctx))
+        else:
+            if lib == Library.MONGOENGINE:
+                connect_mongoengine(db_name)
+            timings, errors, elapsed = _run_threads(scenario, ops, ctx)
+            if lib == Library.MONGOENGINE:
+                disconnect_mongoengine()
+        cleanup_benchmark_docs(ctx['db'])
+        results.append(_scenario_result(scenario, lib, timings, errors, elapsed))
+
+    return results
+
+
+def _resolve_mix(scenario: Scenario, library: Library | None) -> dict[Library, list[BenchmarkInfo]]:
+    registered = defaultdict(dict)
+    for bm in get_benchmarks(library=library):
+        registered[bm.library][bm.name] = bm
+
+    unknown = [name for name in scenario.mix if not any(name in by_name for by_name in registered.values())]
+    if unknown:
+        raise ValueError(f'Unknown benchmark(s) in mix: {", ".join(unknown)}')
+
+    libraries = [library] if library else list(Library)
+    ops_by_lib = {}
+    for lib in libraries:
+        missing = [name for name in scenario.mix if name not in registered[lib]]
+        if missing:
+            console.print(f'[yellow]{lib.value} has no {", ".join(missing)}; skipping it for {scenario.name}.')
+            continue
+        ops_by_lib[lib] = [registered[lib][name] for name in scenario.mix]
+    return ops_by_lib
+
+
+def _run_threads(scenario: Scenario, ops: list[BenchmarkInfo], ctx: dict):
+    weights = list(scenario.mix.values())
+    timings = defaultdict(list)
+    errors = 0
+    lock = threading.Lock()
+
+    def worker(worker_id: int, deadline: float):
+        nonlocal errors
+        rng = random.Random(SCENARIO_SEED + worker_id)
+        worker_ctx = {**ctx, 'key_pool': ctx['key_pool'].fork(SCENARIO_SEED + worker_id)}
+        local = defaultdict(list)
+        local_errors = 0
+        while time.perf_counter() < deadline:
+            bm = rng.choices(ops, weights)[0]
+            iter_ctx = iteration_ctx(worker_ctx)
+            start = time.perf_counter()
+            try:
+                bm.func(iter_ctx)
+            except Exception:
+                local_errors += 1
+                continue
+            local[bm.name].append(time.perf_counter() - start)
+        with lock:
+            for name, values in local.items():
+                timings[name].extend(values)
+            errors += local_errors
+
+    start = time.perf_counter()
+    deadline = start + scenario.duration_s
+    with ThreadPoolExecutor(max_workers=scenario.concurrency) as pool:
+        futures = [pool.submit(worker, i, deadline) for i in range(scenario.concurrency)]
+        for f in futures:
+            f.result()
+    return timings, errors, time.perf_counter() - start
+
+
+async def _run_async(scenario: Scenario, ops: list[BenchmarkInfo], ctx: dict):
+    client = await init_beanie_models(ctx['db_name'])
+    weights = list(scenario.mix.values())
+    timings = defaultdict(list)
+    errors = 0
+
+    async def worker(worker_id: int, deadline: float):
+        nonlocal errors
+        rng = random.Random(SCENARIO_SEED + worker_id)
+        worker_ctx = {**ctx, 'key_pool': ctx['key_pool'].fork(SCENARIO_SEED + worker_id)}
+        while time.perf_counter() < deadline:
+            bm = rng.choices(ops, weights)[0]
+            iter_ctx = iteration_ctx(worker_ctx)
+            start = time.perf_counter()
+            try:
+                await bm.func(iter_ctx)
+            except Exception:
+                errors += 1
+                continue
+            timings[bm.name].append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    deadline = start + scenario.duration_s
+    await asyncio.gather(*(worker(i, deadline) for i in range(scenario.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    client.close()
+    return timings, errors, elapsed
+
+
+def _scenario_result(
+    scenario: Scenario,
+    library: Library,
+    timings: dict[str, list[float]],
+    errors: int,
+    elapsed: float,
+) -> ScenarioResult:
+    ops = {}
+    for name in scenario.mix:
+        sorted_ms = sorted(t * 1000 for t in timings.get(name, []))
+        if not sorted_ms:
+            continue
+        ops[name] = OpStats(
+            count=len(sorted_ms),
+            median_ms=statistics.median(sorted_ms),
+            p95_ms=percentile(sorted_ms, 95),
+            p99_ms=percentile(sorted_ms, 99),
+            mean_ms=statistics.mean(sorted_ms),
+        )
+    total = sum(s.count for s in ops.values())
+    return ScenarioResult(
+        scenario=scenario,
+        library=library,
+        elapsed_s=elapsed,
+        total_ops=total,
+        ops_per_sec=total / elapsed if elapsed > 0 else 0.0,
+        errors=errors,
+        ops=ops,
+    )
@@ -0,0 +1,4 @@
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    idx = min(int(len(sorted_values) * pct / 100), len(sorted_values) - 1)
+    return sorted_values[idx]
@@ -0,0 +1,33 @@
+from rich.console import Console
+
+from benchmarks.registry import Family, Library, OpType
+from benchmarks.runner import BenchmarkResult, run_benchmarks
+from config import DB_NAME, SWEEP_SIZES
+from db import get_pymongo_client
+from seeding.seeder import seed_database
+
+console = Console()
+
+
+def sweep_db_name(size: int) -> str:
+    return f'{DB_NAME}_{size}'
+
+
+def run_sweep(
+    sizes: tuple[int, ...] = SWEEP_SIZES,
+    library: Library | None = None,
+) -> dict[int, list[BenchmarkResult]]:
+    """Seed one database per collection size, then run the core read suite against each in turn."""
+    client = get_pymongo_client()
+    results = {}
+    for size in sorted(sizes):
+        db_name = sweep_db_name(size)
+        console.print(f'\n[bold underline]Collection size {size:,} ({db_name})\n')
+        seed_database(client, count=size, db_name=db_name)
+        results[size] = run_benchmarks(
+            library=library,
+            op_type=OpType.READ,
+            families=[Family.CORE],
+            db_name=db_name,
+        )
+    return results
@@ -0,0 +1,148 @@
+import statistics
+import sys
+import sysconfig
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from rich.console import Console
+
+from benchmarks.registry import BenchmarkInfo, Family, Library, OpType, get_benchmarks
+from benchmarks.runner import build_context, iteration_ctx, load_benchmarks
+from benchmarks.stats import percentile
+from config import DB_NAME, KEY_POOL_SEED, THREAD_LEVELS, THREAD_STEP_DURATION
+from db import connect_mongoengine, disconnect_mongoengine
+from seeding.distributions import Distribution
+
+console = Console()
+
+SYNC_LIBRARIES = (Library.RAW, Library.DATACLASSES_RAW, Library.MONGOENGINE)
+
+
+@dataclass
+class Interpreter:
+    version: str
+    free_threaded_build: bool
+    gil_enabled: bool  # A free-threaded build can still run with the GIL (PYTHON_GIL=1 or an incompatible extension)
+
+
+@dataclass
+class ThreadLevel:
+    threads: int
+    ops: int
+    errors: int
+    ops_per_sec: float
+    per_thread_ops_per_sec: float
+    median_ms: float
+    p99_ms: float
+    efficiency: float  # Throughput over (threads x single-thread throughput); 1.0 is linear scaling
+
+
+@dataclass
+class ThreadScalingResult:
+    benchmark: BenchmarkInfo
+    interpreter: Interpreter
+    levels: list[ThreadLevel] = field(default_factory=list)
+
+
+def interpreter_info() -> Interpreter:
+    # sys._is_gil_enabled only exists on 3.13+; older interpreters always hold the GIL
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)
+    return Interpreter(
+        version=sys.version.split()[0],
+        free_threaded_build=bool(sysconfig.get_config_var('Py_GIL_DISABLED')),
+        gil_enabled=is_gil_enabled(),
+    )
+
+
+def run_thread_scaling(
+    levels: tuple[int, ...] = THREAD_LEVELS,
+    library: Library | None = None,
+    families: list[Family] | None = None,
+    names: list[str] | None = None,
+    duration: float = THREAD_STEP_DURATION,
+    key_distribution: Distribution = Distribution.UNIFORM,
+    db_name: str = DB_NAME,
+) -> list[ThreadScalingResult]:
+    """Run each sync library's read benchmarks on 1 to many threads sharing one client."""
+    if library and library not in SYNC_LIBRARIES:
+        raise ValueError(f'{library.value} is async; thread scaling covers the sync libraries only')
+    load_benchmarks()
+    bms = [
+        b
+        for b in get_benchmarks(library=library, op_type=OpType.READ, families=families or [Family.CORE])
+        if b.library in SYNC_LIBRARIES
+    ]
+    if names:
+        bms = [b for b in bms if b.name in names]
+    if not bms:
+        raise ValueError('No sync read benchmarks match the selection')
+
+    interpreter = interpreter_info()
+    gil = 'enabled' if interpreter.gil_enabled else 'disabled'
+    console.print(f'[bold]Python {interpreter.version}, GIL {gil}')
+
+    ctx = build_context(db_name, key_distribution=key_distribution, families={b.family for b in bms})
+    uses_mongoengine = any(b.library == Library.MONGOENGINE for b in bms)
+    if uses_mongoengine:
+        connect_mongoengine(db_name)
+
+    results = []
+    for bm in bms:
+        result = ThreadScalingResult(benchmark=bm, interpreter=interpreter)
+        for threads in sorted(levels):
+            console.print(f'[bold cyan]{bm.library.value}: {bm.name} on {threads} threads ({duration:g}s)...')
+            baseline = result.levels[0] if result.levels else None
+            result.levels.append(_run_level(bm, ctx, threads, duration, baseline))
+        results.append(result)
+
+    if uses_mongoengine:
+        disconnect_mongoengine()
+    return results
+
+
+def _run_level(bm: BenchmarkInfo, ctx: dict, threads: int, duration: float, baseline: ThreadLevel | None):
+    ctx['key_pool'].reset()
+    latencies, errors = [], 0
+    lock = threading.Lock()
+    # Every thread starts timing together, so thread start-up doesn't count against the first few
+    barrier = threading.Barrier(threads)
+
+    def worker(worker_id: int) -> float:
+        nonlocal errors
+        worker_ctx = {**ctx, 'key_pool': ctx['key_pool'].fork(KEY_POOL_SEED + worker_id)}
+        local, local_errors = [], 0
+        barrier.wait()
+        started = time.perf_counter()
+        deadline = started + duration
+        while time.perf_counter() < deadline:
+            iter_ctx = iteration_ctx(worker_ctx)
+            start = time.perf_counter()
+            try:
+                bm.func(iter_ctx)
+            except Exception:
+                local_errors += 1
+                continue
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        elapsed = max(f.result() for f in [pool.submit(worker, i) for i in range(threads)])
+
+    sorted_ms = sorted(t * 1000 for t in latencies)
+    ops_per_sec = len(sorted_ms) / elapsed if elapsed > 0 else 0.0
+    single = baseline.ops_per_sec / baseline.threads if baseline else ops_per_sec / threads
+    return ThreadLevel(
+        threads=threads,
+        ops=len(sorted_ms),
+        errors=errors,
+        ops_per_sec=ops_per_sec,
+        per_thread_ops_per_sec=ops_per_sec / threads,
+        median_ms=statistics.median(sorted_ms) if sorted_ms else 0.0,
+        p99_ms=percentile(sorted_ms, 99) if sorted_ms else 0.0,
+        efficiency=ops_per_sec / (threads * single) if single > 0 else 0.0,
+    )
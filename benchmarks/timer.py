@@ -6,16 +6,19 @@ from dataclasses import dataclass
 @dataclass
 class TimingResult:
     elapsed_seconds: float = 0.0
+    cpu_seconds: float = 0.0
 
 
 @contextmanager
 def sync_timer():
     result = TimingResult()
+    cpu_start = time.process_time()
     start = time.perf_counter()
     try:
         yield result
     finally:
         result.elapsed_seconds = time.perf_counter() - start
+        result.cpu_seconds = time.process_time() - cpu_start
 
 
 class AsyncTimer:
@@ -23,8 +26,10 @@ class AsyncTimer:
         self.result = TimingResult()
 
     async def __aenter__(self):
+        self._cpu_start = time.process_time()
         self._start = time.perf_counter()
         return self.result
 
     async def __aexit__(self, *exc):
         self.result.elapsed_seconds = time.perf_counter() - self._start
+        self.result.cpu_seconds = time.process_time() - self._cpu_start
@@ -3,3 +3,91 @@ DB_NAME = 'orm_benchmark'
 ITERATIONS = 10
 SEED_COUNT = 100_000
 BATCH_SIZE = 10_000
+
+# Workload skew (seeding and per-iteration key selection)
+KEY_POOL_SIZE = 1_000
+KEY_POOL_SEED = 7
+CUSTOMER_POOL_SIZE = 20_000
+ZIPF_THETA = 0.99
+HOTSPOT_FRACTION = 0.2
+HOTSPOT_OP_FRACTION = 0.8
+
+# Document-size family: target BSON size per tier in the orders_large collection
+LARGE_ORDER_SIZES = {'1kb': 1_000, '10kb': 10_000, '100kb': 100_000, '1mb': 1_000_000}
+LARGE_ORDERS_PER_SIZE = 20
+
+# Data-volume sweep: one database per collection size
+SWEEP_SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+
+# Pagination family
+PAGE_SIZE = 20
+PAGE_DEPTHS = (1, 10, 100, 1000)
+
+# Bulk-write family: order_numbers preselected for the 1,000 / 10,000 order updates
+BULK_UPDATE_KEYS = 10_000
+
+# Mixed-workload scenarios: defaults for each library's run
+SCENARIO_DURATION = 30.0
+SCENARIO_CONCURRENCY = 8
+SCENARIO_SEED = 11
+# read_latest_order picks one of the newest orders by rank (newest first), drawn from the key pool like any key
+RECENT_ORDER_WINDOW = 1_000
+
+# Open-loop driver: arrival rate ramps by OPENLOOP_RATE_FACTOR per step until the library saturates
+OPENLOOP_START_RATE = 100.0
+OPENLOOP_RATE_FACTOR = 1.5
+OPENLOOP_STEP_DURATION = 10.0
+OPENLOOP_MAX_STEPS = 12
+OPENLOOP_MAX_INFLIGHT = 64
+OPENLOOP_DRAIN_S = 1.0
+OPENLOOP_KNEE_LATENCY_FACTOR = 10.0
+
+# Write-concern matrix: client options per cell (ingest runs w=1 unjournaled, billing majority + journal)
+WRITE_CONCERNS = {
+    'w0': {'w': 0},
+    'w1': {'w': 1, 'journal': False},
+    'w1_j': {'w': 1, 'journal': True},
+    'majority': {'w': 'majority', 'journal': True},
+}
+
+# Wire-compression matrix: zlib levels to compare against the uncompressed baseline
+ZLIB_LEVELS = (1, 6, 9)
+
+# Multi-key fetch family: the largest $in a repository sends in one query
+GET_MANY_CHUNK_SIZE = 500
+
+# Write-behind ingest: a buffer flushes at WRITE_BEHIND_MAX_BATCH docs or once its oldest doc has waited the delay
+WRITE_BEHIND_MAX_BATCH = 500
+WRITE_BEHIND_MAX_DELAY_S = 0.005
+INGEST_DURATION = 10.0
+INGEST_CONCURRENCY = 32
+
+# Beanie concurrency sweep: concurrent tasks per level, and how often the loop-lag probe wakes
+CONCURRENCY_LEVELS = (1, 8, 32, 128, 512)
+CONCURRENCY_STEP_DURATION = 5.0
+LOOP_LAG_INTERVAL_S = 0.01
+
+# Thread-scaling mode for the sync libraries (meant for free-threaded builds as well as regular ones)
+THREAD_LEVELS = (1, 2, 4, 8, 16)
+THREAD_STEP_DURATION = 5.0
+
+# Multi-process driver: worker processes, each with its own client, and how long each runs
+DISTRIBUTED_WORKERS = 4
+DISTRIBUTED_DURATION = 10.0
+DISTRIBUTED_START_TIMEOUT = 120.0
+
+# Profiling (run --profile): where pstats and collapsed-stack files go, and the stack sampler's period
+PROFILE_DIR = 'output/profiles'
+PROFILE_SAMPLE_INTERVAL_S = 0.001
+
+# Cold-cache mode (run --cache cold): WiredTiger cache size for the run, and the ballast scanned before every
+# iteration to evict the working set, as a multiple of that size in documents of COLD_BALLAST_DOC_BYTES
+COLD_CACHE_SIZE_MB = 256
+COLD_BALLAST_FACTOR = 2.0
+COLD_BALLAST_DOC_BYTES = 64_000
+
+# In-memory backend (run --backend memory): mongomock has no indexes to speak of, so it is seeded smaller
+MEMORY_SEED_COUNT = 10_000
+
+# Client-only replay: timed decode + hydration passes over each captured payload
+REPLAY_ITERATIONS = 200
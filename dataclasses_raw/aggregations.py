@@ -0,0 +1,75 @@
+from benchmarks import pipelines
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.dataclass_models import (
+    basket_size_from_doc,
+    dashboard_facet_from_doc,
+    monthly_orders_from_doc,
+    sku_quantity_from_doc,
+    status_revenue_from_doc,
+)
+
+
+@benchmark(
+    name='agg_revenue_by_status',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Revenue and order count by status over one year ($match + $group), convert to dataclasses',
+    family=Family.AGGREGATION,
+)
+def agg_revenue_by_status(ctx):
+    db = ctx['db']
+    [status_revenue_from_doc(doc) for doc in db.orders.aggregate(pipelines.revenue_by_status())]
+
+
+@benchmark(
+    name='agg_top_skus',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Top 10 SKUs by quantity over one year ($unwind line_items + $group), convert to dataclasses',
+    family=Family.AGGREGATION,
+)
+def agg_top_skus(ctx):
+    db = ctx['db']
+    [sku_quantity_from_doc(doc) for doc in db.orders.aggregate(pipelines.top_skus())]
+
+
+@benchmark(
+    name='agg_monthly_orders',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Monthly order counts over one year ($group by $year/$month), convert to dataclasses',
+    family=Family.AGGREGATION,
+)
+def agg_monthly_orders(ctx):
+    db = ctx['db']
+    [monthly_orders_from_doc(doc) for doc in db.orders.aggregate(pipelines.monthly_orders())]
+
+
+@benchmark(
+    name='agg_basket_by_payment',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Average basket size by payment method over one year ($group + $avg), convert to dataclasses',
+    family=Family.AGGREGATION,
+)
+def agg_basket_by_payment(ctx):
+    db = ctx['db']
+    [basket_size_from_doc(doc) for doc in db.orders.aggregate(pipelines.basket_by_payment())]
+
+
+@benchmark(
+    name='agg_dashboard_facet',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Order counts by status and by payment method in one pass ($facet), convert to dataclass',
+    family=Family.AGGREGATION,
+)
+def agg_dashboard_facet(ctx):
+    db = ctx['db']
+    doc = next(db.orders.aggregate(pipelines.dashboard_facet()))
+    dashboard_facet_from_doc(doc)
@@ -0,0 +1,35 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+
+
+@benchmark(
+    name='covered_category_name',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description="Select only 'name' from one Category by slug, answered from the (slug, name) index",
+    family=Family.COVERED,
+)
+def covered_category_name(ctx):
+    db = ctx['db']
+    slug = ctx['targets']['category_slug']
+    doc = db.categories.find_one({'slug': slug}, {'name': 1, '_id': 0}, hint='slug_1_name_1')
+    doc['name']  # just access the field, no full dataclass needed for projection
+
+
+@benchmark(
+    name='covered_order_email',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description="Select only 'customer_email' from one Order, answered from the (order_number, customer_email) index",
+    family=Family.COVERED,
+)
+def covered_order_email(ctx):
+    db = ctx['db']
+    order_number = ctx['targets']['order_number']
+    doc = db.orders.find_one(
+        {'order_number': order_number},
+        {'customer_email': 1, '_id': 0},
+        hint='order_number_1_customer_email_1',
+    )
+    doc['customer_email']
@@ -0,0 +1,91 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+from dataclasses_raw.repositories import OrderRepository
+from models.dataclass_models import Order
+
+
+def _loop(repo: OrderRepository, keys: list[str]) -> list[Order | None]:
+    return [repo.get(key) for key in keys]
+
+
+@benchmark(
+    name='multi_get_10_loop',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders by order_number, one OrderRepository.get per key',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'loop'},
+)
+def multi_get_10_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    _loop(OrderRepository(ctx['db']), keys)
+
+
+@benchmark(
+    name='multi_get_10_batched',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders with OrderRepository.get_many (chunked $in, input order)',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'batched'},
+)
+def multi_get_10_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    OrderRepository(ctx['db']).get_many(keys)
+
+
+@benchmark(
+    name='multi_get_100_loop',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders by order_number, one OrderRepository.get per key',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'loop'},
+)
+def multi_get_100_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    _loop(OrderRepository(ctx['db']), keys)
+
+
+@benchmark(
+    name='multi_get_100_batched',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders with OrderRepository.get_many (chunked $in, input order)',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'batched'},
+)
+def multi_get_100_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    OrderRepository(ctx['db']).get_many(keys)
+
+
+@benchmark(
+    name='multi_get_1000_loop',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders by order_number, one OrderRepository.get per key',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'loop'},
+)
+def multi_get_1000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _loop(OrderRepository(ctx['db']), keys)
+
+
+@benchmark(
+    name='multi_get_1000_batched',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders with OrderRepository.get_many (chunked $in, input order)',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'batched'},
+)
+def multi_get_1000_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    OrderRepository(ctx['db']).get_many(keys)
@@ -1,4 +1,4 @@
-from benchmarks.registry import Library, OpType, benchmark
+from benchmarks.registry import Family, Library, OpType, benchmark
 from models.dataclass_models import category_from_doc, order_from_doc
 
 
@@ -133,3 +133,19 @@ def read_1000_categories(ctx):
 def read_10000_categories(ctx):
     db = ctx['db']
     [category_from_doc(doc) for doc in db.categories.find().sort('view_count', -1).limit(10000)]
+
+
+@benchmark(
+    name='read_latest_order',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one of the most recently created Orders by rank, convert to dataclass',
+    family=Family.SCENARIO,
+)
+def read_latest_order(ctx):
+    db = ctx['db']
+    rank = ctx['targets']['recent_rank']
+    doc = next(db.orders.find().sort('created_at', -1).skip(rank).limit(1), None)
+    if doc:
+        order_from_doc(doc)
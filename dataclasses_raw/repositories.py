@@ -0,0 +1,45 @@
+from typing import Callable
+
+from config import GET_MANY_CHUNK_SIZE
+from models.dataclass_models import category_from_doc, order_from_doc
+
+
+class Repository:
+    """Key-based reads from one collection, hydrated into dataclasses."""
+
+    collection: str
+    key_field: str
+    from_doc: Callable
+
+    def __init__(self, db, chunk_size: int = GET_MANY_CHUNK_SIZE):
+        self._collection = db[self.collection]
+        self.chunk_size = chunk_size
+
+    def get(self, key):
+        doc = self._collection.find_one({self.key_field: key})
+        return self.from_doc(doc) if doc else None
+
+    def get_many(self, keys: list) -> list:
+        """Fetch every key with one `$in` query per chunk.
+
+        Results follow the order of `keys`; a key with no document comes back as None.
+        """
+        unique = list(dict.fromkeys(keys))
+        found = {}
+        for start in range(0, len(unique), self.chunk_size):
+            chunk = unique[start : start + self.chunk_size]
+            for doc in self._collection.find({self.key_field: {'$in': chunk}}):
+                found[doc[self.key_field]] = self.from_doc(doc)
+        return [found.get(key) for key in keys]
+
+
+class OrderRepository(Repository):
+    collection = 'orders'
+    key_field = 'order_number'
+    from_doc = staticmethod(order_from_doc)
+
+
+class CategoryRepository(Repository):
+    collection = 'categories'
+    key_field = 'slug'
+    from_doc = staticmethod(category_from_doc)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from benchmarks.registry import Library, OpType, benchmark
+from benchmarks.registry import Family, Library, OpType, benchmark
 from seeding.generator import DataGenerator
 
 _gen = DataGenerator(seed=99)
@@ -36,6 +36,21 @@ def insert_single(ctx):
     db.categories.insert_one(_make_category())
 
 
+@benchmark(
+    name='insert_single_order',
+    library=Library.DATACLASSES_RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Insert one new Order document, created now (raw + dataclass layer)',
+    family=Family.SCENARIO,
+)
+def insert_single_order(ctx):
+    db = ctx['db']
+    doc = _make_order()
+    doc['created_at'] = doc['updated_at'] = datetime.now()
+    db.orders.insert_one(doc)
+
+
 @benchmark(
     name='insert_batch_100',
     library=Library.DATACLASSES_RAW,
@@ -4,25 +4,70 @@ from pymongo import MongoClient
 
 from config import DB_NAME, MONGO_URI
 
+BACKENDS = ('mongodb', 'memory')
 
-def get_pymongo_client() -> MongoClient:
-    return MongoClient(MONGO_URI)
+# 'memory' serves every client from one in-process mongomock store instead of MONGO_URI
+_backend = 'mongodb'
+_memory_store = None
+_MISSING_MEMORY_DEPS = 'The memory backend needs mongomock and mongomock-motor: uv pip install -e ".[memory]"'
 
 
-def get_pymongo_db():
-    return get_pymongo_client()[DB_NAME]
+def use_backend(name: str):
+    global _backend, _memory_store
+    if name not in BACKENDS:
+        raise ValueError(f'Unknown backend: {name}')
+    if name == 'memory' and _memory_store is None:
+        _memory_store = _mongomock().store.ServerStore()
+    _backend = name
 
 
-def get_motor_client() -> AsyncIOMotorClient:
-    return AsyncIOMotorClient(MONGO_URI)
+def is_memory_backend() -> bool:
+    return _backend == 'memory'
 
 
-def get_motor_db():
-    return get_motor_client()[DB_NAME]
+def _mongomock():
+    # Optional: only the memory backend needs mongomock, so it's imported on first use
+    try:
+        import mongomock
+        import mongomock.store
+    except ImportError:
+        raise RuntimeError(_MISSING_MEMORY_DEPS) from None
+    return mongomock
 
 
-def connect_mongoengine():
-    mongoengine.connect(DB_NAME, host=MONGO_URI)
+def get_pymongo_client(**client_options) -> MongoClient:
+    if is_memory_backend():
+        return _mongomock().MongoClient(MONGO_URI, _store=_memory_store, **client_options)
+    return MongoClient(MONGO_URI, **client_options)
+
+
+def get_pymongo_db(db_name: str = DB_NAME, **client_options):
+    return get_pymongo_client(**client_options)[db_name]
+
+
+def get_motor_client(**client_options) -> AsyncIOMotorClient:
+    if is_memory_backend():
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            raise RuntimeError(_MISSING_MEMORY_DEPS) from None
+        return AsyncMongoMockClient(MONGO_URI, _store=_memory_store, **client_options)
+    return AsyncIOMotorClient(MONGO_URI, **client_options)
+
+
+def get_motor_db(db_name: str = DB_NAME, **client_options):
+    return get_motor_client(**client_options)[db_name]
+
+
+def connect_mongoengine(db_name: str = DB_NAME, **client_options):
+    if is_memory_backend():
+        from models import mongoengine_models
+
+        # No indexes on the memory backend (see seed_database), so MongoEngine mustn't build its own on first use
+        for model in (mongoengine_models.CategoryDoc, mongoengine_models.OrderDoc, mongoengine_models.LargeOrderDoc):
+            model._meta['auto_create_index'] = False
+        client_options = {**client_options, 'mongo_client_class': _mongomock().MongoClient, '_store': _memory_store}
+    mongoengine.connect(db_name, host=MONGO_URI, **client_options)
 
 
 def disconnect_mongoengine():
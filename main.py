@@ -1,8 +1,37 @@
 import argparse
+import os
+from collections.abc import Collection
+from dataclasses import replace
 
-from benchmarks.registry import Library, OpType
-from config import DB_NAME, SEED_COUNT
-from db import get_pymongo_client
+from benchmarks.cache import CacheMode
+from benchmarks.gc_monitor import GCMode
+from benchmarks.registry import Family, Library, OpType
+from config import (
+    CONCURRENCY_LEVELS,
+    CONCURRENCY_STEP_DURATION,
+    DB_NAME,
+    DISTRIBUTED_DURATION,
+    DISTRIBUTED_WORKERS,
+    INGEST_CONCURRENCY,
+    INGEST_DURATION,
+    KEY_POOL_SIZE,
+    MEMORY_SEED_COUNT,
+    OPENLOOP_MAX_INFLIGHT,
+    OPENLOOP_RATE_FACTOR,
+    OPENLOOP_START_RATE,
+    OPENLOOP_STEP_DURATION,
+    PROFILE_DIR,
+    REPLAY_ITERATIONS,
+    SCENARIO_CONCURRENCY,
+    SCENARIO_DURATION,
+    SEED_COUNT,
+    SWEEP_SIZES,
+    THREAD_LEVELS,
+    THREAD_STEP_DURATION,
+    WRITE_CONCERNS,
+)
+from db import BACKENDS, get_pymongo_client, is_memory_backend, use_backend
+from seeding.distributions import Distribution
 
 
 def main():
@@ -12,6 +41,18 @@ def main():
     # seed command
     seed_parser = subparsers.add_parser('seed', help='Seed the database')
     seed_parser.add_argument('--force', action='store_true', help='Drop and re-seed')
+    seed_parser.add_argument(
+        '--count',
+        type=int,
+        default=SEED_COUNT,
+        help=f'Documents per collection; tops up an existing seed (default {SEED_COUNT:,})',
+    )
+    seed_parser.add_argument(
+        '--distribution',
+        choices=['uniform', 'zipf', 'hotspot'],
+        default='uniform',
+        help='Popularity skew for customer_email, status and line-item SKUs',
+    )
 
     # reset command
     subparsers.add_parser('reset', help='Drop the benchmark database')
@@ -25,7 +66,323 @@ def main():
         choices=['raw', 'dataclasses_raw', 'beanie', 'mongoengine'],
         help='Run benchmarks for a specific library only',
     )
+    run_parser.add_argument(
+        '--family',
+        nargs='+',
+        choices=[f.value for f in Family] + ['all'],
+        default=[Family.CORE.value],
+        help='Benchmark families to run (default: core)',
+    )
     run_parser.add_argument('--no-charts', action='store_true', help='Skip chart generation')
+    run_parser.add_argument(
+        '--key-dist',
+        choices=['uniform', 'zipf', 'latest'],
+        default='uniform',
+        help='How each iteration picks its lookup key from the key pool',
+    )
+    run_parser.add_argument(
+        '--key-pool',
+        type=int,
+        default=KEY_POOL_SIZE,
+        help=f'Number of preselected lookup keys per collection (default {KEY_POOL_SIZE:,})',
+    )
+    run_parser.add_argument(
+        '--write-concern',
+        nargs='+',
+        choices=list(WRITE_CONCERNS) + ['all'],
+        help='Run the write suite once per write concern and compare the cells',
+    )
+    run_parser.add_argument(
+        '--compression',
+        action='store_true',
+        help='Re-run the bulk read and batch insert suites under each wire compressor',
+    )
+    run_parser.add_argument(
+        '--explain',
+        action='store_true',
+        help="Capture each benchmark's queries and report their explain() plans",
+    )
+    run_parser.add_argument(
+        '--gc',
+        nargs='+',
+        choices=[m.value for m in GCMode],
+        help='Report GC collections and pauses; several modes re-run the suite once per mode and compare them',
+    )
+    run_parser.add_argument(
+        '--server-stats',
+        action='store_true',
+        help='Snapshot serverStatus and $collStats around each benchmark and report server-side work per call',
+    )
+    run_parser.add_argument(
+        '--cache',
+        choices=[m.value for m in CacheMode],
+        default=CacheMode.WARM.value,
+        help='cold: also run with the working set evicted before every iteration, and compare it with warm',
+    )
+    run_parser.add_argument(
+        '--backend',
+        choices=list(BACKENDS),
+        default='mongodb',
+        help='mongodb (MONGO_URI) or memory: an in-process mongomock store, seeded fresh on every run',
+    )
+    run_parser.add_argument(
+        '--wire',
+        action='store_true',
+        help='Record round trips, bytes and documents per call; adds docs/s and MB/s',
+    )
+    run_parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=f'Profile each benchmark in an extra pass; pstats and collapsed stacks go to {PROFILE_DIR}/',
+    )
+
+    # sweep command
+    sweep_parser = subparsers.add_parser('sweep', help='Run the read suite across collection sizes')
+    sweep_parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=list(SWEEP_SIZES),
+        help='Collection sizes to seed and benchmark, one database each',
+    )
+    sweep_parser.add_argument(
+        '--library',
+        choices=['raw', 'dataclasses_raw', 'beanie', 'mongoengine'],
+        help='Run benchmarks for a specific library only',
+    )
+    sweep_parser.add_argument('--no-charts', action='store_true', help='Skip chart generation')
+
+    # scenario command
+    scenario_parser = subparsers.add_parser('scenario', help='Run a mixed read/write workload for a fixed duration')
+    scenario_group = scenario_parser.add_mutually_exclusive_group()
+    scenario_group.add_argument(
+        '--preset',
+        choices=['ycsb-a', 'ycsb-b', 'ycsb-c', 'ycsb-d', 'ycsb-e'],
+        default='ycsb-b',
+        help='YCSB-style operation mix (default: ycsb-b)',
+    )
+    scenario_group.add_argument(
+        '--mix',
+        nargs='+',
+        metavar='NAME=WEIGHT',
+        help='Custom mix of registered benchmarks, e.g. read_full_record_order=95 update_single=5',
+    )
+    scenario_parser.add_argument(
+        '--duration',
+        type=float,
+        default=SCENARIO_DURATION,
+        help=f'Seconds to run the mix per library (default {SCENARIO_DURATION:g})',
+    )
+    scenario_parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=SCENARIO_CONCURRENCY,
+        help=f'Concurrent workers: threads for sync libraries, tasks for Beanie (default {SCENARIO_CONCURRENCY})',
+    )
+    scenario_parser.add_argument(
+        '--key-dist',
+        choices=['uniform', 'zipf', 'latest'],
+        help="Override the scenario's key distribution",
+    )
+    scenario_parser.add_argument(
+        '--library',
+        choices=['raw', 'dataclasses_raw', 'beanie', 'mongoengine'],
+        help='Run the scenario for a specific library only',
+    )
+
+    # openloop command
+    openloop_parser = subparsers.add_parser('openloop', help='Ramp a constant arrival rate to find saturation')
+    openloop_parser.add_argument(
+        '--benchmark',
+        default='read_full_record_order',
+        help='Registered benchmark to drive (default: read_full_record_order)',
+    )
+    openloop_parser.add_argument(
+        '--library',
+        choices=['raw', 'dataclasses_raw', 'beanie', 'mongoengine'],
+        help='Drive a specific library only',
+    )
+    openloop_parser.add_argument(
+        '--start-rate',
+        type=float,
+        default=OPENLOOP_START_RATE,
+        help=f'First arrival rate in ops/s (default {OPENLOOP_START_RATE:g})',
+    )
+    openloop_parser.add_argument(
+        '--rate-factor',
+        type=float,
+        default=OPENLOOP_RATE_FACTOR,
+        help=f'Rate multiplier between steps (default {OPENLOOP_RATE_FACTOR:g})',
+    )
+    openloop_parser.add_argument(
+        '--step-duration',
+        type=float,
+        default=OPENLOOP_STEP_DURATION,
+        help=f'Seconds per rate step (default {OPENLOOP_STEP_DURATION:g})',
+    )
+    openloop_parser.add_argument(
+        '--max-inflight',
+        type=int,
+        default=OPENLOOP_MAX_INFLIGHT,
+        help=f'Concurrent in-flight operations: threads or tasks (default {OPENLOOP_MAX_INFLIGHT})',
+    )
+    openloop_parser.add_argument(
+        '--key-dist',
+        choices=['uniform', 'zipf', 'latest'],
+        default='uniform',
+        help='How each operation picks its lookup key from the key pool',
+    )
+    openloop_parser.add_argument('--no-charts', action='store_true', help='Skip chart generation')
+
+    # ingest command
+    ingest_parser = subparsers.add_parser(
+        'ingest', help='Sustained single-event inserts, direct vs write-behind batching'
+    )
+    ingest_parser.add_argument(
+        '--duration',
+        type=float,
+        default=INGEST_DURATION,
+        help=f'Seconds per library and mode (default {INGEST_DURATION:g})',
+    )
+    ingest_parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=INGEST_CONCURRENCY,
+        help=f'Concurrent producers: threads for sync libraries, tasks for Beanie (default {INGEST_CONCURRENCY})',
+    )
+    ingest_parser.add_argument(
+        '--library',
+        choices=['raw', 'dataclasses_raw', 'beanie'],
+        help='Run a specific library only',
+    )
+
+    # concurrency command
+    concurrency_parser = subparsers.add_parser(
+        'concurrency', help='Run Beanie reads at rising task concurrency, with event-loop lag'
+    )
+    concurrency_parser.add_argument(
+        '--levels',
+        nargs='+',
+        type=int,
+        default=list(CONCURRENCY_LEVELS),
+        help='Concurrent tasks per level (default: 1 8 32 128 512)',
+    )
+    concurrency_parser.add_argument(
+        '--duration',
+        type=float,
+        default=CONCURRENCY_STEP_DURATION,
+        help=f'Seconds per level (default {CONCURRENCY_STEP_DURATION:g})',
+    )
+    concurrency_parser.add_argument(
+        '--family',
+        nargs='+',
+        choices=[f.value for f in Family] + ['all'],
+        default=[Family.CORE.value],
+        help='Benchmark families to sweep (default: core)',
+    )
+    concurrency_parser.add_argument('--benchmark', nargs='+', help='Sweep only these registered benchmarks')
+    concurrency_parser.add_argument(
+        '--key-dist',
+        choices=['uniform', 'zipf', 'latest'],
+        default='uniform',
+        help='How each operation picks its lookup key from the key pool',
+    )
+    concurrency_parser.add_argument('--no-charts', action='store_true', help='Skip chart generation')
+
+    # threads command
+    threads_parser = subparsers.add_parser('threads', help='Run the sync read suites on 1 to many threads')
+    threads_parser.add_argument(
+        '--levels',
+        nargs='+',
+        type=int,
+        default=list(THREAD_LEVELS),
+        help='Thread counts to run (default: 1 2 4 8 16)',
+    )
+    threads_parser.add_argument(
+        '--duration',
+        type=float,
+        default=THREAD_STEP_DURATION,
+        help=f'Seconds per thread count (default {THREAD_STEP_DURATION:g})',
+    )
+    threads_parser.add_argument(
+        '--library',
+        choices=['raw', 'dataclasses_raw', 'mongoengine'],
+        help='Run a specific sync library only',
+    )
+    threads_parser.add_argument(
+        '--family',
+        nargs='+',
+        choices=[f.value for f in Family] + ['all'],
+        default=[Family.CORE.value],
+        help='Benchmark families to run (default: core)',
+    )
+    threads_parser.add_argument('--benchmark', nargs='+', help='Run only these registered benchmarks')
+    threads_parser.add_argument(
+        '--key-dist',
+        choices=['uniform', 'zipf', 'latest'],
+        default='uniform',
+        help='How each operation picks its lookup key from the key pool',
+    )
+    threads_parser.add_argument('--no-charts', action='store_true', help='Skip chart generation')
+
+    # distributed command
+    distributed_parser = subparsers.add_parser(
+        'distributed', help='Run a benchmark or scenario mix on several worker processes'
+    )
+    distributed_group = distributed_parser.add_mutually_exclusive_group(required=True)
+    distributed_group.add_argument('--benchmark', help='Registered benchmark to run on every worker')
+    distributed_group.add_argument(
+        '--preset',
+        choices=['ycsb-a', 'ycsb-b', 'ycsb-c', 'ycsb-d', 'ycsb-e'],
+        help='Scenario operation mix to run on every worker',
+    )
+    distributed_group.add_argument(
+        '--mix',
+        nargs='+',
+        metavar='NAME=WEIGHT',
+        help='Custom mix of registered benchmarks, e.g. read_full_record_order=95 update_single=5',
+    )
+    distributed_parser.add_argument(
+        '--workers',
+        type=int,
+        default=DISTRIBUTED_WORKERS,
+        help=f'Worker processes, each with its own client (default {DISTRIBUTED_WORKERS})',
+    )
+    distributed_parser.add_argument(
+        '--duration',
+        type=float,
+        default=DISTRIBUTED_DURATION,
+        help=f'Seconds each worker runs (default {DISTRIBUTED_DURATION:g})',
+    )
+    distributed_parser.add_argument(
+        '--library',
+        choices=['raw', 'dataclasses_raw', 'beanie', 'mongoengine'],
+        help='Run a specific library only',
+    )
+    distributed_parser.add_argument(
+        '--key-dist',
+        choices=['uniform', 'zipf', 'latest'],
+        help="How each operation picks its lookup key (default: the preset's, else uniform)",
+    )
+
+    # replay command
+    replay_parser = subparsers.add_parser(
+        'replay', help='Time decoding and hydration alone, over BSON payloads captured once from the server'
+    )
+    replay_parser.add_argument(
+        '--benchmark', nargs='+', help='Raw read benchmarks to capture (default: the replay suite)'
+    )
+    replay_parser.add_argument(
+        '--library',
+        choices=['raw', 'dataclasses_raw', 'beanie', 'mongoengine'],
+        help='Replay a specific library only',
+    )
+    replay_parser.add_argument(
+        '--iterations',
+        type=int,
+        default=REPLAY_ITERATIONS,
+        help=f'Timed passes over each payload (default {REPLAY_ITERATIONS})',
+    )
 
     args = parser.parse_args()
 
@@ -35,13 +392,29 @@ def main():
         _cmd_reset()
     elif args.command == 'run':
         _cmd_run(args)
+    elif args.command == 'sweep':
+        _cmd_sweep(args)
+    elif args.command == 'scenario':
+        _cmd_scenario(args)
+    elif args.command == 'openloop':
+        _cmd_openloop(args)
+    elif args.command == 'ingest':
+        _cmd_ingest(args)
+    elif args.command == 'concurrency':
+        _cmd_concurrency(args)
+    elif args.command == 'threads':
+        _cmd_threads(args)
+    elif args.command == 'distributed':
+        _cmd_distributed(args)
+    elif args.command == 'replay':
+        _cmd_replay(args)
 
 
 def _cmd_seed(args):
     from seeding.seeder import seed_database
 
     client = get_pymongo_client()
-    seed_database(client, force=args.force)
+    seed_database(client, force=args.force, distribution=Distribution(args.distribution), count=args.count)
 
 
 def _cmd_reset():
@@ -51,40 +424,394 @@ def _cmd_reset():
     reset_database(client)
 
 
+def _ensure_seeded(client, families: list[Family]):
+    """Seed the collections the families read if they're short, otherwise just create any missing indexes."""
+    from seeding.seeder import ensure_indexes, seed_database, seed_large_orders
+
+    db = client[DB_NAME]
+    memory = is_memory_backend()
+    if memory:
+        # Every query is a full scan in mongomock, so the in-memory store gets a smaller seed and no indexes
+        seed_database(client, count=MEMORY_SEED_COUNT, indexes=False)
+    elif db.categories.estimated_document_count() < SEED_COUNT or db.orders.estimated_document_count() < SEED_COUNT:
+        print('Database not fully seeded. Seeding now...')
+        seed_database(client)
+    else:
+        ensure_indexes(client)
+    if Family.DOC_SIZE in families:
+        seed_large_orders(client, indexes=not memory)
+
+
+def _families_of(names: Collection[str]) -> list[Family]:
+    """The families of the named benchmarks, so a mix or suite only seeds the data it reads."""
+    from benchmarks.registry import get_benchmarks
+    from benchmarks.runner import load_benchmarks
+
+    load_benchmarks()
+    return list({b.family for b in get_benchmarks() if b.name in names})
+
+
 def _cmd_run(args):
     from benchmarks.runner import run_benchmarks
     from reporting.charts import generate_charts
     from reporting.tables import print_results
-    from seeding.seeder import seed_database
+
+    families = list(Family) if 'all' in args.family else [Family(f) for f in args.family]
+
+    # Each matrix mode re-runs the suite once per cell, so only one can drive a run
+    matrix_modes = [
+        flag
+        for flag, on in [
+            ('--write-concern', bool(args.write_concern)),
+            ('--compression', args.compression),
+            ('--gc with several modes', bool(args.gc) and len(args.gc) > 1),
+            ('--cache cold', args.cache == CacheMode.COLD.value),
+        ]
+        if on
+    ]
+    if len(matrix_modes) > 1:
+        raise SystemExit(f'{" and ".join(matrix_modes)} each re-run the suite per cell; pick one')
+    if matrix_modes and args.profile:
+        # Profiles are written per library and benchmark, so each cell would overwrite the last
+        raise SystemExit(f'--profile cannot be combined with {matrix_modes[0]}')
+
+    memory = args.backend == 'memory'
+    if memory:
+        # mongomock has no explain, serverStatus, hints or command monitoring to report on, and ignores write concerns
+        unsupported = [
+            flag
+            for flag, on in [
+                ('--explain', args.explain),
+                ('--server-stats', args.server_stats),
+                ('--wire', args.wire),
+                ('--compression', args.compression),
+                ('--write-concern', bool(args.write_concern)),
+                ('--cache cold', args.cache == CacheMode.COLD.value),
+                ('--family covered', Family.COVERED in families),
+            ]
+            if on
+        ]
+        if unsupported:
+            raise SystemExit(f'--backend memory does not support {", ".join(unsupported)}')
+        use_backend('memory')
 
     # Auto-seed if needed
-    client = get_pymongo_client()
-    db = client[DB_NAME]
-    cat_count = db.categories.estimated_document_count()
-    ord_count = db.orders.estimated_document_count()
-    if cat_count < SEED_COUNT or ord_count < SEED_COUNT:
-        print('Database not fully seeded. Seeding now...')
-        seed_database(client)
+    _ensure_seeded(get_pymongo_client(), families)
 
     # Determine filters
     library = Library(args.library) if args.library else None
+    options = _run_options(args, families, memory)
 
-    op_type = None
-    if args.reads and not args.writes:
-        op_type = OpType.READ
-    elif args.writes and not args.reads:
-        op_type = OpType.WRITE
+    if args.write_concern:
+        _run_write_concern_matrix(args, library, options)
+        return
+    if args.compression:
+        _run_compression_matrix(args, library, options)
+        return
+    if args.gc and len(args.gc) > 1:
+        _run_gc_matrix(args, library, options)
+        return
+    if args.cache == CacheMode.COLD.value:
+        _run_cache_comparison(args, library, options)
+        return
 
     # Run benchmarks
-    results = run_benchmarks(library=library, op_type=op_type)
+    results = run_benchmarks(library=library, **options)
 
     # Display results
     print_results(results)
+    _print_reports(args, results, options)
 
     # Generate charts
     if not args.no_charts:
         generate_charts(results)
 
 
+def _run_options(args, families: list[Family], memory: bool) -> dict:
+    """run_benchmarks keyword arguments for the run flags, shared by a single run and every matrix cell."""
+    op_type = None
+    if args.reads and not args.writes:
+        op_type = OpType.READ
+    elif args.writes and not args.reads:
+        op_type = OpType.WRITE
+
+    return {
+        'op_type': op_type,
+        'families': families,
+        'key_distribution': Distribution(args.key_dist),
+        'key_pool_size': args.key_pool,
+        # Covered queries are only worth timing once explain confirms the server never fetched a document
+        'explain': args.explain or Family.COVERED in families,
+        'measure_wire': args.wire,
+        'profile': args.profile,
+        'gc_mode': GCMode(args.gc[0]) if args.gc else GCMode.DEFAULT,
+        'server_stats': args.server_stats,
+        # Benchmarks using operators mongomock hasn't implemented are reported and skipped
+        'skip_failures': memory,
+    }
+
+
+def _print_reports(args, results: list, options: dict):
+    from reporting.tables import (
+        print_covered_breakdown,
+        print_gc_report,
+        print_plan_report,
+        print_profile_summary,
+        print_server_report,
+        print_wire_report,
+    )
+
+    if Family.COVERED in options['families']:
+        print_covered_breakdown(results)
+    if options['explain']:
+        print_plan_report(results)
+    if args.profile:
+        print_profile_summary(results)
+    if args.gc:
+        print_gc_report(results)
+    if args.server_stats:
+        print_server_report(results)
+    if options['measure_wire']:
+        print_wire_report(results)
+
+
+def _report_matrix(args, matrix: dict[str, list], options: dict, title: str):
+    """The single-run reports for each cell, with each cell's charts in its own output/<cell>/ directory."""
+    from reporting.charts import generate_charts
+
+    reports = (
+        Family.COVERED in options['families']
+        or options['explain']
+        or options['measure_wire']
+        or args.profile
+        or args.gc
+        or args.server_stats
+    )
+    for cell, results in matrix.items():
+        if reports:
+            print(f'\n{title}: {cell}')
+            _print_reports(args, results, options)
+        if not args.no_charts:
+            generate_charts(results, output_dir=os.path.join('output', cell))
+
+
+def _run_write_concern_matrix(args, library: Library | None, options: dict):
+    from benchmarks.matrix import run_matrix
+    from reporting.tables import print_matrix_results
+
+    names = list(WRITE_CONCERNS) if 'all' in args.write_concern else args.write_concern
+    # run_matrix always skips failures: some libraries can't run some writes under w=0
+    run_options: dict = {**options, 'op_type': OpType.WRITE}
+    del run_options['skip_failures']
+    matrix = run_matrix({name: WRITE_CONCERNS[name] for name in names}, library=library, **run_options)
+    _report_matrix(args, matrix, options, title='Write Concern')
+    print_matrix_results(matrix, title='Write Concern')
+
+
+def _run_compression_matrix(args, library: Library | None, options: dict):
+    from benchmarks.matrix import COMPRESSION_SUITE, compression_cells, run_matrix
+    from reporting.tables import print_compression_results
+
+    # Wire stats are always measured here, but print_compression_results already reports them
+    run_options: dict = {**options, 'families': [Family.CORE], 'measure_wire': True}
+    del run_options['skip_failures']
+    matrix = run_matrix(compression_cells(), library=library, names=COMPRESSION_SUITE, **run_options)
+    _report_matrix(args, matrix, {**options, 'families': [Family.CORE]}, title='Compression')
+    print_compression_results(matrix)
+
+
+def _run_gc_matrix(args, library: Library | None, options: dict):
+    from benchmarks.runner import run_benchmarks
+    from reporting.tables import print_matrix_results
+
+    matrix = {}
+    for mode in args.gc:
+        gc_mode = GCMode(mode)
+        print(f'\nGC mode: {gc_mode.value}')
+        cell_options: dict = {**options, 'gc_mode': gc_mode}
+        matrix[mode] = run_benchmarks(library=library, **cell_options)
+    _report_matrix(args, matrix, options, title='GC Mode')
+    print_matrix_results(matrix, title='GC Mode')
+
+
+def _run_cache_comparison(args, library: Library | None, options: dict):
+    from benchmarks.runner import run_benchmarks
+    from reporting.tables import print_cache_comparison, print_matrix_results
+
+    matrix = {}
+    for mode in CacheMode:
+        print(f'\nCache: {mode.value}')
+        matrix[mode.value] = run_benchmarks(library=library, cache_mode=mode, **options)
+    _report_matrix(args, matrix, options, title='Cache')
+    print_matrix_results(matrix, title='Cache')
+    print_cache_comparison(matrix[CacheMode.WARM.value], matrix[CacheMode.COLD.value])
+
+
+def _cmd_sweep(args):
+    from benchmarks.sweep import run_sweep
+    from reporting.charts import generate_scaling_charts
+    from reporting.tables import print_sweep_results
+
+    library = Library(args.library) if args.library else None
+    sweep = run_sweep(sizes=tuple(args.sizes), library=library)
+
+    print_sweep_results(sweep)
+
+    if not args.no_charts:
+        generate_scaling_charts(sweep)
+
+
+def _cmd_scenario(args):
+    from benchmarks.scenarios import PRESETS, Scenario, parse_mix, run_scenario
+    from reporting.tables import print_scenario_results
+
+    if args.mix:
+        scenario = Scenario(name='custom', description='Mix from the command line', mix=parse_mix(args.mix))
+    else:
+        scenario = replace(PRESETS[args.preset])
+    scenario.duration_s = args.duration
+    scenario.concurrency = args.concurrency
+    if args.key_dist:
+        scenario.key_distribution = Distribution(args.key_dist)
+
+    _ensure_seeded(get_pymongo_client(), _families_of(scenario.mix))
+
+    library = Library(args.library) if args.library else None
+    results = run_scenario(scenario, library=library)
+
+    print_scenario_results(results)
+
+
+def _cmd_openloop(args):
+    from benchmarks.openloop import run_openloop
+    from reporting.charts import generate_openloop_chart
+    from reporting.tables import print_openloop_results
+
+    _ensure_seeded(get_pymongo_client(), _families_of([args.benchmark]))
+
+    library = Library(args.library) if args.library else None
+    results = run_openloop(
+        benchmark_name=args.benchmark,
+        library=library,
+        start_rate=args.start_rate,
+        rate_factor=args.rate_factor,
+        step_duration=args.step_duration,
+        max_inflight=args.max_inflight,
+        key_distribution=Distribution(args.key_dist),
+    )
+
+    print_openloop_results(results)
+
+    if not args.no_charts:
+        generate_openloop_chart(results)
+
+
+def _cmd_ingest(args):
+    from benchmarks.ingest import run_ingest
+    from reporting.tables import print_ingest_results
+    from seeding.seeder import ensure_indexes
+
+    # Events only need the orders indexes (order_number is unique), not seeded data
+    ensure_indexes(get_pymongo_client())
+
+    library = Library(args.library) if args.library else None
+    results = run_ingest(library=library, duration=args.duration, concurrency=args.concurrency)
+
+    print_ingest_results(results)
+
+
+def _cmd_concurrency(args):
+    from benchmarks.concurrency import run_concurrency_sweep
+    from reporting.charts import generate_concurrency_chart
+    from reporting.tables import print_concurrency_results
+
+    families = list(Family) if 'all' in args.family else [Family(f) for f in args.family]
+
+    _ensure_seeded(get_pymongo_client(), families)
+
+    results = run_concurrency_sweep(
+        levels=tuple(args.levels),
+        families=families,
+        names=args.benchmark,
+        duration=args.duration,
+        key_distribution=Distribution(args.key_dist),
+    )
+
+    print_concurrency_results(results)
+
+    if not args.no_charts:
+        generate_concurrency_chart(results)
+
+
+def _cmd_threads(args):
+    from benchmarks.threads import run_thread_scaling
+    from reporting.charts import generate_thread_scaling_chart
+    from reporting.tables import print_thread_scaling_results
+
+    families = list(Family) if 'all' in args.family else [Family(f) for f in args.family]
+
+    _ensure_seeded(get_pymongo_client(), families)
+
+    results = run_thread_scaling(
+        levels=tuple(args.levels),
+        library=Library(args.library) if args.library else None,
+        families=families,
+        names=args.benchmark,
+        duration=args.duration,
+        key_distribution=Distribution(args.key_dist),
+    )
+
+    print_thread_scaling_results(results)
+
+    if not args.no_charts:
+        generate_thread_scaling_chart(results)
+
+
+def _cmd_distributed(args):
+    from benchmarks.distributed import run_distributed
+    from benchmarks.scenarios import PRESETS, parse_mix
+    from reporting.tables import print_distributed_results, print_results
+
+    key_dist = Distribution.UNIFORM
+    if args.benchmark:
+        mix = {args.benchmark: 1.0}
+    elif args.preset:
+        mix = PRESETS[args.preset].mix
+        key_dist = PRESETS[args.preset].key_distribution
+    else:
+        mix = parse_mix(args.mix)
+    if args.key_dist:
+        key_dist = Distribution(args.key_dist)
+
+    _ensure_seeded(get_pymongo_client(), _families_of(mix))
+
+    library = Library(args.library) if args.library else None
+    results = run_distributed(
+        mix,
+        workers=args.workers,
+        library=library,
+        duration=args.duration,
+        key_distribution=key_dist,
+    )
+
+    print_results(results)
+    print_distributed_results(results, args.workers)
+
+
+def _cmd_replay(args):
+    from benchmarks.replay import REPLAY_SUITE, run_replay
+    from reporting.tables import print_replay_results
+
+    _ensure_seeded(get_pymongo_client(), _families_of(args.benchmark or REPLAY_SUITE))
+
+    results = run_replay(
+        names=args.benchmark,
+        library=Library(args.library) if args.library else None,
+        iterations=args.iterations,
+    )
+
+    print_replay_results(results)
+
+
 if __name__ == '__main__':
     main()
@@ -44,6 +44,60 @@ class OrderEmailProjection(BaseModel):
     customer_email: str
 
 
+# Covered variants: dropping _id lets the server answer from the compound index alone
+
+
+class CategoryNameCoveredProjection(BaseModel):
+    name: str
+
+    class Settings:
+        projection = {'name': 1, '_id': 0}
+
+
+class OrderEmailCoveredProjection(BaseModel):
+    customer_email: str
+
+    class Settings:
+        projection = {'customer_email': 1, '_id': 0}
+
+
+# --- Aggregation result models ---
+
+
+class StatusRevenueProjection(BaseModel):
+    status: str
+    revenue_cents: int
+    order_count: int
+
+
+class SkuQuantityProjection(BaseModel):
+    sku: str
+    quantity: int
+
+
+class MonthlyOrdersProjection(BaseModel):
+    year: int
+    month: int
+    order_count: int
+
+
+class BasketSizeProjection(BaseModel):
+    payment_method: str
+    avg_total_cents: float
+    avg_item_count: float
+    order_count: int
+
+
+class BucketProjection(BaseModel):
+    key: str
+    order_count: int
+
+
+class DashboardFacetProjection(BaseModel):
+    by_status: list[BucketProjection]
+    by_payment: list[BucketProjection]
+
+
 # --- Document models ---
 
 
@@ -59,6 +113,8 @@ class CategoryDoc(Document):
             IndexModel([('name', 1)], unique=True),
             IndexModel([('slug', 1)], unique=True),
             IndexModel([('view_count', -1)]),
+            IndexModel([('view_count', -1), ('_id', -1)]),
+            IndexModel([('slug', 1), ('name', 1)]),
         ]
 
 
@@ -83,4 +139,13 @@ class OrderDoc(Document):
             IndexModel([('status', 1)]),
             IndexModel([('total_cents', -1)]),
             IndexModel([('created_at', -1)]),
+            IndexModel([('order_number', 1), ('customer_email', 1)]),
+        ]
+
+
+class LargeOrderDoc(OrderDoc):
+    class Settings:
+        name = 'orders_large'
+        indexes = [
+            IndexModel([('order_number', 1)], unique=True),
         ]
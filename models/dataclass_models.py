@@ -84,3 +84,74 @@ def order_from_doc(doc: dict) -> Order:
         line_items=[LineItem(**li) for li in doc['line_items']],
         status_history=[StatusEntry(**sh) for sh in doc['status_history']],
     )
+
+
+# --- Aggregation results ---
+
+
+@dataclass(slots=True)
+class StatusRevenue:
+    status: str
+    revenue_cents: int
+    order_count: int
+
+
+@dataclass(slots=True)
+class SkuQuantity:
+    sku: str
+    quantity: int
+
+
+@dataclass(slots=True)
+class MonthlyOrders:
+    year: int
+    month: int
+    order_count: int
+
+
+@dataclass(slots=True)
+class BasketSize:
+    payment_method: str
+    avg_total_cents: float
+    avg_item_count: float
+    order_count: int
+
+
+@dataclass(slots=True)
+class Bucket:
+    key: str
+    order_count: int
+
+
+@dataclass(slots=True)
+class DashboardFacet:
+    by_status: list[Bucket]
+    by_payment: list[Bucket]
+
+
+def status_revenue_from_doc(doc: dict) -> StatusRevenue:
+    return StatusRevenue(status=doc['status'], revenue_cents=doc['revenue_cents'], order_count=doc['order_count'])
+
+
+def sku_quantity_from_doc(doc: dict) -> SkuQuantity:
+    return SkuQuantity(sku=doc['sku'], quantity=doc['quantity'])
+
+
+def monthly_orders_from_doc(doc: dict) -> MonthlyOrders:
+    return MonthlyOrders(year=doc['year'], month=doc['month'], order_count=doc['order_count'])
+
+
+def basket_size_from_doc(doc: dict) -> BasketSize:
+    return BasketSize(
+        payment_method=doc['payment_method'],
+        avg_total_cents=doc['avg_total_cents'],
+        avg_item_count=doc['avg_item_count'],
+        order_count=doc['order_count'],
+    )
+
+
+def dashboard_facet_from_doc(doc: dict) -> DashboardFacet:
+    return DashboardFacet(
+        by_status=[Bucket(**b) for b in doc['by_status']],
+        by_payment=[Bucket(**b) for b in doc['by_payment']],
+    )
@@ -44,11 +44,13 @@ class CategoryDoc(me.Document):
             'name',
             'slug',
             {'fields': ['-view_count']},
+            {'fields': ['-view_count', '-id']},
+            {'fields': ['slug', 'name']},
         ],
     }
 
 
-class OrderDoc(me.Document):
+class OrderBase(me.Document):
     order_number = me.StringField(required=True, unique=True)
     customer_email = me.StringField(required=True)
     status = me.StringField(required=True)
@@ -61,6 +63,10 @@ class OrderDoc(me.Document):
     line_items = me.EmbeddedDocumentListField(LineItem, required=True)
     status_history = me.EmbeddedDocumentListField(StatusEntry, required=True)
 
+    meta = {'abstract': True}
+
+
+class OrderDoc(OrderBase):
     meta = {
         'collection': 'orders',
         'indexes': [
@@ -69,5 +75,13 @@ class OrderDoc(me.Document):
             'status',
             {'fields': ['-total_cents']},
             {'fields': ['-created_at']},
+            {'fields': ['order_number', 'customer_email']},
         ],
     }
+
+
+class LargeOrderDoc(OrderBase):
+    meta = {
+        'collection': 'orders_large',
+        'indexes': ['order_number'],
+    }
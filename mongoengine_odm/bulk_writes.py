@@ -0,0 +1,71 @@
+from datetime import datetime
+
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.mongoengine_models import OrderDoc
+
+
+def _save_loop(keys: list[str]):
+    now = datetime.now()
+    for doc in OrderDoc.objects(order_number__in=keys):
+        doc.updated_at = now
+        doc.save()
+
+
+def _update_many(keys: list[str]):
+    OrderDoc.objects(order_number__in=keys).update(set__updated_at=datetime.now())
+
+
+@benchmark(
+    name='update_1000_loop',
+    library=Library.MONGOENGINE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 1,000 Orders by order_number, then save() each',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+def update_1000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _save_loop(keys)
+
+
+@benchmark(
+    name='update_1000_many',
+    library=Library.MONGOENGINE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 1,000 Orders, QuerySet.update()',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+def update_1000_many(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _update_many(keys)
+
+
+@benchmark(
+    name='update_10000_loop',
+    library=Library.MONGOENGINE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Load 10,000 Orders by order_number, then save() each',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+def update_10000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    _save_loop(keys)
+
+
+@benchmark(
+    name='update_10000_many',
+    library=Library.MONGOENGINE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 10,000 Orders, QuerySet.update()',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+def update_10000_many(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    _update_many(keys)
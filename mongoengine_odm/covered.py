@@ -0,0 +1,31 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.mongoengine_models import CategoryDoc, OrderDoc
+
+
+@benchmark(
+    name='covered_category_name',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description="Select only 'name' from one Category by slug, answered from the (slug, name) index",
+    family=Family.COVERED,
+)
+def covered_category_name(ctx):
+    slug = ctx['targets']['category_slug']
+    # only() always keeps the primary key, so _id has to be excluded explicitly
+    CategoryDoc.objects(slug=slug).only('name').exclude('id').hint('slug_1_name_1').first()
+
+
+@benchmark(
+    name='covered_order_email',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description="Select only 'customer_email' from one Order, answered from the (order_number, customer_email) index",
+    family=Family.COVERED,
+)
+def covered_order_email(ctx):
+    order_number = ctx['targets']['order_number']
+    OrderDoc.objects(order_number=order_number).only('customer_email').exclude('id').hint(
+        'order_number_1_customer_email_1'
+    ).first()
@@ -0,0 +1,58 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.mongoengine_models import LargeOrderDoc
+
+
+@benchmark(
+    name='read_order_1kb',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~1 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 1_000},
+)
+def read_order_1kb(ctx):
+    order_number = ctx['targets']['large_order_1kb']
+    LargeOrderDoc.objects(order_number=order_number).first()
+
+
+@benchmark(
+    name='read_order_10kb',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~10 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 10_000},
+)
+def read_order_10kb(ctx):
+    order_number = ctx['targets']['large_order_10kb']
+    LargeOrderDoc.objects(order_number=order_number).first()
+
+
+@benchmark(
+    name='read_order_100kb',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~100 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 100_000},
+)
+def read_order_100kb(ctx):
+    order_number = ctx['targets']['large_order_100kb']
+    LargeOrderDoc.objects(order_number=order_number).first()
+
+
+@benchmark(
+    name='read_order_1mb',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~1 MB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 1_000_000},
+)
+def read_order_1mb(ctx):
+    order_number = ctx['targets']['large_order_1mb']
+    LargeOrderDoc.objects(order_number=order_number).first()
@@ -0,0 +1,94 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+from models.mongoengine_models import OrderDoc
+
+
+def _loop(keys: list[str]) -> list[OrderDoc | None]:
+    return [OrderDoc.objects(order_number=key).first() for key in keys]
+
+
+def _batched(keys: list[str]) -> list[OrderDoc]:
+    return list(OrderDoc.objects(order_number__in=keys))
+
+
+@benchmark(
+    name='multi_get_10_loop',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders by order_number, one .first() per key',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'loop'},
+)
+def multi_get_10_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    _loop(keys)
+
+
+@benchmark(
+    name='multi_get_10_batched',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders by order_number with order_number__in',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'batched'},
+)
+def multi_get_10_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    _batched(keys)
+
+
+@benchmark(
+    name='multi_get_100_loop',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders by order_number, one .first() per key',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'loop'},
+)
+def multi_get_100_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    _loop(keys)
+
+
+@benchmark(
+    name='multi_get_100_batched',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders by order_number with order_number__in',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'batched'},
+)
+def multi_get_100_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    _batched(keys)
+
+
+@benchmark(
+    name='multi_get_1000_loop',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders by order_number, one .first() per key',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'loop'},
+)
+def multi_get_1000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _loop(keys)
+
+
+@benchmark(
+    name='multi_get_1000_batched',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders by order_number with order_number__in',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'batched'},
+)
+def multi_get_1000_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _batched(keys)
@@ -0,0 +1,122 @@
+from mongoengine.queryset.visitor import Q
+
+from benchmarks.registry import Family, Library, OpType, benchmark
+from config import PAGE_SIZE
+from models.mongoengine_models import CategoryDoc
+
+
+def _skip_page(page: int) -> list[CategoryDoc]:
+    return list(CategoryDoc.objects.order_by('-view_count', '-id').skip((page - 1) * PAGE_SIZE).limit(PAGE_SIZE))
+
+
+def _keyset_page(after: dict | None) -> list[CategoryDoc]:
+    query = CategoryDoc.objects
+    if after:
+        query = CategoryDoc.objects(
+            Q(view_count__lt=after['view_count']) | Q(view_count=after['view_count'], id__lt=after['_id'])
+        )
+    return list(query.order_by('-view_count', '-id').limit(PAGE_SIZE))
+
+
+@benchmark(
+    name='page_skip_1',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 1, 'strategy': 'skip'},
+)
+def page_skip_1(ctx):
+    _skip_page(1)
+
+
+@benchmark(
+    name='page_skip_10',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 10 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 10, 'strategy': 'skip'},
+)
+def page_skip_10(ctx):
+    _skip_page(10)
+
+
+@benchmark(
+    name='page_skip_100',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 100 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 100, 'strategy': 'skip'},
+)
+def page_skip_100(ctx):
+    _skip_page(100)
+
+
+@benchmark(
+    name='page_skip_1000',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1,000 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 1000, 'strategy': 'skip'},
+)
+def page_skip_1000(ctx):
+    _skip_page(1000)
+
+
+@benchmark(
+    name='page_keyset_1',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 1, 'strategy': 'keyset'},
+)
+def page_keyset_1(ctx):
+    _keyset_page(ctx['targets']['page_cursors'][1])
+
+
+@benchmark(
+    name='page_keyset_10',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 10 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 10, 'strategy': 'keyset'},
+)
+def page_keyset_10(ctx):
+    _keyset_page(ctx['targets']['page_cursors'][10])
+
+
+@benchmark(
+    name='page_keyset_100',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 100 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 100, 'strategy': 'keyset'},
+)
+def page_keyset_100(ctx):
+    _keyset_page(ctx['targets']['page_cursors'][100])
+
+
+@benchmark(
+    name='page_keyset_1000',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1,000 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 1000, 'strategy': 'keyset'},
+)
+def page_keyset_1000(ctx):
+    _keyset_page(ctx['targets']['page_cursors'][1000])
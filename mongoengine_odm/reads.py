@@ -1,4 +1,4 @@
-from benchmarks.registry import Library, OpType, benchmark
+from benchmarks.registry import Family, Library, OpType, benchmark
 from models.mongoengine_models import CategoryDoc, OrderDoc
 
 
@@ -117,3 +117,16 @@ def read_1000_categories(ctx):
 )
 def read_10000_categories(ctx):
     list(CategoryDoc.objects.order_by('-view_count').limit(10000))
+
+
+@benchmark(
+    name='read_latest_order',
+    library=Library.MONGOENGINE,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one of the most recently created Orders, by rank in created_at order',
+    family=Family.SCENARIO,
+)
+def read_latest_order(ctx):
+    rank = ctx['targets']['recent_rank']
+    OrderDoc.objects.order_by('-created_at').skip(rank).first()
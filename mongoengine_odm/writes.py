@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from benchmarks.registry import Library, OpType, benchmark
+from benchmarks.registry import Family, Library, OpType, benchmark
 from models.mongoengine_models import (
     Address,
     CategoryDoc,
@@ -56,6 +56,20 @@ def insert_single(ctx):
     doc.save()
 
 
+@benchmark(
+    name='insert_single_order',
+    library=Library.MONGOENGINE,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Insert one new Order document, created now',
+    family=Family.SCENARIO,
+)
+def insert_single_order(ctx):
+    doc = _make_order_doc()
+    doc.created_at = doc.updated_at = datetime.now()
+    doc.save()
+
+
 @benchmark(
     name='insert_batch_100',
     library=Library.MONGOENGINE,
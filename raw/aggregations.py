@@ -0,0 +1,67 @@
+from benchmarks import pipelines
+from benchmarks.registry import Family, Library, OpType, benchmark
+
+
+@benchmark(
+    name='agg_revenue_by_status',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Revenue and order count by status over one year ($match + $group)',
+    family=Family.AGGREGATION,
+)
+def agg_revenue_by_status(ctx):
+    db = ctx['db']
+    list(db.orders.aggregate(pipelines.revenue_by_status()))
+
+
+@benchmark(
+    name='agg_top_skus',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Top 10 SKUs by quantity over one year ($unwind line_items + $group)',
+    family=Family.AGGREGATION,
+)
+def agg_top_skus(ctx):
+    db = ctx['db']
+    list(db.orders.aggregate(pipelines.top_skus()))
+
+
+@benchmark(
+    name='agg_monthly_orders',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Monthly order counts over one year ($group by $year/$month)',
+    family=Family.AGGREGATION,
+)
+def agg_monthly_orders(ctx):
+    db = ctx['db']
+    list(db.orders.aggregate(pipelines.monthly_orders()))
+
+
+@benchmark(
+    name='agg_basket_by_payment',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Average basket size by payment method over one year ($group + $avg)',
+    family=Family.AGGREGATION,
+)
+def agg_basket_by_payment(ctx):
+    db = ctx['db']
+    list(db.orders.aggregate(pipelines.basket_by_payment()))
+
+
+@benchmark(
+    name='agg_dashboard_facet',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Order counts by status and by payment method in one pass ($facet)',
+    family=Family.AGGREGATION,
+)
+def agg_dashboard_facet(ctx):
+    db = ctx['db']
+    list(db.orders.aggregate(pipelines.dashboard_facet()))
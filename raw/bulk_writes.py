@@ -0,0 +1,182 @@
+import uuid
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from benchmarks.registry import Family, Library, OpType, benchmark
+from seeding.generator import DataGenerator
+
+_gen = DataGenerator(seed=99)
+
+
+def _update_loop(db, keys: list[str]):
+    now = datetime.now()
+    for key in keys:
+        db.orders.update_one({'order_number': key}, {'$set': {'updated_at': now}})
+
+
+def _update_bulk(db, keys: list[str], ordered: bool):
+    now = datetime.now()
+    ops = [UpdateOne({'order_number': key}, {'$set': {'updated_at': now}}) for key in keys]
+    db.orders.bulk_write(ops, ordered=ordered)
+
+
+def _update_many(db, keys: list[str]):
+    db.orders.update_many({'order_number': {'$in': keys}}, {'$set': {'updated_at': datetime.now()}})
+
+
+def _upsert_bulk(db, keys: list[str]):
+    # Half the keys exist and get updated, the other half are new and get inserted
+    now = datetime.now()
+    half = len(keys) // 2
+    new_keys = [f'BENCH-{uuid.uuid4().hex}' for _ in range(len(keys) - half)]
+    ops = []
+    for key in keys[:half] + new_keys:
+        on_insert = _gen.make_one_order(index=0)
+        on_insert.pop('updated_at')
+        on_insert['order_number'] = key
+        on_insert['_benchmark'] = True
+        ops.append(
+            UpdateOne({'order_number': key}, {'$set': {'updated_at': now}, '$setOnInsert': on_insert}, upsert=True)
+        )
+    db.orders.bulk_write(ops, ordered=False)
+
+
+@benchmark(
+    name='update_1000_loop',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 1,000 Orders, one update_one per order_number',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+def update_1000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _update_loop(ctx['db'], keys)
+
+
+@benchmark(
+    name='update_1000_bulk_ordered',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 1,000 Orders, ordered bulk_write of UpdateOne',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+def update_1000_bulk_ordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _update_bulk(ctx['db'], keys, ordered=True)
+
+
+@benchmark(
+    name='update_1000_bulk_unordered',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 1,000 Orders, unordered bulk_write of UpdateOne',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+def update_1000_bulk_unordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _update_bulk(ctx['db'], keys, ordered=False)
+
+
+@benchmark(
+    name='update_1000_many',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 1,000 Orders, one update_many with $in',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+def update_1000_many(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _update_many(ctx['db'], keys)
+
+
+@benchmark(
+    name='upsert_1000_bulk',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Upsert 1,000 Orders (half existing, half new), unordered bulk_write',
+    family=Family.BULK_WRITE,
+    params={'docs': 1000},
+)
+def upsert_1000_bulk(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _upsert_bulk(ctx['db'], keys)
+
+
+@benchmark(
+    name='update_10000_loop',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 10,000 Orders, one update_one per order_number',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+def update_10000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    _update_loop(ctx['db'], keys)
+
+
+@benchmark(
+    name='update_10000_bulk_ordered',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 10,000 Orders, ordered bulk_write of UpdateOne',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+def update_10000_bulk_ordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    _update_bulk(ctx['db'], keys, ordered=True)
+
+
+@benchmark(
+    name='update_10000_bulk_unordered',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 10,000 Orders, unordered bulk_write of UpdateOne',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+def update_10000_bulk_unordered(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    _update_bulk(ctx['db'], keys, ordered=False)
+
+
+@benchmark(
+    name='update_10000_many',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Update updated_at on 10,000 Orders, one update_many with $in',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+def update_10000_many(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    _update_many(ctx['db'], keys)
+
+
+@benchmark(
+    name='upsert_10000_bulk',
+    library=Library.RAW,
+    op_type=OpType.WRITE,
+    collection='order',
+    description='Upsert 10,000 Orders (half existing, half new), unordered bulk_write',
+    family=Family.BULK_WRITE,
+    params={'docs': 10000},
+)
+def upsert_10000_bulk(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10000]
+    _upsert_bulk(ctx['db'], keys)
@@ -0,0 +1,61 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+
+
+@benchmark(
+    name='read_order_1kb',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~1 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 1_000},
+)
+def read_order_1kb(ctx):
+    db = ctx['db']
+    order_number = ctx['targets']['large_order_1kb']
+    db.orders_large.find_one({'order_number': order_number})
+
+
+@benchmark(
+    name='read_order_10kb',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~10 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 10_000},
+)
+def read_order_10kb(ctx):
+    db = ctx['db']
+    order_number = ctx['targets']['large_order_10kb']
+    db.orders_large.find_one({'order_number': order_number})
+
+
+@benchmark(
+    name='read_order_100kb',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~100 KB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 100_000},
+)
+def read_order_100kb(ctx):
+    db = ctx['db']
+    order_number = ctx['targets']['large_order_100kb']
+    db.orders_large.find_one({'order_number': order_number})
+
+
+@benchmark(
+    name='read_order_1mb',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one ~1 MB Order from orders_large by order_number',
+    family=Family.DOC_SIZE,
+    params={'doc_bytes': 1_000_000},
+)
+def read_order_1mb(ctx):
+    db = ctx['db']
+    order_number = ctx['targets']['large_order_1mb']
+    db.orders_large.find_one({'order_number': order_number})
@@ -0,0 +1,93 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+
+
+def _loop(db, keys: list[str]) -> list[dict | None]:
+    return [db.orders.find_one({'order_number': key}) for key in keys]
+
+
+def _batched(db, keys: list[str]) -> list[dict]:
+    return list(db.orders.find({'order_number': {'$in': keys}}))
+
+
+@benchmark(
+    name='multi_get_10_loop',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders by order_number, one find_one per key',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'loop'},
+)
+def multi_get_10_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    _loop(ctx['db'], keys)
+
+
+@benchmark(
+    name='multi_get_10_batched',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 10 Orders by order_number with one $in query',
+    family=Family.MULTI_GET,
+    params={'keys': 10, 'strategy': 'batched'},
+)
+def multi_get_10_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:10]
+    _batched(ctx['db'], keys)
+
+
+@benchmark(
+    name='multi_get_100_loop',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders by order_number, one find_one per key',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'loop'},
+)
+def multi_get_100_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    _loop(ctx['db'], keys)
+
+
+@benchmark(
+    name='multi_get_100_batched',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 100 Orders by order_number with one $in query',
+    family=Family.MULTI_GET,
+    params={'keys': 100, 'strategy': 'batched'},
+)
+def multi_get_100_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:100]
+    _batched(ctx['db'], keys)
+
+
+@benchmark(
+    name='multi_get_1000_loop',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders by order_number, one find_one per key',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'loop'},
+)
+def multi_get_1000_loop(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _loop(ctx['db'], keys)
+
+
+@benchmark(
+    name='multi_get_1000_batched',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Fetch 1,000 Orders by order_number with one $in query',
+    family=Family.MULTI_GET,
+    params={'keys': 1000, 'strategy': 'batched'},
+)
+def multi_get_1000_batched(ctx):
+    keys = ctx['targets']['bulk_order_numbers'][:1000]
+    _batched(ctx['db'], keys)
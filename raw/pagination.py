@@ -0,0 +1,125 @@
+from benchmarks.registry import Family, Library, OpType, benchmark
+from config import PAGE_SIZE
+
+SORT = [('view_count', -1), ('_id', -1)]
+
+
+def _skip_page(db, page: int) -> list[dict]:
+    return list(db.categories.find().sort(SORT).skip((page - 1) * PAGE_SIZE).limit(PAGE_SIZE))
+
+
+def _keyset_page(db, after: dict | None) -> list[dict]:
+    # `after` is the last document of the previous page, as the client would have kept it
+    query = {}
+    if after:
+        query = {
+            '$or': [
+                {'view_count': {'$lt': after['view_count']}},
+                {'view_count': after['view_count'], '_id': {'$lt': after['_id']}},
+            ]
+        }
+    return list(db.categories.find(query).sort(SORT).limit(PAGE_SIZE))
+
+
+@benchmark(
+    name='page_skip_1',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 1, 'strategy': 'skip'},
+)
+def page_skip_1(ctx):
+    _skip_page(ctx['db'], 1)
+
+
+@benchmark(
+    name='page_skip_10',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 10 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 10, 'strategy': 'skip'},
+)
+def page_skip_10(ctx):
+    _skip_page(ctx['db'], 10)
+
+
+@benchmark(
+    name='page_skip_100',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 100 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 100, 'strategy': 'skip'},
+)
+def page_skip_100(ctx):
+    _skip_page(ctx['db'], 100)
+
+
+@benchmark(
+    name='page_skip_1000',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1,000 of Categories by view_count, skip/limit',
+    family=Family.PAGINATION,
+    params={'page': 1000, 'strategy': 'skip'},
+)
+def page_skip_1000(ctx):
+    _skip_page(ctx['db'], 1000)
+
+
+@benchmark(
+    name='page_keyset_1',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 1, 'strategy': 'keyset'},
+)
+def page_keyset_1(ctx):
+    _keyset_page(ctx['db'], ctx['targets']['page_cursors'][1])
+
+
+@benchmark(
+    name='page_keyset_10',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 10 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 10, 'strategy': 'keyset'},
+)
+def page_keyset_10(ctx):
+    _keyset_page(ctx['db'], ctx['targets']['page_cursors'][10])
+
+
+@benchmark(
+    name='page_keyset_100',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 100 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 100, 'strategy': 'keyset'},
+)
+def page_keyset_100(ctx):
+    _keyset_page(ctx['db'], ctx['targets']['page_cursors'][100])
+
+
+@benchmark(
+    name='page_keyset_1000',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='category',
+    description='Page 1,000 of Categories by view_count, keyset on (view_count, _id)',
+    family=Family.PAGINATION,
+    params={'page': 1000, 'strategy': 'keyset'},
+)
+def page_keyset_1000(ctx):
+    _keyset_page(ctx['db'], ctx['targets']['page_cursors'][1000])
@@ -1,4 +1,4 @@
-from benchmarks.registry import Library, OpType, benchmark
+from benchmarks.registry import Family, Library, OpType, benchmark
 
 
 @benchmark(
@@ -126,3 +126,17 @@ def read_1000_categories(ctx):
 def read_10000_categories(ctx):
     db = ctx['db']
     list(db.categories.find().sort('view_count', -1).limit(10000))
+
+
+@benchmark(
+    name='read_latest_order',
+    library=Library.RAW,
+    op_type=OpType.READ,
+    collection='order',
+    description='Select one of the most recently created Orders, by rank in created_at order',
+    family=Family.SCENARIO,
+)
+def read_latest_order(ctx):
+    db = ctx['db']
+    rank = ctx['targets']['recent_rank']
+    next(db.orders.find().sort('created_at', -1).skip(rank).limit(1), None)
@@ -0,0 +1,119 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError, WriteError
+
+from config import WRITE_BEHIND_MAX_BATCH, WRITE_BEHIND_MAX_DELAY_S
+
+
+class WriteBehindBuffer:
+    """Coalesces single `insert_one` calls into unordered `insert_many` batches.
+
+    A batch is flushed once it holds `max_batch` documents or its oldest document has waited `max_delay` seconds.
+    Each insert gets a Future that resolves to the document's `_id`, or to the error for that document alone.
+    """
+
+    def __init__(
+        self, collection, max_batch: int = WRITE_BEHIND_MAX_BATCH, max_delay: float = WRITE_BEHIND_MAX_DELAY_S
+    ):
+        self.collection = collection
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self._pending: list[tuple[dict, Future]] = []
+        self._oldest = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+
+    def insert_one(self, doc: dict) -> Future:
+        # Assign the _id up front, as insert_one would, so callers can use it before the flush
+        doc.setdefault('_id', ObjectId())
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('WriteBehindBuffer is closed')
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((doc, future))
+            # Wake the flusher to start the delay clock on the first doc, or to write a full batch
+            if len(self._pending) in (1, self.max_batch):
+                self._cond.notify()
+        return future
+
+    def flush(self):
+        """Write everything buffered so far and wait for it."""
+        while True:
+            with self._cond:
+                batch = self._take()
+            if not batch:
+                return
+            self._write(batch)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._due():
+                    timeout = self._oldest + self.max_delay - time.monotonic() if self._pending else None
+                    self._cond.wait(timeout)
+                batch = self._take()
+                done = self._closed and not self._pending
+            self._write(batch)
+            if done:
+                return
+
+    def _due(self) -> bool:
+        if not self._pending:
+            return False
+        return len(self._pending) >= self.max_batch or time.monotonic() - self._oldest >= self.max_delay
+
+    def _take(self) -> list[tuple[dict, Future]]:
+        batch, self._pending = self._pending[: self.max_batch], self._pending[self.max_batch :]
+        self._oldest = time.monotonic()
+        return batch
+
+    def _write(self, batch: list[tuple[dict, Future]]):
+        if not batch:
+            return
+        self.batches += 1
+        docs = [doc for doc, _ in batch]
+        try:
+            self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            errors = map_write_errors(e)
+            for i, (doc, future) in enumerate(batch):
+                if i in errors:
+                    future.set_exception(errors[i])
+                else:
+                    future.set_result(doc['_id'])
+            return
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for doc, future in batch:
+            future.set_result(doc['_id'])
+
+
+def map_write_errors(error: BulkWriteError) -> dict[int, Exception]:
+    """Per-document exceptions from an unordered insert_many, keyed by position in the batch."""
+    mapped: dict[int, Exception] = {}
+    for write_error in error.details.get('writeErrors', []):
+        cls = DuplicateKeyError if write_error['code'] == 11000 else WriteError
+        mapped[write_error['index']] = cls(write_error['errmsg'], write_error['code'], write_error)
+    return mapped
@@ -6,8 +6,11 @@ import matplotlib.pyplot as plt
 
 matplotlib.use('Agg')
 
-from benchmarks.registry import OpType
+from benchmarks.concurrency import ConcurrencyResult
+from benchmarks.openloop import OpenLoopResult
+from benchmarks.registry import Family, OpType
 from benchmarks.runner import BenchmarkResult
+from benchmarks.threads import ThreadScalingResult
 
 COLORS = {
     'raw': '#2196F3',
@@ -27,11 +30,48 @@ LABELS = {
     'read_100_categories': 'Read 100\nCategories',
     'read_1000_categories': 'Read 1,000\nCategories',
     'read_10000_categories': 'Read 10,000\nCategories',
+    'read_latest_order': 'Read Latest\nOrder',
     'insert_single': 'Insert 1',
+    'insert_single_order': 'Insert 1\nOrder',
     'insert_batch_100': 'Insert\n100',
     'insert_batch_1000': 'Insert\n1,000',
     'update_single': 'Update 1',
     'delete_single': 'Delete 1',
+    'read_order_1kb': 'Read Order\n(1 KB)',
+    'read_order_10kb': 'Read Order\n(10 KB)',
+    'read_order_100kb': 'Read Order\n(100 KB)',
+    'read_order_1mb': 'Read Order\n(1 MB)',
+    'agg_revenue_by_status': 'Agg:\nRevenue by Status',
+    'agg_top_skus': 'Agg:\nTop SKUs',
+    'agg_monthly_orders': 'Agg:\nMonthly Orders',
+    'agg_basket_by_payment': 'Agg:\nBasket by Payment',
+    'agg_dashboard_facet': 'Agg:\nDashboard $facet',
+    'page_skip_1': 'Page 1\n(skip)',
+    'page_skip_10': 'Page 10\n(skip)',
+    'page_skip_100': 'Page 100\n(skip)',
+    'page_skip_1000': 'Page 1,000\n(skip)',
+    'page_keyset_1': 'Page 1\n(keyset)',
+    'page_keyset_10': 'Page 10\n(keyset)',
+    'page_keyset_100': 'Page 100\n(keyset)',
+    'page_keyset_1000': 'Page 1,000\n(keyset)',
+    'update_1000_loop': 'Update 1,000\n(loop)',
+    'update_1000_bulk_ordered': 'Update 1,000\n(bulk ordered)',
+    'update_1000_bulk_unordered': 'Update 1,000\n(bulk unordered)',
+    'update_1000_many': 'Update 1,000\n(update_many)',
+    'upsert_1000_bulk': 'Upsert 1,000\n(bulk)',
+    'update_10000_loop': 'Update 10,000\n(loop)',
+    'update_10000_bulk_ordered': 'Update 10,000\n(bulk ordered)',
+    'update_10000_bulk_unordered': 'Update 10,000\n(bulk unordered)',
+    'update_10000_many': 'Update 10,000\n(update_many)',
+    'upsert_10000_bulk': 'Upsert 10,000\n(bulk)',
+    'covered_category_name': 'Covered: Name\n(Category)',
+    'covered_order_email': 'Covered: Email\n(Order)',
+    'multi_get_10_loop': 'Get 10\n(per key)',
+    'multi_get_10_batched': 'Get 10\n(batched)',
+    'multi_get_100_loop': 'Get 100\n(per key)',
+    'multi_get_100_batched': 'Get 100\n(batched)',
+    'multi_get_1000_loop': 'Get 1,000\n(per key)',
+    'multi_get_1000_batched': 'Get 1,000\n(batched)',
 }
 
 
@@ -56,6 +96,18 @@ def generate_charts(results: list[BenchmarkResult], output_dir: str = 'output'):
     if by_name:
         _overhead_chart(by_name, f'{output_dir}/overhead_comparison.png')
 
+    doc_size = [r for r in results if r.benchmark.family == Family.DOC_SIZE]
+    if doc_size:
+        _doc_size_chart(doc_size, f'{output_dir}/doc_size_scaling.png')
+
+    pagination = [r for r in results if r.benchmark.family == Family.PAGINATION]
+    if pagination:
+        _pagination_chart(pagination, f'{output_dir}/pagination_depth.png')
+
+    multi_get = [r for r in results if r.benchmark.family == Family.MULTI_GET]
+    if multi_get:
+        _multi_get_chart(multi_get, f'{output_dir}/multi_get.png')
+
 
 def _bar_chart(
     grouped: dict[str, dict[str, BenchmarkResult]],
@@ -163,3 +215,276 @@ def _overhead_chart(
     plt.savefig(filepath, dpi=150)
     plt.close(fig)
     print(f'Chart saved: {filepath}')
+
+
+def _doc_size_chart(results: list[BenchmarkResult], filepath: str):
+    by_lib: dict[str, list[BenchmarkResult]] = defaultdict(list)
+    for r in results:
+        by_lib[r.benchmark.library.value].append(r)
+
+    fig, (ax_latency, ax_throughput) = plt.subplots(1, 2, figsize=(14, 6))
+
+    for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+        lib_results = sorted(by_lib.get(lib, []), key=lambda r: r.benchmark.params['doc_bytes'])
+        if not lib_results:
+            continue
+        sizes = [r.benchmark.params['doc_bytes'] for r in lib_results]
+        latencies = [r.median_ms for r in lib_results]
+        mb_per_sec = [
+            size / (r.median_ms / 1000) / 1_000_000 if r.median_ms else 0 for size, r in zip(sizes, lib_results)
+        ]
+        display = lib.replace('_', ' ').title()
+        ax_latency.plot(sizes, latencies, marker='o', label=display, color=COLORS[lib])
+        ax_throughput.plot(sizes, mb_per_sec, marker='o', label=display, color=COLORS[lib])
+
+    ax_latency.set_xscale('log')
+    ax_latency.set_yscale('log')
+    ax_latency.set_xlabel('Document Size (bytes)')
+    ax_latency.set_ylabel('Median Time (ms)')
+    ax_latency.set_title('Read Latency vs Document Size')
+
+    ax_throughput.set_xscale('log')
+    ax_throughput.set_xlabel('Document Size (bytes)')
+    ax_throughput.set_ylabel('Throughput (MB/s)')
+    ax_throughput.set_title('Read Throughput vs Document Size')
+
+    for ax in (ax_latency, ax_throughput):
+        ax.legend()
+        ax.grid(alpha=0.3, which='both')
+
+    plt.tight_layout()
+    plt.savefig(filepath, dpi=150)
+    plt.close(fig)
+    print(f'Chart saved: {filepath}')
+
+
+def _pagination_chart(results: list[BenchmarkResult], filepath: str):
+    series: dict[tuple[str, str], list[BenchmarkResult]] = defaultdict(list)
+    for r in results:
+        series[(r.benchmark.library.value, r.benchmark.params['strategy'])].append(r)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+        for strategy, linestyle in (('skip', '-'), ('keyset', '--')):
+            points = sorted(series.get((lib, strategy), []), key=lambda r: r.benchmark.params['page'])
+            if not points:
+                continue
+            ax.plot(
+                [r.benchmark.params['page'] for r in points],
+                [r.median_ms for r in points],
+                marker='o',
+                linestyle=linestyle,
+                label=f'{lib.replace("_", " ").title()} ({strategy})',
+                color=COLORS[lib],
+            )
+
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('Page Number')
+    ax.set_ylabel('Median Time per Page (ms)')
+    ax.set_title('Pagination Latency vs Page Depth (skip/limit solid, keyset dashed)')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3, which='both')
+
+    plt.tight_layout()
+    plt.savefig(filepath, dpi=150)
+    plt.close(fig)
+    print(f'Chart saved: {filepath}')
+
+
+def _multi_get_chart(results: list[BenchmarkResult], filepath: str):
+    series: dict[tuple[str, str], list[BenchmarkResult]] = defaultdict(list)
+    for r in results:
+        series[(r.benchmark.library.value, r.benchmark.params['strategy'])].append(r)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+        for strategy, linestyle in (('loop', '-'), ('batched', '--')):
+            points = sorted(series.get((lib, strategy), []), key=lambda r: r.benchmark.params['keys'])
+            if not points:
+                continue
+            ax.plot(
+                [r.benchmark.params['keys'] for r in points],
+                [r.median_ms for r in points],
+                marker='o',
+                linestyle=linestyle,
+                label=f'{lib.replace("_", " ").title()} ({strategy})',
+                color=COLORS[lib],
+            )
+
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('Keys per Lookup')
+    ax.set_ylabel('Median Time (ms)')
+    ax.set_title('Multi-Key Fetch: one query per key (solid) vs one batched query (dashed)')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3, which='both')
+
+    plt.tight_layout()
+    plt.savefig(filepath, dpi=150)
+    plt.close(fig)
+    print(f'Chart saved: {filepath}')
+
+
+def generate_scaling_charts(sweep: dict[int, list[BenchmarkResult]], output_dir: str = 'output'):
+    os.makedirs(output_dir, exist_ok=True)
+
+    by_name: dict[str, dict[str, dict[int, BenchmarkResult]]] = defaultdict(lambda: defaultdict(dict))
+    for size, results in sweep.items():
+        for r in results:
+            by_name[r.benchmark.name][r.benchmark.library.value][size] = r
+    if not by_name:
+        return
+
+    names = sorted(by_name.keys())
+    cols = min(len(names), 5)
+    rows = (len(names) + cols - 1) // cols
+    fig, axes = plt.subplots(rows, cols, figsize=(cols * 4, rows * 3.5), squeeze=False)
+
+    for ax, name in zip(axes.flat, names):
+        for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            lib_sizes = by_name[name].get(lib)
+            if not lib_sizes:
+                continue
+            sizes = sorted(lib_sizes)
+            ax.plot(
+                sizes,
+                [lib_sizes[s].median_ms for s in sizes],
+                marker='o',
+                label=lib.replace('_', ' ').title(),
+                color=COLORS[lib],
+            )
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_title(_label(name).replace('\n', ' '), fontsize=9)
+        ax.set_xlabel('Collection Size (docs)', fontsize=8)
+        ax.set_ylabel('Median Time (ms)', fontsize=8)
+        ax.grid(alpha=0.3, which='both')
+
+    for ax in list(axes.flat)[len(names) :]:
+        ax.set_visible(False)
+
+    handles, labels = axes.flat[0].get_legend_handles_labels()
+    fig.legend(handles, labels, loc='lower center', ncol=4)
+    fig.suptitle('Read Latency vs Collection Size')
+
+    plt.tight_layout(rect=(0, 0.05, 1, 0.97))
+    filepath = f'{output_dir}/scaling_sweep.png'
+    plt.savefig(filepath, dpi=150)
+    plt.close(fig)
+    print(f'Chart saved: {filepath}')
+
+
+def generate_openloop_chart(results: list[OpenLoopResult], output_dir: str = 'output'):
+    if not results:
+        return
+    os.makedirs(output_dir, exist_ok=True)
+
+    fig, (ax_lat, ax_tput) = plt.subplots(1, 2, figsize=(14, 5))
+    for r in results:
+        lib = r.benchmark.library.value
+        rates = [s.target_rate for s in r.steps]
+        label = lib.replace('_', ' ').title()
+        ax_lat.plot(rates, [s.p99_ms for s in r.steps], marker='o', label=label, color=COLORS[lib])
+        ax_tput.plot(rates, [s.achieved_rate for s in r.steps], marker='o', label=label, color=COLORS[lib])
+        if r.knee_rate:
+            ax_lat.axvline(r.knee_rate, color=COLORS[lib], linestyle=':', alpha=0.6)
+
+    max_rate = max(s.target_rate for r in results for s in r.steps)
+    ax_tput.plot([0, max_rate], [0, max_rate], color='gray', linestyle='--', alpha=0.5, label='Offered')
+
+    ax_lat.set_xscale('log')
+    ax_lat.set_yscale('log')
+    ax_lat.set_xlabel('Offered Load (ops/s)')
+    ax_lat.set_ylabel('P99 from Intended Start (ms)')
+    ax_lat.set_title('Tail Latency vs Offered Load')
+    ax_lat.grid(alpha=0.3, which='both')
+    ax_lat.legend()
+
+    ax_tput.set_xlabel('Offered Load (ops/s)')
+    ax_tput.set_ylabel('Achieved Throughput (ops/s)')
+    ax_tput.set_title('Throughput vs Offered Load')
+    ax_tput.grid(alpha=0.3)
+    ax_tput.legend()
+
+    title = _label(results[0].benchmark.name).replace('\n', ' ')
+    fig.suptitle(f'Open-Loop Ramp: {title}')
+    plt.tight_layout()
+    filepath = f'{output_dir}/openloop_knee.png'
+    plt.savefig(filepath, dpi=150)
+    plt.close(fig)
+    print(f'Chart saved: {filepath}')
+
+
+def generate_concurrency_chart(results: list[ConcurrencyResult], output_dir: str = 'output'):
+    if not results:
+        return
+    os.makedirs(output_dir, exist_ok=True)
+
+    fig, (ax_tput, ax_lag) = plt.subplots(1, 2, figsize=(14, 5))
+    for r in results:
+        tasks = [level.concurrency for level in r.levels]
+        label = _label(r.benchmark.name).replace('\n', ' ')
+        ax_tput.plot(tasks, [level.ops_per_sec for level in r.levels], marker='o', label=label)
+        ax_lag.plot(tasks, [level.lag_p99_ms for level in r.levels], marker='o', label=label)
+
+    ax_tput.set_xscale('log')
+    ax_tput.set_xlabel('Concurrent Tasks')
+    ax_tput.set_ylabel('Throughput (ops/s)')
+    ax_tput.set_title('Throughput vs Concurrency')
+    ax_tput.grid(alpha=0.3, which='both')
+    ax_tput.legend(fontsize=8)
+
+    ax_lag.set_xscale('log')
+    ax_lag.set_xlabel('Concurrent Tasks')
+    ax_lag.set_ylabel('Event-Loop Lag P99 (ms)')
+    ax_lag.set_title('Event-Loop Lag vs Concurrency')
+    ax_lag.grid(alpha=0.3, which='both')
+    ax_lag.legend(fontsize=8)
+
+    fig.suptitle('Beanie Concurrency Sweep')
+    plt.tight_layout()
+    filepath = f'{output_dir}/concurrency_sweep.png'
+    plt.savefig(filepath, dpi=150)
+    plt.close(fig)
+    print(f'Chart saved: {filepath}')
+
+
+def generate_thread_scaling_chart(results: list[ThreadScalingResult], output_dir: str = 'output'):
+    if not results:
+        return
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Average each library's speedup over its benchmarks, relative to its own lowest thread count
+    speedups = defaultdict(lambda: defaultdict(list))
+    for r in results:
+        base = r.levels[0].ops_per_sec
+        for level in r.levels:
+            speedups[r.benchmark.library.value][level.threads].append(level.ops_per_sec / base if base else 0.0)
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    thread_counts = sorted({level.threads for r in results for level in r.levels})
+    for lib, by_threads in speedups.items():
+        threads = sorted(by_threads)
+        mean = [sum(by_threads[t]) / len(by_threads[t]) for t in threads]
+        ax.plot(threads, mean, marker='o', label=lib.replace('_', ' ').title(), color=COLORS[lib])
+    ideal = [t / thread_counts[0] for t in thread_counts]
+    ax.plot(thread_counts, ideal, color='gray', linestyle='--', alpha=0.5, label='Linear')
+
+    interpreter = results[0].interpreter
+    gil = 'GIL enabled' if interpreter.gil_enabled else 'GIL disabled'
+    ax.set_xscale('log', base=2)
+    ax.set_yscale('log', base=2)
+    ax.set_xlabel('Threads')
+    ax.set_ylabel('Speedup (mean over benchmarks)')
+    ax.set_title(f'Thread Scaling, Python {interpreter.version} ({gil})')
+    ax.grid(alpha=0.3, which='both')
+    ax.legend()
+
+    plt.tight_layout()
+    filepath = f'{output_dir}/thread_scaling.png'
+    plt.savefig(filepath, dpi=150)
+    plt.close(fig)
+    print(f'Chart saved: {filepath}')
@@ -1,10 +1,20 @@
+import pstats
 from collections import defaultdict
 
 from rich.console import Console
 from rich.table import Table
 
+from benchmarks.concurrency import ConcurrencyResult
+from benchmarks.ingest import IngestResult
+from benchmarks.monitoring import plan_warnings
+from benchmarks.openloop import OpenLoopResult
+from benchmarks.profiling import hot_functions, self_time_by_package
 from benchmarks.registry import OpType
+from benchmarks.replay import ReplayResult
 from benchmarks.runner import BenchmarkResult
+from benchmarks.scenarios import ScenarioResult
+from benchmarks.threads import ThreadScalingResult
+from config import PROFILE_DIR
 
 console = Console()
 
@@ -19,11 +29,54 @@ LABELS = {
     'read_100_categories': 'Read 100 Categories',
     'read_1000_categories': 'Read 1,000 Categories',
     'read_10000_categories': 'Read 10,000 Categories',
+    'read_latest_order': 'Read Latest Order',
     'insert_single': 'Insert 1',
+    'insert_single_order': 'Insert 1 Order',
     'insert_batch_100': 'Insert 100',
     'insert_batch_1000': 'Insert 1,000',
     'update_single': 'Update 1',
     'delete_single': 'Delete 1',
+    'read_order_1kb': 'Read Order (1 KB)',
+    'read_order_10kb': 'Read Order (10 KB)',
+    'read_order_100kb': 'Read Order (100 KB)',
+    'read_order_1mb': 'Read Order (1 MB)',
+    'agg_revenue_by_status': 'Agg: Revenue by Status',
+    'agg_top_skus': 'Agg: Top SKUs',
+    'agg_monthly_orders': 'Agg: Monthly Orders',
+    'agg_basket_by_payment': 'Agg: Basket by Payment',
+    'agg_dashboard_facet': 'Agg: Dashboard $facet',
+    'page_skip_1': 'Page 1 (skip)',
+    'page_skip_10': 'Page 10 (skip)',
+    'page_skip_100': 'Page 100 (skip)',
+    'page_skip_1000': 'Page 1,000 (skip)',
+    'page_keyset_1': 'Page 1 (keyset)',
+    'page_keyset_10': 'Page 10 (keyset)',
+    'page_keyset_100': 'Page 100 (keyset)',
+    'page_keyset_1000': 'Page 1,000 (keyset)',
+    'update_1000_loop': 'Update 1,000 (loop)',
+    'update_1000_bulk_ordered': 'Update 1,000 (bulk ordered)',
+    'update_1000_bulk_unordered': 'Update 1,000 (bulk unordered)',
+    'update_1000_many': 'Update 1,000 (update_many)',
+    'upsert_1000_bulk': 'Upsert 1,000 (bulk)',
+    'update_10000_loop': 'Update 10,000 (loop)',
+    'update_10000_bulk_ordered': 'Update 10,000 (bulk ordered)',
+    'update_10000_bulk_unordered': 'Update 10,000 (bulk unordered)',
+    'update_10000_many': 'Update 10,000 (update_many)',
+    'upsert_10000_bulk': 'Upsert 10,000 (bulk)',
+    'covered_category_name': 'Covered: Name (Category)',
+    'covered_order_email': 'Covered: Email (Order)',
+    'multi_get_10_loop': 'Get 10 Orders (per key)',
+    'multi_get_10_batched': 'Get 10 Orders (batched)',
+    'multi_get_100_loop': 'Get 100 Orders (per key)',
+    'multi_get_100_batched': 'Get 100 Orders (batched)',
+    'multi_get_1000_loop': 'Get 1,000 Orders (per key)',
+    'multi_get_1000_batched': 'Get 1,000 Orders (batched)',
+}
+
+# Covered benchmark -> the core projection benchmark that reads the same field through a fetch
+COVERED_PAIRS = {
+    'covered_category_name': 'read_single_field_category',
+    'covered_order_email': 'read_single_field_order',
 }
 
 
@@ -125,3 +178,835 @@ def _print_overhead_table(grouped: dict[str, dict[str, BenchmarkResult]]):
         table.add_row(_label(name), dc_mult, beanie_mult, me_mult)
 
     console.print(table)
+
+
+def print_sweep_results(sweep: dict[int, list[BenchmarkResult]]):
+    if not sweep:
+        console.print('[yellow]No sweep results to display.')
+        return
+
+    sizes = sorted(sweep)
+    by_name: dict[str, dict[str, dict[int, BenchmarkResult]]] = defaultdict(lambda: defaultdict(dict))
+    for size, results in sweep.items():
+        for r in results:
+            by_name[r.benchmark.name][r.benchmark.library.value][size] = r
+
+    console.print('\n[bold underline]Median ms by Collection Size\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    for size in sizes:
+        table.add_column(f'{size:,}', justify='right')
+
+    for name in sorted(by_name.keys()):
+        first = True
+        for lib_name in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            lib_sizes = by_name[name].get(lib_name)
+            if not lib_sizes:
+                continue
+            cells = [f'{lib_sizes[s].median_ms:.2f}' if s in lib_sizes else '—' for s in sizes]
+            table.add_row(_label(name) if first else '', lib_name, *cells)
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+
+def print_scenario_results(results: list[ScenarioResult]):
+    if not results:
+        console.print('[yellow]No scenario results to display.')
+        return
+
+    scenario = results[0].scenario
+    mix = ', '.join(f'{name} {weight:g}' for name, weight in scenario.mix.items())
+    console.print(f'\n[bold underline]Scenario {scenario.name}[/] ({mix}; {scenario.key_distribution.value} keys)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Library', style='bold', min_width=12)
+    table.add_column('Operation', min_width=30)
+    table.add_column('Ops', justify='right')
+    table.add_column('Median ms', justify='right')
+    table.add_column('P95 ms', justify='right')
+    table.add_column('P99 ms', justify='right')
+    table.add_column('Mean ms', justify='right')
+    table.add_column('Ops/sec', justify='right')
+
+    fastest = max(r.ops_per_sec for r in results)
+    for r in results:
+        style = 'green' if r.ops_per_sec == fastest else ''
+        first = True
+        for name, s in r.ops.items():
+            table.add_row(
+                r.library.value if first else '',
+                _label(name),
+                f'{s.count:,}',
+                f'{s.median_ms:.2f}',
+                f'{s.p95_ms:.2f}',
+                f'{s.p99_ms:.2f}',
+                f'{s.mean_ms:.2f}',
+                f'{r.ops_per_sec:,.0f}' if first else '',
+                style=style,
+            )
+            first = False
+        if r.errors:
+            table.add_row('', f'[red]{r.errors:,} errors', '', '', '', '', '', '')
+        table.add_section()
+
+    console.print(table)
+
+
+def print_openloop_results(results: list[OpenLoopResult]):
+    if not results:
+        console.print('[yellow]No open-loop results to display.')
+        return
+
+    console.print(f'\n[bold underline]Open-Loop Ramp: {_label(results[0].benchmark.name)}\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Library', style='bold', min_width=12)
+    table.add_column('Target ops/s', justify='right')
+    table.add_column('Achieved ops/s', justify='right')
+    table.add_column('Median ms', justify='right')
+    table.add_column('P99 ms', justify='right')
+    table.add_column('Service P99 ms', justify='right')
+    table.add_column('Dropped', justify='right')
+    table.add_column('Errors', justify='right')
+
+    for r in results:
+        first = True
+        for step in r.steps:
+            style = 'red' if step.target_rate == r.knee_rate else ''
+            table.add_row(
+                r.benchmark.library.value if first else '',
+                f'{step.target_rate:,.0f}',
+                f'{step.achieved_rate:,.0f}',
+                f'{step.median_ms:.2f}',
+                f'{step.p99_ms:.2f}',
+                f'{step.service_p99_ms:.2f}',
+                f'{step.dropped:,}',
+                f'{step.errors:,}',
+                style=style,
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+    console.print('\n[bold underline]Saturation Knee\n')
+    knees = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    knees.add_column('Library', style='bold', min_width=12)
+    knees.add_column('Max sustained ops/s', justify='right')
+    knees.add_column('Knee at ops/s', justify='right')
+    for r in results:
+        sustained = [s.target_rate for s in r.steps if s.target_rate != r.knee_rate]
+        knees.add_row(
+            r.benchmark.library.value,
+            f'{max(sustained):,.0f}' if sustained else '—',
+            f'{r.knee_rate:,.0f}' if r.knee_rate else 'not reached',
+        )
+    console.print(knees)
+
+
+def print_plan_report(results: list[BenchmarkResult]):
+    explained = [r for r in results if r.plans]
+    if not explained:
+        console.print('[yellow]No query plans captured.')
+        return
+
+    by_name: dict[str, dict[str, BenchmarkResult]] = defaultdict(dict)
+    for r in explained:
+        by_name[r.benchmark.name][r.benchmark.library.value] = r
+
+    console.print('\n[bold underline]Query Plans\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Command')
+    table.add_column('Winning Plan')
+    table.add_column('Keys', justify='right')
+    table.add_column('Docs', justify='right')
+    table.add_column('Returned', justify='right')
+
+    for name in sorted(by_name.keys()):
+        lib_results = by_name[name]
+        differs = len({tuple(p.plan for p in r.plans) for r in lib_results.values()}) > 1
+        first = True
+        for lib_name in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            if lib_name not in lib_results:
+                continue
+            for i, p in enumerate(lib_results[lib_name].plans):
+                style = 'red' if p.collscan else 'yellow' if differs else ''
+                table.add_row(
+                    _label(name) if first else '',
+                    lib_name if i == 0 else '',
+                    f'{p.command} {p.collection}',
+                    p.plan,
+                    f'{p.keys_examined:,}',
+                    f'{p.docs_examined:,}',
+                    f'{p.n_returned:,}',
+                    style=style,
+                )
+                first = False
+        table.add_section()
+
+    console.print(table)
+
+    warnings = plan_warnings(explained)
+    if warnings:
+        console.print('\n[bold red]Plan warnings')
+        for w in warnings:
+            console.print(f'[red]  - {w}')
+    else:
+        console.print('\n[green]All libraries use matching, index-backed plans.')
+
+
+def print_covered_breakdown(results: list[BenchmarkResult]):
+    """Split each library's projection cost into the fetch, the server and driver, and client-side hydration."""
+    by_name: dict[str, dict[str, BenchmarkResult]] = defaultdict(dict)
+    for r in results:
+        by_name[r.benchmark.name][r.benchmark.library.value] = r
+
+    pairs = [(c, p) for c, p in COVERED_PAIRS.items() if c in by_name]
+    if not pairs:
+        return
+
+    console.print('\n[bold underline]Projection Cost Breakdown (median ms)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Fetched', justify='right')
+    table.add_column('Covered', justify='right')
+    table.add_column('Fetch cost', justify='right')
+    table.add_column('Server + driver', justify='right')
+    table.add_column('Client hydration', justify='right')
+
+    for covered_name, fetched_name in pairs:
+        raw_covered = by_name[covered_name].get('raw')
+        first = True
+        for lib_name in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            covered = by_name[covered_name].get(lib_name)
+            if not covered:
+                continue
+            fetched = by_name.get(fetched_name, {}).get(lib_name)
+            # Raw covered is the floor: one index lookup plus BSON decoding, nothing library-specific
+            baseline = raw_covered.median_ms if raw_covered else None
+            table.add_row(
+                _label(covered_name) if first else '',
+                lib_name,
+                f'{fetched.median_ms:.2f}' if fetched else '—',
+                f'{covered.median_ms:.2f}',
+                f'{fetched.median_ms - covered.median_ms:+.2f}' if fetched else '—',
+                f'{baseline:.2f}' if baseline is not None else '—',
+                f'{covered.median_ms - baseline:+.2f}' if baseline is not None else '—',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+
+def print_matrix_results(matrix: dict[str, list[BenchmarkResult]], title: str):
+    if not any(matrix.values()):
+        console.print('[yellow]No matrix results to display.')
+        return
+
+    cells = list(matrix)
+    by_name: dict[str, dict[str, dict[str, BenchmarkResult]]] = defaultdict(lambda: defaultdict(dict))
+    for cell, results in matrix.items():
+        for r in results:
+            by_name[r.benchmark.name][r.benchmark.library.value][cell] = r
+
+    console.print(f'\n[bold underline]{title}: median ms (calls/sec)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    for cell in cells:
+        table.add_column(cell, justify='right')
+
+    for name in sorted(by_name.keys()):
+        first = True
+        for lib_name in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            lib_cells = by_name[name].get(lib_name)
+            if not lib_cells:
+                continue
+            row = []
+            for cell in cells:
+                r = lib_cells.get(cell)
+                row.append(f'{r.median_ms:.2f} ({1000 / r.median_ms:,.0f})' if r and r.median_ms > 0 else '[red]failed')
+            table.add_row(_label(name) if first else '', lib_name, *row)
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+    # Library overhead within a cell, to set against the spread across cells in the table above
+    console.print(f'\n[bold underline]{title}: ODM overhead vs raw (median ms)\n')
+
+    overhead = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    overhead.add_column('Benchmark', style='bold', min_width=30)
+    overhead.add_column('Library', min_width=12)
+    for cell in cells:
+        overhead.add_column(cell, justify='right')
+
+    for name in sorted(by_name.keys()):
+        raw_cells = by_name[name].get('raw', {})
+        first = True
+        for lib_name in ['dataclasses_raw', 'beanie', 'mongoengine']:
+            lib_cells = by_name[name].get(lib_name)
+            if not lib_cells:
+                continue
+            row = []
+            for cell in cells:
+                r, raw_r = lib_cells.get(cell), raw_cells.get(cell)
+                row.append(f'{r.median_ms - raw_r.median_ms:+.2f}' if r and raw_r else '—')
+            overhead.add_row(_label(name) if first else '', lib_name, *row)
+            first = False
+        if not first:
+            overhead.add_section()
+
+    console.print(overhead)
+
+
+def print_compression_results(matrix: dict[str, list[BenchmarkResult]]):
+    if not any(matrix.values()):
+        console.print('[yellow]No compression results to display.')
+        return
+
+    cells = list(matrix)
+    by_name: dict[str, dict[str, dict[str, BenchmarkResult]]] = defaultdict(lambda: defaultdict(dict))
+    for cell, results in matrix.items():
+        for r in results:
+            by_name[r.benchmark.name][cell][r.benchmark.library.value] = r
+
+    libs = ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']
+    console.print('\n[bold underline]Wire Compression: wire KB per call and median / client CPU ms, per library\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Compression')
+    table.add_column('Library', min_width=12)
+    table.add_column('Sent KB', justify='right')
+    table.add_column('Recv KB', justify='right')
+    table.add_column('Ratio', justify='right')
+    table.add_column('Median ms', justify='right')
+    table.add_column('CPU ms', justify='right')
+
+    for name in sorted(by_name.keys()):
+        first = True
+        for cell in cells:
+            lib_results = by_name[name].get(cell, {})
+            # Each library's own traffic: ODMs can send different commands, projections and batch sizes than raw
+            first_in_cell = True
+            for lib in libs:
+                r = lib_results.get(lib)
+                if not r:
+                    continue
+                wire = r.wire
+                if wire:
+                    total = wire.bytes_sent + wire.bytes_received
+                    on_wire = wire.wire_bytes_sent + wire.wire_bytes_received
+                    wire_cells = [
+                        f'{wire.wire_bytes_sent / 1024:,.1f}',
+                        f'{wire.wire_bytes_received / 1024:,.1f}',
+                        f'{total / on_wire:.2f}x' if on_wire else '—',
+                    ]
+                else:
+                    wire_cells = ['—', '—', '—']
+                table.add_row(
+                    _label(name) if first else '',
+                    cell if first_in_cell else '',
+                    lib,
+                    *wire_cells,
+                    f'{r.median_ms:.2f}',
+                    f'{r.cpu_median_ms:.2f}',
+                )
+                first = first_in_cell = False
+        table.add_section()
+
+    console.print(table)
+
+
+def print_ingest_results(results: list[IngestResult]):
+    if not results:
+        console.print('[yellow]No ingest results to display.')
+        return
+
+    console.print('\n[bold underline]Single-Event Ingest: direct insert_one vs write-behind batching\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Library', style='bold', min_width=12)
+    table.add_column('Mode', min_width=12)
+    table.add_column('Events', justify='right')
+    table.add_column('Events/sec', justify='right')
+    table.add_column('Median ms', justify='right')
+    table.add_column('P99 ms', justify='right')
+    table.add_column('Avg batch', justify='right')
+    table.add_column('Errors', justify='right')
+
+    by_lib = defaultdict(dict)
+    for r in results:
+        by_lib[r.library][r.mode] = r
+    for lib, modes in by_lib.items():
+        fastest = max(r.events_per_sec for r in modes.values())
+        first = True
+        for r in modes.values():
+            table.add_row(
+                lib.value if first else '',
+                r.mode,
+                f'{r.events:,}',
+                f'{r.events_per_sec:,.0f}',
+                f'{r.median_ms:.2f}',
+                f'{r.p99_ms:.2f}',
+                f'{r.mean_batch:,.1f}' if r.mean_batch else '—',
+                f'{r.errors:,}',
+                style='green' if r.events_per_sec == fastest else '',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+
+def print_concurrency_results(results: list[ConcurrencyResult]):
+    if not results:
+        console.print('[yellow]No concurrency results to display.')
+        return
+
+    console.print(f'\n[bold underline]Beanie Concurrency Sweep[/] (max pool size {results[0].max_pool_size})\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Tasks', justify='right')
+    table.add_column('Ops/sec', justify='right')
+    table.add_column('Median ms', justify='right')
+    table.add_column('P99 ms', justify='right')
+    table.add_column('Lag P50 ms', justify='right')
+    table.add_column('Lag P99 ms', justify='right')
+    table.add_column('Lag max ms', justify='right')
+    table.add_column('Conns open', justify='right')
+    table.add_column('Conns in use', justify='right')
+
+    for r in results:
+        best = max(level.ops_per_sec for level in r.levels)
+        first = True
+        for level in r.levels:
+            table.add_row(
+                _label(r.benchmark.name) if first else '',
+                f'{level.concurrency:,}',
+                f'{level.ops_per_sec:,.0f}',
+                f'{level.median_ms:.2f}',
+                f'{level.p99_ms:.2f}',
+                f'{level.lag_median_ms:.2f}',
+                f'{level.lag_p99_ms:.2f}',
+                f'{level.lag_max_ms:.2f}',
+                f'{level.peak_open:,}',
+                f'{level.peak_checked_out:,}',
+                style='green' if level.ops_per_sec == best else '',
+            )
+            if level.errors:
+                table.add_row('', '', f'[red]{level.errors:,} errors', '', '', '', '', '', '', '')
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+
+def print_thread_scaling_results(results: list[ThreadScalingResult]):
+    if not results:
+        console.print('[yellow]No thread-scaling results to display.')
+        return
+
+    interpreter = results[0].interpreter
+    build = 'free-threaded build' if interpreter.free_threaded_build else 'default build'
+    gil = 'enabled' if interpreter.gil_enabled else 'disabled'
+    console.print(f'\n[bold underline]Thread Scaling[/] (Python {interpreter.version}, {build}, GIL {gil})\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Threads', justify='right')
+    table.add_column('Ops/sec', justify='right')
+    table.add_column('Per thread', justify='right')
+    table.add_column('Median ms', justify='right')
+    table.add_column('P99 ms', justify='right')
+    table.add_column('Efficiency', justify='right')
+
+    by_name = defaultdict(list)
+    for r in results:
+        by_name[r.benchmark.name].append(r)
+    for name, lib_results in by_name.items():
+        first = True
+        for r in lib_results:
+            lib_first = True
+            for level in r.levels:
+                table.add_row(
+                    _label(name) if first else '',
+                    r.benchmark.library.value if lib_first else '',
+                    f'{level.threads}',
+                    f'{level.ops_per_sec:,.0f}',
+                    f'{level.per_thread_ops_per_sec:,.0f}',
+                    f'{level.median_ms:.2f}',
+                    f'{level.p99_ms:.2f}',
+                    f'{level.efficiency:.0%}',
+                    style='red' if level.efficiency < 0.5 else '',
+                )
+                first = lib_first = False
+        table.add_section()
+
+    console.print(table)
+
+    console.print('\n[bold underline]Mean Scaling Efficiency by Library\n')
+    summary = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    summary.add_column('Library', style='bold', min_width=12)
+    thread_counts = sorted({level.threads for r in results for level in r.levels})
+    for threads in thread_counts:
+        summary.add_column(f'{threads} thread{"s" if threads != 1 else ""}', justify='right')
+    by_lib = defaultdict(lambda: defaultdict(list))
+    for r in results:
+        for level in r.levels:
+            by_lib[r.benchmark.library.value][level.threads].append(level.efficiency)
+    for lib, by_threads in by_lib.items():
+        summary.add_row(lib, *(f'{sum(v) / len(v):.0%}' if (v := by_threads[t]) else '—' for t in thread_counts))
+    console.print(summary)
+
+
+def print_distributed_results(results: list[BenchmarkResult], workers: int):
+    if not results:
+        console.print('[yellow]No distributed results to display.')
+        return
+
+    console.print(f'\n[bold underline]Multi-Process Run[/] ({workers} workers, latencies merged across all of them)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Ops', justify='right')
+    table.add_column('Ops/sec', justify='right')
+    table.add_column('Median ms', justify='right')
+    table.add_column('P95 ms', justify='right')
+    table.add_column('Max ms', justify='right')
+
+    by_name = defaultdict(list)
+    for r in results:
+        by_name[r.benchmark.name].append(r)
+    for name, lib_results in by_name.items():
+        fastest = max(r.ops_per_sec for r in lib_results)
+        first = True
+        for r in lib_results:
+            table.add_row(
+                _label(name) if first else '',
+                r.benchmark.library.value,
+                f'{len(r.timings):,}',
+                f'{r.ops_per_sec:,.0f}',
+                f'{r.median_ms:.2f}',
+                f'{r.p95_ms:.2f}',
+                f'{r.max_ms:.2f}',
+                style='green' if r.ops_per_sec == fastest else '',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+
+def print_profile_summary(results: list[BenchmarkResult]):
+    by_lib = defaultdict(list)
+    for r in results:
+        if r.profile:
+            by_lib[r.benchmark.library.value].append(r.profile)
+    if not by_lib:
+        return
+
+    console.print('\n[bold underline]Profile: Top 10 Functions by Cumulative Time[/] (all profiled benchmarks)\n')
+    for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+        if lib not in by_lib:
+            continue
+        stats = pstats.Stats(*(p.pstats_path for p in by_lib[lib]))
+        total_ms = stats.total_tt * 1000
+
+        table = Table(title=f'{lib} ({total_ms:,.0f} ms profiled)', show_header=True, header_style='bold magenta')
+        table.add_column('Function', style='bold', min_width=40)
+        table.add_column('Package', min_width=10)
+        table.add_column('Calls', justify='right')
+        table.add_column('Self ms', justify='right')
+        table.add_column('Cum ms', justify='right')
+        table.add_column('Cum %', justify='right')
+        for f in hot_functions(stats):
+            table.add_row(
+                f.name,
+                f.package,
+                f'{f.calls:,}',
+                f'{f.self_ms:,.1f}',
+                f'{f.cumulative_ms:,.1f}',
+                f'{f.cumulative_ms / total_ms:.0%}' if total_ms else '—',
+            )
+        console.print(table)
+
+        shares = self_time_by_package(stats)
+        breakdown = ', '.join(f'{pkg} {ms / total_ms:.0%}' for pkg, ms in list(shares.items())[:8] if total_ms)
+        console.print(f'  Self time by package: {breakdown}\n')
+
+    console.print(
+        "cProfile counts calls on Motor's executor threads under whatever the benchmark thread was running; "
+        'the .folded stacks keep them apart, rooted at thread:<name>.'
+    )
+    console.print(f'pstats and collapsed-stack (.folded) files are in {PROFILE_DIR}/<library>/')
+
+
+def print_gc_report(results: list[BenchmarkResult]):
+    recorded = [(r, r.gc) for r in results if r.gc]
+    if not recorded:
+        return
+
+    console.print(f'\n[bold underline]Garbage Collection[/] (gc mode: {recorded[0][1].mode.value})\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Median ms', justify='right')
+    table.add_column('Gen0/call', justify='right')
+    table.add_column('Gen1/call', justify='right')
+    table.add_column('Gen2/call', justify='right')
+    table.add_column('GC ms/call', justify='right')
+    table.add_column('GC % of time', justify='right')
+
+    by_name = defaultdict(dict)
+    for r, gc_stats in recorded:
+        by_name[r.benchmark.name][r.benchmark.library.value] = (r, gc_stats)
+    for name in sorted(by_name):
+        first = True
+        for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            if lib not in by_name[name]:
+                continue
+            r, gc_stats = by_name[name][lib]
+            calls = len(r.timings)
+            share = gc_stats.pause_seconds / sum(r.timings) if sum(r.timings) > 0 else 0.0
+            table.add_row(
+                _label(name) if first else '',
+                lib,
+                f'{r.median_ms:.2f}',
+                *(f'{count / calls:.1f}' for count in gc_stats.collections),
+                f'{gc_stats.pause_seconds * 1000 / calls:.2f}',
+                f'{share:.0%}',
+                style='yellow' if share >= 0.1 else '',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+
+
+def print_server_report(results: list[BenchmarkResult]):
+    results = [r for r in results if r.server]
+    if not results:
+        return
+
+    console.print('\n[bold underline]Server-Side Work per Call[/] (serverStatus and $collStats deltas)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Requests', justify='right')
+    table.add_column('Queries', justify='right')
+    table.add_column('GetMores', justify='right')
+    table.add_column('Commands', justify='right')
+    table.add_column('Writes', justify='right')
+    table.add_column('KB to server', justify='right')
+    table.add_column('KB from server', justify='right')
+    table.add_column('Cache KB read', justify='right')
+    table.add_column('Server µs/op', justify='right')
+
+    by_name = defaultdict(dict)
+    for r in results:
+        by_name[r.benchmark.name][r.benchmark.library.value] = r
+    for name in sorted(by_name):
+        raw = by_name[name].get('raw')
+        first = True
+        for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            r = by_name[name].get(lib)
+            if not r:
+                continue
+            s = r.server
+            ops = s.read_ops + s.write_ops
+            writes = s.opcounters['insert'] + s.opcounters['update'] + s.opcounters['delete']
+            # More round trips or bytes than raw PyMongo for the same logical operation
+            extra = (
+                raw and lib != 'raw' and (s.requests > raw.server.requests or s.bytes_out > raw.server.bytes_out * 1.1)
+            )
+            table.add_row(
+                _label(name) if first else '',
+                lib,
+                f'{s.per_call(s.requests):.1f}',
+                f'{s.per_call(s.opcounters["query"]):.1f}',
+                f'{s.per_call(s.opcounters["getmore"]):.1f}',
+                f'{s.per_call(s.opcounters["command"]):.1f}',
+                f'{s.per_call(writes):.1f}',
+                f'{s.per_call(s.bytes_in) / 1024:,.1f}',
+                f'{s.per_call(s.bytes_out) / 1024:,.1f}',
+                f'{s.per_call(s.cache_bytes_read) / 1024:,.1f}',
+                f'{(s.read_latency_us + s.write_latency_us) / ops:,.0f}' if ops else '—',
+                style='yellow' if extra else '',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+    console.print('Yellow rows send more requests, or receive over 10% more bytes, than raw PyMongo for the same call.')
+
+
+def print_wire_report(results: list[BenchmarkResult]):
+    results = [r for r in results if r.wire]
+    if not results:
+        return
+
+    console.print('\n[bold underline]Wire Traffic and Throughput per Call[/] (client-side command monitoring)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Round trips', justify='right')
+    table.add_column('GetMores', justify='right')
+    table.add_column('Docs', justify='right')
+    table.add_column('KB sent', justify='right')
+    table.add_column('KB received', justify='right')
+    table.add_column('Median (ms)', justify='right')
+    table.add_column('Docs/s', justify='right')
+    table.add_column('MB/s', justify='right')
+
+    by_name = defaultdict(dict)
+    for r in results:
+        by_name[r.benchmark.name][r.benchmark.library.value] = r
+    for name in sorted(by_name):
+        raw = by_name[name].get('raw')
+        first = True
+        for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            r = by_name[name].get(lib)
+            if not r:
+                continue
+            w = r.wire
+            seconds = r.median_ms / 1000
+            # Same call, more trips to the server than raw PyMongo: smaller batches or extra commands
+            extra = raw and lib != 'raw' and w.round_trips > raw.wire.round_trips
+            table.add_row(
+                _label(name) if first else '',
+                lib,
+                f'{w.round_trips:,}',
+                f'{w.getmores:,}',
+                f'{w.documents:,}',
+                f'{w.bytes_sent / 1024:,.1f}',
+                f'{w.bytes_received / 1024:,.1f}',
+                f'{r.median_ms:.2f}',
+                f'{w.documents / seconds:,.0f}' if seconds else '—',
+                f'{(w.bytes_sent + w.bytes_received) / 1e6 / seconds:,.1f}' if seconds else '—',
+                style='yellow' if extra else '',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+    console.print(
+        'Counts are for one untimed call; docs/s and MB/s divide them by the median latency. '
+        'Yellow rows make more round trips than raw PyMongo.'
+    )
+
+
+def print_replay_results(results: list[ReplayResult]):
+    if not results:
+        console.print('[yellow]No replay results to display.')
+        return
+
+    console.print('\n[bold underline]Client-Only Replay[/] (bson.decode_all + hydration over captured payloads)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Docs', justify='right')
+    table.add_column('Payload KB', justify='right')
+    table.add_column('Median µs', justify='right')
+    table.add_column('P95 µs', justify='right')
+    table.add_column('CV', justify='right')
+    table.add_column('µs/doc', justify='right')
+    table.add_column('vs Raw', justify='right')
+
+    by_name = defaultdict(dict)
+    for r in results:
+        by_name[r.benchmark][r.library.value] = r
+    for name, lib_results in by_name.items():
+        raw = lib_results.get('raw')
+        first = True
+        for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            r = lib_results.get(lib)
+            if not r:
+                continue
+            table.add_row(
+                _label(name) if first else '',
+                lib,
+                f'{r.documents:,}',
+                f'{r.payload_bytes / 1024:,.1f}',
+                f'{r.median_us:,.1f}',
+                f'{r.p95_us:,.1f}',
+                f'{r.stdev_us / r.median_us:.1%}' if r.median_us else '—',
+                f'{r.per_doc_us:,.2f}',
+                f'{r.median_us / raw.median_us:.1f}x' if raw and raw.median_us else '—',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+    console.print('Raw is bson.decode_all alone, so vs Raw is what hydration into each library costs on top of it.')
+
+
+def print_cache_comparison(warm: list[BenchmarkResult], cold: list[BenchmarkResult]):
+    cold_by_key = {(r.benchmark.name, r.benchmark.library.value): r for r in cold}
+    pairs = defaultdict(dict)
+    for r in warm:
+        key = (r.benchmark.name, r.benchmark.library.value)
+        if key in cold_by_key:
+            pairs[r.benchmark.name][key[1]] = (r, cold_by_key[key])
+    if not pairs:
+        console.print('[yellow]No cache comparison to display.')
+        return
+
+    console.print('\n[bold underline]Warm vs Cold Cache[/] (median and P95 ms)\n')
+
+    table = Table(show_header=True, header_style='bold magenta', padding=(0, 1))
+    table.add_column('Benchmark', style='bold', min_width=30)
+    table.add_column('Library', min_width=12)
+    table.add_column('Warm', justify='right')
+    table.add_column('Cold', justify='right')
+    table.add_column('Miss cost', justify='right')
+    table.add_column('Cold/Warm', justify='right')
+    table.add_column('Warm P95', justify='right')
+    table.add_column('Cold P95', justify='right')
+
+    for name in sorted(pairs):
+        raw = pairs[name].get('raw')
+        raw_miss = raw[1].median_ms - raw[0].median_ms if raw else None
+        first = True
+        for lib in ['raw', 'dataclasses_raw', 'beanie', 'mongoengine']:
+            if lib not in pairs[name]:
+                continue
+            w, c = pairs[name][lib]
+            miss = c.median_ms - w.median_ms
+            # The miss is paid on the server, so a library whose miss costs well over raw's is doing extra reads
+            extra = raw_miss is not None and lib != 'raw' and raw_miss > 0 and miss > raw_miss * 1.5
+            table.add_row(
+                _label(name) if first else '',
+                lib,
+                f'{w.median_ms:.2f}',
+                f'{c.median_ms:.2f}',
+                f'{miss:+.2f}',
+                f'{c.median_ms / w.median_ms:.1f}x' if w.median_ms else '—',
+                f'{w.p95_ms:.2f}',
+                f'{c.p95_ms:.2f}',
+                style='yellow' if extra else '',
+            )
+            first = False
+        table.add_section()
+
+    console.print(table)
+    console.print("Miss cost is cold minus warm median. Yellow rows pay over 1.5x raw PyMongo's miss cost.")
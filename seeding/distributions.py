@@ -0,0 +1,75 @@
+import random
+from enum import Enum
+
+from config import HOTSPOT_FRACTION, HOTSPOT_OP_FRACTION, ZIPF_THETA
+
+
+class Distribution(str, Enum):
+    UNIFORM = 'uniform'
+    ZIPF = 'zipf'
+    HOTSPOT = 'hotspot'
+    LATEST = 'latest'
+
+
+class UniformSampler:
+    def __init__(self, n: int, rng=random):
+        self.n = n
+        self.rng = rng
+
+    def sample(self) -> int:
+        return self.rng.randrange(self.n)
+
+
+class ZipfianSampler:
+    """YCSB-style Zipfian sampler over [0, n): index 0 is the most popular item."""
+
+    def __init__(self, n: int, theta: float = ZIPF_THETA, rng=random):
+        self.n = n
+        self.theta = theta
+        self.rng = rng
+        self.alpha = 1.0 / (1.0 - theta)
+        self.zetan = _zeta(n, theta)
+        self.eta = (1 - (2.0 / n) ** (1 - theta)) / (1 - _zeta(2, theta) / self.zetan) if n > 2 else 1.0
+
+    def sample(self) -> int:
+        u = self.rng.random()
+        uz = u * self.zetan
+        if uz < 1.0:
+            return 0
+        if uz < 1.0 + 0.5**self.theta:
+            return min(1, self.n - 1)
+        return min(int(self.n * (self.eta * u - self.eta + 1) ** self.alpha), self.n - 1)
+
+
+class HotspotSampler:
+    """A fixed hot set (the first `hot_fraction` of items) receives `hot_op_fraction` of the picks."""
+
+    def __init__(
+        self,
+        n: int,
+        hot_fraction: float = HOTSPOT_FRACTION,
+        hot_op_fraction: float = HOTSPOT_OP_FRACTION,
+        rng=random,
+    ):
+        self.n = n
+        self.hot_n = max(1, int(n * hot_fraction))
+        self.hot_op_fraction = hot_op_fraction
+        self.rng = rng
+
+    def sample(self) -> int:
+        if self.hot_n >= self.n or self.rng.random() < self.hot_op_fraction:
+            return self.rng.randrange(self.hot_n)
+        return self.hot_n + self.rng.randrange(self.n - self.hot_n)
+
+
+def make_sampler(distribution: Distribution, n: int, rng=random):
+    # LATEST is a Zipfian pick over items ordered newest first; the caller owns that ordering.
+    if distribution in (Distribution.ZIPF, Distribution.LATEST):
+        return ZipfianSampler(n, rng=rng)
+    if distribution == Distribution.HOTSPOT:
+        return HotspotSampler(n, rng=rng)
+    return UniformSampler(n, rng=rng)
+
+
+def _zeta(n: int, theta: float) -> float:
+    return sum(1.0 / (i**theta) for i in range(1, n + 1))
@@ -3,6 +3,9 @@ from datetime import datetime, timedelta
 
 from faker import Faker
 
+from config import CUSTOMER_POOL_SIZE
+from seeding.distributions import Distribution, make_sampler
+
 PAYMENT_METHODS = ['credit_card', 'debit_card', 'paypal', 'apple_pay', 'google_pay']
 ORDER_STATUSES = [
     'pending',
@@ -15,11 +18,23 @@ ORDER_STATUSES = [
 
 
 class DataGenerator:
-    def __init__(self, seed: int = 42):
+    def __init__(
+        self,
+        seed: int = 42,
+        distribution: Distribution = Distribution.UNIFORM,
+        line_item_counts: tuple[int, int] = (2, 5),
+        history_counts: tuple[int, int] | None = None,
+    ):
         self.fake = Faker()
         Faker.seed(seed)
         random.seed(seed)
+        self.seed = seed
+        self.distribution = distribution
+        # (min, max) per order; history_counts=None follows the status progression (at most 6 entries)
+        self.line_item_counts = line_item_counts
+        self.history_counts = history_counts
         self._build_pools()
+        self._build_samplers()
 
     def _build_pools(self):
         self.streets = [self.fake.street_address() for _ in range(2_000)]
@@ -45,6 +60,30 @@ class DataGenerator:
         self._ts_start = int(datetime(2023, 1, 1).timestamp())
         self._ts_end = int(datetime(2025, 6, 1).timestamp())
 
+    def _build_samplers(self):
+        # Uniform keeps the original per-field random.choice() calls so existing seeds stay identical
+        if self.distribution == Distribution.UNIFORM:
+            return
+        self.customer_emails = [self._random_email() for _ in range(CUSTOMER_POOL_SIZE)]
+        self._customer_sampler = make_sampler(self.distribution, len(self.customer_emails))
+        self._status_sampler = make_sampler(self.distribution, len(ORDER_STATUSES))
+        self._sku_sampler = make_sampler(self.distribution, 90_000)
+
+    def _customer_email(self) -> str:
+        if self.distribution == Distribution.UNIFORM:
+            return self._random_email()
+        return self.customer_emails[self._customer_sampler.sample()]
+
+    def _status(self) -> str:
+        if self.distribution == Distribution.UNIFORM:
+            return random.choice(ORDER_STATUSES)
+        return ORDER_STATUSES[self._status_sampler.sample()]
+
+    def _sku(self) -> str:
+        if self.distribution == Distribution.UNIFORM:
+            return f'SKU-{random.randint(10000, 99999)}'
+        return f'SKU-{10000 + self._sku_sampler.sample()}'
+
     def _random_email(self) -> str:
         first = random.choice(self.first_names).lower()
         last = random.choice(self.last_names).lower()
@@ -69,7 +108,7 @@ class DataGenerator:
         for _ in range(count):
             items.append(
                 {
-                    'sku': f'SKU-{random.randint(10000, 99999)}',
+                    'sku': self._sku(),
                     'name': random.choice(self.product_names),
                     'quantity': random.randint(1, 10),
                     'unit_price_cents': random.randint(299, 49999),
@@ -77,8 +116,12 @@ class DataGenerator:
             )
         return items
 
-    def _random_status_history(self, final_status: str, created_at: datetime) -> list[dict]:
-        status_order = ORDER_STATUSES[: ORDER_STATUSES.index(final_status) + 1]
+    def _random_status_history(self, final_status: str, created_at: datetime, count: int | None = None) -> list[dict]:
+        if count is None:
+            status_order = ORDER_STATUSES[: ORDER_STATUSES.index(final_status) + 1]
+        else:
+            # Long histories cycle through the statuses (re-opened, re-shipped, ...) and end on the final one
+            status_order = [ORDER_STATUSES[i % len(ORDER_STATUSES)] for i in range(count - 1)] + [final_status]
         history = []
         t = created_at
         for s in status_order:
@@ -95,15 +138,25 @@ class DataGenerator:
             'is_active': random.random() < 0.8,
         }
 
-    def make_one_order(self, index: int) -> dict:
-        status = random.choice(ORDER_STATUSES)
+    def make_one_order(
+        self,
+        index: int,
+        line_item_count: int | None = None,
+        history_count: int | None = None,
+        prefix: str = 'ORD',
+    ) -> dict:
+        status = self._status()
         created_at = self._random_datetime()
-        line_items = self._random_line_items(random.randint(2, 5))
+        if line_item_count is None:
+            line_item_count = random.randint(*self.line_item_counts)
+        if history_count is None and self.history_counts:
+            history_count = random.randint(*self.history_counts)
+        line_items = self._random_line_items(line_item_count)
         total = sum(li['unit_price_cents'] * li['quantity'] for li in line_items)
 
         return {
-            'order_number': f'ORD-{index:08d}',
-            'customer_email': self._random_email(),
+            'order_number': f'{prefix}-{index:08d}',
+            'customer_email': self._customer_email(),
             'status': status,
             'total_cents': total,
             'item_count': len(line_items),
@@ -116,25 +169,19 @@ class DataGenerator:
                 'charged_cents': total,
             },
             'line_items': line_items,
-            'status_history': self._random_status_history(status, created_at),
+            'status_history': self._random_status_history(status, created_at, history_count),
         }
 
-    def generate_categories_batched(self, count: int, batch_size: int):
-        batch = []
-        for i in range(count):
-            batch.append(self.make_one_category(i))
-            if len(batch) >= batch_size:
-                yield batch
-                batch = []
-        if batch:
-            yield batch
-
-    def generate_orders_batched(self, count: int, batch_size: int):
-        batch = []
-        for i in range(count):
-            batch.append(self.make_one_order(i))
-            if len(batch) >= batch_size:
-                yield batch
-                batch = []
-        if batch:
-            yield batch
+    def generate_categories_batched(self, count: int, batch_size: int, start: int = 0):
+        yield from self._generate_batched(self.make_one_category, count, batch_size, start)
+
+    def generate_orders_batched(self, count: int, batch_size: int, start: int = 0):
+        yield from self._generate_batched(self.make_one_order, count, batch_size, start)
+
+    def _generate_batched(self, make_one, count: int, batch_size: int, start: int):
+        # Each batch reseeds from its first index, so document i is identical no matter
+        # where a run starts. That is what makes resumed and topped-up seeds deterministic.
+        for batch_start in range(start - start % batch_size, count, batch_size):
+            random.seed(f'{self.seed}:{batch_start}')
+            batch = [make_one(i) for i in range(batch_start, min(batch_start + batch_size, count))]
+            yield batch[max(start - batch_start, 0) :]
@@ -1,4 +1,5 @@
-from pymongo import DESCENDING, MongoClient
+import bson
+from pymongo import ASCENDING, DESCENDING, MongoClient
 from rich.progress import (
     BarColumn,
     Progress,
@@ -7,13 +8,50 @@ from rich.progress import (
     TextColumn,
 )
 
-from config import BATCH_SIZE, DB_NAME, SEED_COUNT
+from config import BATCH_SIZE, DB_NAME, LARGE_ORDER_SIZES, LARGE_ORDERS_PER_SIZE, SEED_COUNT
+from seeding.distributions import Distribution
 from seeding.generator import DataGenerator
 
+SEED = 42
+STATE_COLLECTION = '_seed_state'
 
-def seed_database(client: MongoClient, force: bool = False):
-    db = client[DB_NAME]
-    gen = DataGenerator(seed=42)
+INDEXES = {
+    'categories': [
+        ([('name', ASCENDING)], {'unique': True}),
+        ([('slug', ASCENDING)], {'unique': True}),
+        ([('view_count', DESCENDING)], {}),
+        ([('view_count', DESCENDING), ('_id', DESCENDING)], {}),
+        ([('slug', ASCENDING), ('name', ASCENDING)], {}),
+    ],
+    'orders': [
+        ([('order_number', ASCENDING)], {'unique': True}),
+        ([('customer_email', ASCENDING)], {}),
+        ([('status', ASCENDING)], {}),
+        ([('total_cents', DESCENDING)], {}),
+        ([('created_at', DESCENDING)], {}),
+        ([('order_number', ASCENDING), ('customer_email', ASCENDING)], {}),
+    ],
+    'orders_large': [
+        ([('order_number', ASCENDING)], {'unique': True}),
+    ],
+}
+
+
+def seed_database(
+    client: MongoClient,
+    force: bool = False,
+    distribution: Distribution = Distribution.UNIFORM,
+    count: int = SEED_COUNT,
+    db_name: str = DB_NAME,
+    indexes: bool = True,
+):
+    """Seed categories and orders, then create missing indexes.
+
+    `indexes=False` is for the in-memory backend: mongomock answers queries by scanning whatever the indexes, and
+    enforces unique ones by scanning the whole collection on every insert, which makes the write suite crawl.
+    """
+    db = client[db_name]
+    gen = DataGenerator(seed=SEED, distribution=distribution)
 
     with Progress(
         SpinnerColumn(),
@@ -21,52 +59,155 @@ def seed_database(client: MongoClient, force: bool = False):
         BarColumn(),
         TaskProgressColumn(),
     ) as progress:
-        # Seed categories
-        cat_count = db.categories.estimated_document_count()
-        if not force and cat_count >= SEED_COUNT:
-            progress.console.print(f'[green]Categories already seeded ({cat_count:,} docs), skipping.')
-        else:
-            if force:
-                db.categories.drop()
-            task = progress.add_task('Seeding categories...', total=SEED_COUNT)
-            for batch in gen.generate_categories_batched(SEED_COUNT, BATCH_SIZE):
-                db.categories.insert_many(batch, ordered=False)
-                progress.advance(task, len(batch))
-
-        # Seed orders
-        ord_count = db.orders.estimated_document_count()
-        if not force and ord_count >= SEED_COUNT:
-            progress.console.print(f'[green]Orders already seeded ({ord_count:,} docs), skipping.')
-        else:
-            if force:
-                db.orders.drop()
-            task = progress.add_task('Seeding orders...', total=SEED_COUNT)
-            for batch in gen.generate_orders_batched(SEED_COUNT, BATCH_SIZE):
-                db.orders.insert_many(batch, ordered=False)
-                progress.advance(task, len(batch))
-
-    # Create indexes after bulk insert
-    _create_indexes(db)
-
-
-def reset_database(client: MongoClient):
-    client.drop_database(DB_NAME)
-    print(f"Database '{DB_NAME}' dropped.")
+        _seed_collection(db, 'categories', gen.generate_categories_batched, count, force, distribution, progress)
+        _seed_collection(db, 'orders', gen.generate_orders_batched, count, force, distribution, progress)
+
+    # Create any indexes that are missing (all of them after a fresh or forced seed)
+    if indexes:
+        _create_indexes(db)
+
+
+def seed_large_orders(client: MongoClient, force: bool = False, db_name: str = DB_NAME, indexes: bool = True):
+    """Seed LARGE_ORDERS_PER_SIZE orders at each LARGE_ORDER_SIZES size; `indexes` is as for seed_database."""
+    db = client[db_name]
+    expected = len(LARGE_ORDER_SIZES) * LARGE_ORDERS_PER_SIZE
+    if force:
+        db.orders_large.drop()
+    elif db.orders_large.estimated_document_count() == expected:
+        print(f'Large orders already seeded ({expected:,} docs), skipping.')
+        return
+    else:
+        db.orders_large.drop()
+
+    gen = DataGenerator(seed=SEED)
+    for label, target_bytes in LARGE_ORDER_SIZES.items():
+        line_items = _line_items_for_size(gen, target_bytes)
+        docs = [
+            gen.make_one_order(
+                i,
+                line_item_count=line_items,
+                history_count=max(1, line_items // 10),
+                prefix=large_order_prefix(label),
+            )
+            for i in range(LARGE_ORDERS_PER_SIZE)
+        ]
+        db.orders_large.insert_many(docs, ordered=False)
+        avg_bytes = sum(len(bson.encode(d)) for d in docs) // len(docs)
+        print(f'Seeded {len(docs)} large orders at ~{avg_bytes:,} bytes ({line_items:,} line items each).')
+
+    if indexes:
+        _create_indexes(db)
+
+
+def large_order_prefix(label: str) -> str:
+    return f'LRG-{label.upper()}'
+
+
+def _line_items_for_size(gen: DataGenerator, target_bytes: int) -> int:
+    # Orders grow linearly with line items (plus one history entry per ten items), so two probes calibrate it
+    small = len(bson.encode(gen.make_one_order(0, line_item_count=10, history_count=1)))
+    large = len(bson.encode(gen.make_one_order(0, line_item_count=110, history_count=11)))
+    per_item = (large - small) / 100
+    return max(1, round(10 + (target_bytes - small) / per_item))
+
+
+def ensure_indexes(client: MongoClient, db_name: str = DB_NAME):
+    _create_indexes(client[db_name])
+
+
+def reset_database(client: MongoClient, db_name: str = DB_NAME):
+    client.drop_database(db_name)
+    print(f"Database '{db_name}' dropped.")
+
+
+def _seed_collection(
+    db,
+    name: str,
+    generate_batched,
+    count: int,
+    force: bool,
+    distribution: Distribution,
+    progress: Progress,
+):
+    collection = db[name]
+    state_coll = db[STATE_COLLECTION]
+    dist_name = distribution.value
+
+    if force:
+        collection.drop()
+        state_coll.delete_one({'_id': name})
+
+    state = state_coll.find_one({'_id': name})
+    if state is None:
+        state = _adopt_or_reset(collection, count, dist_name, progress)
+        state_coll.replace_one({'_id': name}, state, upsert=True)
+
+    if state['distribution'] != dist_name:
+        progress.console.print(
+            f"[red]{name.title()} were seeded with the '{state['distribution']}' distribution; "
+            f"use --force to re-seed with '{dist_name}'. Skipping."
+        )
+        return
+
+    start = state['next_index']
+    if start >= count:
+        progress.console.print(f'[green]{name.title()} already seeded ({start:,} docs), skipping.')
+        return
+
+    # Remove whatever an interrupted run wrote past the last completed batch
+    partial = {'_id': {'$gt': state['last_id']}} if state['last_id'] else {}
+    removed = collection.delete_many(partial).deleted_count
+    if removed:
+        progress.console.print(f'[yellow]Removed {removed:,} {name} from an incomplete batch.')
+
+    verb = 'Resuming' if start else 'Seeding'
+    task = progress.add_task(f'{verb} {name} ({start:,} -> {count:,})...', total=count - start)
+    for batch in generate_batched(count, state['batch_size'], start=start):
+        collection.insert_many(batch, ordered=False)
+        start += len(batch)
+        state_coll.update_one(
+            {'_id': name},
+            {'$set': {'next_index': start, 'last_id': batch[-1]['_id']}},
+        )
+        progress.advance(task, len(batch))
+
+
+def _adopt_or_reset(collection, count: int, distribution: str, progress: Progress) -> dict:
+    state = {
+        'next_index': 0,
+        'last_id': None,
+        'distribution': distribution,
+        'batch_size': BATCH_SIZE,
+        'seed': SEED,
+    }
+    existing = collection.estimated_document_count()
+    if not existing:
+        return state
+
+    if existing >= min(count, SEED_COUNT):
+        # Seeded before checkpoints existed: keep it and continue numbering after it
+        last = collection.find_one({}, {'_id': 1}, sort=[('_id', DESCENDING)])
+        progress.console.print(f'[green]Adopting existing {collection.name} ({existing:,} docs).')
+        return {**state, 'next_index': existing, 'last_id': last['_id']}
+
+    # A partial seed with no checkpoint can't be resumed safely
+    progress.console.print(f'[yellow]{collection.name.title()} partially seeded without a checkpoint; re-seeding.')
+    collection.drop()
+    return state
 
 
 def _create_indexes(db):
-    print('Creating indexes...')
-
-    # Category indexes
-    db.categories.create_index('name', unique=True)
-    db.categories.create_index('slug', unique=True)
-    db.categories.create_index([('view_count', DESCENDING)])
-
-    # Order indexes
-    db.orders.create_index('order_number', unique=True)
-    db.orders.create_index('customer_email')
-    db.orders.create_index('status')
-    db.orders.create_index([('total_cents', DESCENDING)])
-    db.orders.create_index([('created_at', DESCENDING)])
+    missing = []
+    for name, specs in INDEXES.items():
+        existing = {tuple(info['key']) for info in db[name].index_information().values()}
+        missing.extend((name, keys, options) for keys, options in specs if tuple(keys) not in existing)
+
+    if not missing:
+        print('Indexes up to date.')
+        return
+
+    print(f'Creating {len(missing)} indexes...')
+    for name, keys, options in missing:
+        db[name].create_index(keys, **options)
 
     print('Indexes created.')
@@ -0,0 +1,35 @@
+import pstats
+import tempfile
+import time
+import unittest
+
+from benchmarks.profiling import BenchmarkProfiler, self_time_by_package
+
+
+def _spin(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(i * i for i in range(200))
+
+
+class ProfilerTest(unittest.TestCase):
+    def test_pure_cpu_profile_has_no_sampler_frames(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with BenchmarkProfiler('test', 'spin', output_dir=output_dir) as profiler:
+                for _ in range(20):
+                    _spin(0.004)
+            info = profiler.save(20)
+
+            self.assertGreater(info.samples, 0)
+            self.assertTrue(info.hot)
+            for f in info.hot:
+                self.assertNotIn('threading', f.name)
+                self.assertNotIn('acquire', f.name)
+            self.assertIn('_spin', info.hot[0].name)
+
+            shares = self_time_by_package(pstats.Stats(info.pstats_path), iterations=20)
+            self.assertLess(shares.get('stdlib', 0.0), 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()